@@ -1,27 +1,47 @@
 from dataclasses import fields
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from fastapi import APIRouter
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Body, Query
 
 from app.api.dao.advance_dao import ReappraisalServiceAdvanceDAO
+from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
 from app.api.db_connection.db_connection import DBSessionDependency
 from app.api.model.advance.advance_table import (
     ReappraisalServiceAdvanceIdPath,
     ReappraisalServiceAdvanceTable,
 )
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceIDPath,
+)
 from app.api.model.advance.advance_create import (
+    ReappraisalServiceAdvanceBatchDeleteRequest,
+    ReappraisalServiceAdvanceBatchUpdateRequest,
     ReappraisalServiceAdvanceCreateRequest,
     ReappraisalServiceAdvanceCreateResponse,
 )
 from app.api.model.advance.advance_get import (
     ReappraisalServiceAdvanceGetResponse,
 )
+from app.api.exceptions.reappraisal_service_exception import (
+    ReappraisalServiceNotFoundAPIException,
+)
 from app.api.exceptions.advance_exception import (
     RsAdvanceNotFoundAPIException,
     RsAdvanceDetailsNotFoundAPIException,
 )
+from app.api.services.batch.batch import (
+    MAX_BATCH_SIZE,
+    BatchResponse,
+    batch_response,
+    validate_batch,
+)
 from app.api.services.search_filter.basequery import BaseQueryParams
-from app.api.services.pagination.pagination import PaginationResponse
+from app.api.services.pagination.pagination import (
+    AfterQuery,
+    IncludeTotalQuery,
+    PaginationResponse,
+)
+from app.api.services.fast_json.fast_json import fast_list_response
 from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
 
 router = APIRouter()
@@ -43,6 +63,99 @@ async def create_rs_advance(
     return rs_advance
 
 
+@router.post(
+    "/v1/reappraisal_service/{reappraisal_service_id}/advances:batch",
+    response_model=BatchResponse[ReappraisalServiceAdvanceCreateResponse],
+    summary="Create Reappraisal Service Advances in Bulk",
+    description="Creates many advances of one reappraisal service in a single transaction. Each item is validated on its own; invalid items are reported and skipped.",
+    responses={201: {"description": "Reappraisal Service Advances Created"}},
+)
+async def create_rs_advances_batch(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    session: DBSessionDependency,
+    payload: List[Dict[str, Any]] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+):
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("write")
+    if not await reappraisal_serviceDao.get_reappraisal_service(reappraisal_service_id):
+        raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
+
+    valid, failures = validate_batch(
+        payload,
+        ReappraisalServiceAdvanceCreateRequest,
+        reappraisal_service_id=reappraisal_service_id,
+    )
+    rs_advanceDao = ReappraisalServiceAdvanceDAO(session)
+    created = await rs_advanceDao.create_rs_advances(
+        [ReappraisalServiceAdvanceTable.model_validate(item) for _, item in valid]
+    )
+    return batch_response(
+        len(payload),
+        {index: record for (index, _), record in zip(valid, created)},
+        failures,
+        ReappraisalServiceAdvanceCreateResponse,
+    )
+
+
+@router.patch(
+    "/v1/reappraisal_service/{reappraisal_service_id}/advances:batch",
+    response_model=BatchResponse[ReappraisalServiceAdvanceCreateResponse],
+    summary="Update Reappraisal Service Advances in Bulk",
+    description="Updates many advances of one reappraisal service in a single transaction. Items that fail validation or match no live advance of the service are reported and skipped.",
+    responses={200: {"description": "Reappraisal Service Advances Updated"}},
+)
+async def update_rs_advances_batch(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    session: DBSessionDependency,
+    payload: List[Dict[str, Any]] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+):
+    valid, failures = validate_batch(
+        payload,
+        ReappraisalServiceAdvanceBatchUpdateRequest,
+        reappraisal_service_id=reappraisal_service_id,
+    )
+    rs_advanceDao = ReappraisalServiceAdvanceDAO(session)
+    updated = await rs_advanceDao.update_rs_advances(
+        reappraisal_service_id,
+        {item.rs_advance_id: item for _, item in valid},
+    )
+    updated_by_id = {record.rs_advance_id: record for record in updated}
+    return batch_response(
+        len(payload),
+        {
+            index: updated_by_id[item.rs_advance_id]
+            for index, item in valid
+            if item.rs_advance_id in updated_by_id
+        },
+        failures,
+        ReappraisalServiceAdvanceCreateResponse,
+    )
+
+
+@router.post(
+    "/v1/reappraisal_service/{reappraisal_service_id}/advances:batchDelete",
+    summary="Delete Reappraisal Service Advances in Bulk",
+    description="Soft-deletes many advances of one reappraisal service with a single statement.",
+    responses={200: {"description": "Reappraisal Service Advances Deleted"}},
+)
+async def delete_rs_advances_batch(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    payload: ReappraisalServiceAdvanceBatchDeleteRequest,
+    session: DBSessionDependency,
+):
+    rs_advanceDao = ReappraisalServiceAdvanceDAO(session)
+    deleted_ids = await rs_advanceDao.delete_rs_advances(
+        reappraisal_service_id, payload.rs_advance_ids
+    )
+    return {
+        "deleted": deleted_ids,
+        "not_found": [
+            rs_advance_id
+            for rs_advance_id in payload.rs_advance_ids
+            if rs_advance_id not in deleted_ids
+        ],
+    }
+
+
 @router.get(
     "/v1/advances",
     response_model=Union[
@@ -63,8 +176,10 @@ async def get_rs_advances(
     rs_advance_settlement_statuses: List[Optional[str]] = Query(None),
     page: Optional[int] = None,
     size: Optional[int] = None,
+    after: AfterQuery = None,
+    include_total: IncludeTotalQuery = None,
 ):
-    rs_advanceDao = ReappraisalServiceAdvanceDAO(session)
+    rs_advanceDao = ReappraisalServiceAdvanceDAO(session).with_profile("list")
     query = BaseQueryParams(
         search_values=(
             rsa_transaction_epoch,
@@ -84,11 +199,13 @@ async def get_rs_advances(
         ),
         page=page,
         size=size,
+        after=after,
+        include_total=include_total,
     )
     rs_advance = await rs_advanceDao.get_rs_advances(query=query)
-    if not rs_advance:
+    if not (rs_advance.items if isinstance(rs_advance, PaginationResponse) else rs_advance):
         raise RsAdvanceDetailsNotFoundAPIException()
-    return rs_advance
+    return fast_list_response(rs_advance, ReappraisalServiceAdvanceGetResponse)
 
 
 @router.get(
@@ -102,7 +219,7 @@ async def get_rs_advance(
     rs_advance_id: ReappraisalServiceAdvanceIdPath,
     session: DBSessionDependency,
 ):
-    rs_advanceDao = ReappraisalServiceAdvanceDAO(session)
+    rs_advanceDao = ReappraisalServiceAdvanceDAO(session).with_profile("detail")
     rs_advance = await rs_advanceDao.get_rs_advance(rs_advance_id)
     if not rs_advance:
         raise RsAdvanceNotFoundAPIException(rs_advance_id)
@@ -121,7 +238,7 @@ async def update_rs_advance(
     payload: ReappraisalServiceAdvanceCreateRequest,
     session: DBSessionDependency,
 ):
-    rs_advanceDao = ReappraisalServiceAdvanceDAO(session)
+    rs_advanceDao = ReappraisalServiceAdvanceDAO(session).with_profile("detail")
     rs_advance = await rs_advanceDao.update_rs_advance(
         rs_advance_id=rs_advance_id, rs_advance_update=payload
     )
@@ -1,9 +1,9 @@
-from typing import List, Optional, Union
-from fastapi import APIRouter
+from typing import Annotated, List, Optional, Union
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
-from sqlalchemy import select
 
 from app.api.dao.appraiser_dao import AppraiserDAO
+from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
 from app.api.db_connection.db_connection import DBSessionDependency
 from app.api.exceptions.appraiser_exception import (
     AppraiserNotFoundAPIException,
@@ -12,7 +12,10 @@ from app.api.exceptions.appraiser_exception import (
     AppraiserNoActiveServicesAPIException,
     DuplicatePanException,
 )
-from app.api.model.appraiser.appraiser_table import AppraiserTable, AppraiserIdPath
+from app.api.exceptions.reappraisal_service_exception import (
+    ReappraisalServiceDateIncorrectAPIException,
+)
+from app.api.model.appraiser.appraiser_table import AppraiserIdPath
 from app.api.model.appraiser.appraiser_create import (
     AppraiserCreateRequest,
     AppraiserCreateResponse,
@@ -22,10 +25,15 @@ from app.api.model.appraiser.appraiser_create import (
     AppraiserUpdateResponse,
 )
 from app.api.model.appraiser.appraiser_create import AppraiserPatchRequest
-from app.api.model.appraiser.appraiser_get import AppraiserGetResponse
+from app.api.model.appraiser.appraiser_get import (
+    AppraiserAvailabilityResponse,
+    AppraiserBookingResponse,
+    AppraiserGetResponse,
+)
 
 from app.api.services.search_filter.basequery import BaseQueryParams
 from app.api.services.pagination.pagination import PaginationResponse
+from app.api.services.fast_json.fast_json import fast_list_response
 from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
 from app.api.model.reappraisal_service.reappraisal_service_get import ReappraisalServiceAPIResponse, ReappraisalServiceGetResponse
 
@@ -59,36 +67,70 @@ async def get_all_appraisers_direct(
 ):
     """Direct query to appraiser table - no joins, no complex relationships"""
     try:
-        from sqlalchemy.orm import noload
-        # Use noload to prevent SQLAlchemy from loading relationships
-        query = select(AppraiserTable).options(noload(AppraiserTable.services))
-        result = await session.exec(query)
-        appraisers = result.scalars().all()
+        # Plain column rows: no ORM objects, no relationship loading
+        appraisers = await AppraiserDAO(session).with_projection("list").get_appraisers(
+            include_deleted=True
+        )
 
         if not appraisers:
             return []
 
-        response_list = []
-        for appraiser in appraisers:
-            response_list.append(
-                AppraiserDirectResponse(
-                    appraiser_id=f"APR-{appraiser.appraiser_id:04d}",
-                    appraiser_full_name=appraiser.appraiser_full_name,
-                    appraiser_email=appraiser.appraiser_email,
-                    appraiser_phone=appraiser.appraiser_phone,
-                    appraiser_pan=appraiser.appraiser_pan,
-                    appraiser_address=appraiser.appraiser_address,
-                    appraiser_account_number=appraiser.appraiser_account_number,
-                    appraiser_account_ifsc_code=appraiser.appraiser_account_ifsc_code,
-                    appraiser_bank_name=appraiser.appraiser_bank_name,
-                    appraiser_branch_name=appraiser.appraiser_branch_name,
-                )
-            )
-        return response_list
+        return fast_list_response(
+            appraisers,
+            AppraiserDirectResponse,
+            lambda appraiser: dict(
+                appraiser_id=f"APR-{appraiser.appraiser_id:04d}",
+                appraiser_full_name=appraiser.appraiser_full_name,
+                appraiser_email=appraiser.appraiser_email,
+                appraiser_phone=appraiser.appraiser_phone,
+                appraiser_pan=appraiser.appraiser_pan,
+                appraiser_address=appraiser.appraiser_address,
+                appraiser_account_number=appraiser.appraiser_account_number,
+                appraiser_account_ifsc_code=appraiser.appraiser_account_ifsc_code,
+                appraiser_bank_name=appraiser.appraiser_bank_name,
+                appraiser_branch_name=appraiser.appraiser_branch_name,
+            ),
+        )
     except Exception as e:
         raise Exception(f"Error fetching appraisers: {str(e)}")
 
 
+@router.get(
+    "/v1/appraiser/{appraiser_id}/availability",
+    response_model=AppraiserAvailabilityResponse,
+    summary="Check Appraiser Availability",
+    description="Whether the appraiser is free between `from` and `to` (epochs, both inclusive), "
+    "with the active reappraisal services that overlap that window.",
+    responses={200: {"description": "Appraiser Availability Retrieved"}},
+)
+async def get_appraiser_availability(
+    appraiser_id: AppraiserIdPath,
+    session: DBSessionDependency,
+    from_epoch: Annotated[int, Query(alias="from", ge=0, description="Window start epoch")],
+    to_epoch: Annotated[int, Query(alias="to", ge=0, description="Window end epoch")],
+):
+    if from_epoch > to_epoch:
+        raise ReappraisalServiceDateIncorrectAPIException(
+            start_epoch=from_epoch, end_epoch=to_epoch
+        )
+    # Projected rows: the appraiser's services are not loaded
+    if not await AppraiserDAO(session).with_projection("list").get_appraisers_by_ids(
+        [appraiser_id]
+    ):
+        raise AppraiserNotFoundAPIException(appraiser_id)
+
+    bookings = await ReappraisalServiceDAO(session).get_appraiser_bookings(
+        appraiser_id, from_epoch, to_epoch
+    )
+    return AppraiserAvailabilityResponse(
+        appraiser_id=f"APR-{appraiser_id:04d}",
+        from_epoch=from_epoch,
+        to_epoch=to_epoch,
+        available=not bookings,
+        bookings=[AppraiserBookingResponse(**booking._mapping) for booking in bookings],
+    )
+
+
 # ============================================================================
 # COMMENTED OUT - OLD ENDPOINTS WITH ISSUES
 # ============================================================================
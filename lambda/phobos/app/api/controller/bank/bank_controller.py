@@ -10,9 +10,15 @@ from ...exceptions.bank_exception import (
 from ...model.bank.bank_create import BankCreateRequest, BankCreateResponse
 from ...model.bank.bank_get import BankGetResponse, BankWithBranchServicesResponse, BranchWithServicesCountResponse
 from ...model.bank.bank_table import BankIdPath, BankTable
-from ...services.search_filter.basequery import BaseQueryParams
+from ...services.search_filter.basequery import BaseQueryParams, RankBySimilarityQuery
 from ...services.search_filter.matchtype_enum import MatchTypeEnum
-from ...services.pagination.pagination import PaginationResponse
+from ...services.reference_cache.reference_cache import reference_cache
+from ...services.pagination.pagination import (
+    AfterQuery,
+    IncludeTotalQuery,
+    PaginationResponse,
+)
+from ...services.fast_json.fast_json import fast_list_response
 
 router = APIRouter()
 
@@ -52,9 +58,12 @@ async def get_banks(
     total_branches_count: Optional[str] = None,
     page: Optional[int] = None,
     size: Optional[int] = None,
+    after: AfterQuery = None,
+    include_total: IncludeTotalQuery = None,
+    rank: RankBySimilarityQuery = None,
 ):
-    bankDao = BankDao(session)
-    branchDao = BranchDao(session)
+    bankDao = BankDao(session).with_projection("list")
+    branchDao = BranchDao(session).with_projection("list")
 
     query = BaseQueryParams(
         search_values=(
@@ -71,14 +80,17 @@ async def get_banks(
         ),
         page=page,
         size=size,
+        after=after,
+        include_total=include_total,
+        rank_by_similarity=bool(rank),
     )
     banks = await bankDao.get_banks(query)
-    if not banks:
+    if not (banks.items if isinstance(banks, PaginationResponse) else banks):
         raise BankDetailsNotFoundAPIException()
 
     # For now, return basic bank info without branch details
     # TODO: Implement branch details with formatted responses
-    return [BankGetResponse.from_db_record(bank) for bank in banks]
+    return fast_list_response(banks, BankGetResponse, BankGetResponse.db_record_fields)
 
 
 @router.get(
@@ -89,7 +101,7 @@ async def get_banks(
     responses={200: {"description": "Bank Retrieved Successfully"}},
 )
 async def get_bank_by_id(bank_id: int, session: DBSessionDependency):
-    bankDao = BankDao(session)
+    bankDao = BankDao(session).with_profile("detail")
 
     # Get bank details
     bank_response = await bankDao.get_bank(bank_id)
@@ -115,6 +127,7 @@ async def update_bank_by_id(
     bank_response = await bankDao.update_bank(bank_id, payload)
     if not bank_response:
         raise BankNotFoundAPIException(str(bank_id))
+    reference_cache.invalidate(BankTable.__tablename__, bank_id)
     return BankGetResponse.from_db_record(bank_response)
 
 
@@ -129,4 +142,5 @@ async def delete_bank_by_id(bank_id: int, session: DBSessionDependency):
     deleted = await bankDao.delete_bank(bank_id)
     if not deleted:
         raise BankNotFoundAPIException(str(bank_id))
+    reference_cache.invalidate(BankTable.__tablename__, bank_id)
     return {"message": "Bank Deleted Successfully"}
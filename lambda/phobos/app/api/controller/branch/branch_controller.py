@@ -6,13 +6,19 @@ from ...exceptions.branch_exception import (
     BranchNotFoundAPIException,
     BranchDetailsNotFoundAPIException,
 )
-from ...services.search_filter.basequery import BaseQueryParams
+from ...services.search_filter.basequery import BaseQueryParams, RankBySimilarityQuery
 from ...model.branch.branch_create import BranchCreateRequest, BranchCreateResponse, BranchUpdateRequest
 from ...model.branch.branch_get import BranchGetResponse
 from ...model.branch.branch_table import BranchIdPath, BranchTable
 from ...model.bank.bank_table import BankIdQuery
-from ...services.pagination.pagination import PaginationResponse
+from ...services.pagination.pagination import (
+    AfterQuery,
+    IncludeTotalQuery,
+    PaginationResponse,
+)
+from ...services.fast_json.fast_json import fast_list_response
 from ...services.search_filter.matchtype_enum import MatchTypeEnum
+from ...services.reference_cache.reference_cache import reference_cache
 
 router = APIRouter()
 
@@ -44,6 +50,7 @@ async def update_branch(
     branch = await branchDao.update_branch(branch_id, payload)
     if not branch:
         raise BranchNotFoundAPIException(branch_id)
+    reference_cache.invalidate(BranchTable.__tablename__, branch_id)
     return BranchGetResponse.from_db_record(branch)
 
 
@@ -58,6 +65,7 @@ async def delete_branch_by_id(branch_id: BranchIdPath, session: DBSessionDepende
     deleted = await branchDao.delete_branch(branch_id)
     if not deleted:
         raise BranchNotFoundAPIException(branch_id)
+    reference_cache.invalidate(BranchTable.__tablename__, branch_id)
     return {"message": "Branch Deleted Successfully"}
 
 
@@ -84,8 +92,11 @@ async def get_branches(
     postal_code: Optional[str] = None,
     page: Optional[int] = None,
     size: Optional[int] = None,
+    after: AfterQuery = None,
+    include_total: IncludeTotalQuery = None,
+    rank: RankBySimilarityQuery = None,
 ):
-    branchDao = BranchDao(session)
+    branchDao = BranchDao(session).with_projection("list")
     query = BaseQueryParams(
         search_values=(
             branch_id,
@@ -113,11 +124,14 @@ async def get_branches(
         ),
         page=page,
         size=size,
+        after=after,
+        include_total=include_total,
+        rank_by_similarity=bool(rank),
     )
     branches = await branchDao.get_branches(query)
-    if not branches:
+    if not (branches.items if isinstance(branches, PaginationResponse) else branches):
         raise BranchDetailsNotFoundAPIException()
-    return [BranchGetResponse.from_db_record(branch) for branch in branches]
+    return fast_list_response(branches, BranchGetResponse, BranchGetResponse.db_record_fields)
 
 
 # @router.get(
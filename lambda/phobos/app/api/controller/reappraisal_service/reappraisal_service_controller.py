@@ -1,21 +1,23 @@
 import asyncio
-from typing import List, Optional, Union
-from fastapi import APIRouter, Depends, Query
-from fastapi import UploadFile, File, Form
+from typing import Annotated, List, Optional, Union
+from fastapi import APIRouter, Depends, Header, Query, Request
 from pydantic import ValidationError
 from app.api.dao.bank_dao import BankDao
 from app.api.dao.branch_dao import BranchDao    
-from app.api.dao.advance_dao import ReappraisalServiceAdvanceDAO
 from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
-from app.api.dao.reimbursement_dao import ReappraisalServiceReimbursementDAO
 from app.api.db_connection.db_connection import DBSessionDependency
-from app.api.services.pagination.pagination import PaginationResponse
-from app.api.services.pagination.pagination import PaginationResponse
+from app.api.services.pagination.pagination import (
+    AfterQuery,
+    IncludeTotalQuery,
+    PaginationResponse,
+)
 from app.api.model.reappraisal_service.reappraisal_service_table import (
     ReappraisalServiceIDPath,
     ReappraisalServiceTable,
 )
 from app.api.model.reappraisal_service.reappraisal_service_create import (
+    ReappraisalServiceBatchGetRequest,
+    ReappraisalServiceBatchGetResponse,
     ReappraisalServiceCreateRequest,
     ReappraisalServiceCreateResponse,
     ReappraisalServiceUpdateRequest,
@@ -32,7 +34,14 @@ from app.api.exceptions.reappraisal_service_exception import (
     ReappraisalServiceDeleteNotAllowedAPIException,
 )
 
-from app.api.services.search_filter.basequery import BaseQueryParams
+from app.api.services.search_filter.basequery import BaseQueryParams, RankBySimilarityQuery
+from app.api.services.export.export import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_MEDIA_TYPES,
+    export_response,
+)
+from app.api.model.enum.export_format_enum import ExportFormatEnum
+from app.api.services.fast_json.fast_json import fast_list_response
 from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
 from app.api.repository.branch_API_repository import BranchServiceClientDependency
 from app.api.exceptions.reimbursment_exception import FileNotFoundAPIException
@@ -46,13 +55,26 @@ from app.api.model.reappraisal_service.reappraisal_service_create import (
     ReappraisalFileUpdate,
 )
 from app.api.dao.dao import DAO
-from app.api.services.S3_service.file_validation import validate_reappraisal_file
+from app.api.model.enum.document_owner_enum import DocumentOwnerEnum
+from app.api.model.general.presigned_file import (
+    PresignedUploadFinalizeRequest,
+    PresignedUploadRequest,
+    PresignedUploadResponse,
+)
+from app.api.services.S3_service.presigned_upload import (
+    finalize_presigned_upload,
+    presigned_upload,
+)
+from app.api.services.S3_service.streaming_upload import (
+    MultipartFileStream,
+    multipart_file_openapi,
+)
 from app.api.dao.appraiser_dao import AppraiserDAO
 from app.api.exceptions.appraiser_exception import AppraiserNotFoundAPIException
 from io import BytesIO
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from fastapi.responses import StreamingResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 from app.api.services.S3_service.pdf_generator import generate_authorisation_pdf
 from app.api.services.service_settlement.queue_reappraisal_service import (
     QueuedReappraisalService,
@@ -96,30 +118,16 @@ async def create_reappraisal_service(
 async def get_reappraisal_service(
     reappraisal_service_id: ReappraisalServiceIDPath, session: DBSessionDependency
 ):
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("detail")
     reappraisal_service = await reappraisal_serviceDao.get_reappraisal_service(
         reappraisal_service_id
     )
     if not reappraisal_service:
         raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
 
-    # Get reimbursement and advance amounts from database
-    reimbursement_serviceDao = ReappraisalServiceReimbursementDAO(session)
-    reimbursement_amount = (
-        await reimbursement_serviceDao.get_total_reimbursement_amount(
-            reappraisal_service_id
-        )
-    )
-
-    advanceDao = ReappraisalServiceAdvanceDAO(session)
-    advance_amount = await advanceDao.get_total_advance_amount(reappraisal_service_id)
-
-    # Calculate total amount: rs_charge + reimbursement - advance
-    total_amount = reappraisal_service.rs_charge + reimbursement_amount - advance_amount
-
     # Get bank and branch details from database
-    bankDao = BankDao(session)
-    branchDao = BranchDao(session)
+    bankDao = BankDao(session).with_profile("detail")
+    branchDao = BranchDao(session).with_profile("detail")
 
     bank = await bankDao.get_bank(reappraisal_service.rs_bank_id)
     branch = await branchDao.get_branch_by_id_or_ids(reappraisal_service.rs_branch_id)
@@ -146,10 +154,10 @@ async def get_reappraisal_service(
         "reimbursements": reappraisal_service.reimbursements,
         "advances": reappraisal_service.advances,
 
-        # Set financial fields
-        "reimbursement_amount": reimbursement_amount,
-        "advance_amount": advance_amount,
-        "total_amount": total_amount,
+        # Set financial fields, maintained on the service row by every reimbursement/advance write
+        "reimbursement_amount": reappraisal_service.rs_reimbursement_total,
+        "advance_amount": reappraisal_service.rs_advance_total,
+        "total_amount": reappraisal_service.rs_total_amount,
 
         # Set appraiser fields from database
         "appraiser_name": reappraisal_service.appraiser.appraiser_full_name if reappraisal_service.appraiser else "",
@@ -171,6 +179,56 @@ async def get_reappraisal_service(
     return ReappraisalServiceGetByIdResponse(**response_data)
 
 
+# Filters of the service listing and its export, in search value order
+SERVICE_LIST_FILTER_FIELDS = (
+    ("reappraisal_service_id", MatchTypeEnum.EXACT),
+    ("rs_appraiser_id", MatchTypeEnum.EXACT),
+    ("rs_branch_id", MatchTypeEnum.EXACT),  # will handle list of branch_ids too
+    (("rs_start_epoch", "rs_end_epoch"), MatchTypeEnum.EPOCH_RANGE),
+    (("rs_start_epoch", "rs_end_epoch"), MatchTypeEnum.EPOCH_RANGE),
+    ("appraiser_full_name", MatchTypeEnum.PARTIAL),
+    ("rs_status", MatchTypeEnum.EXACT),
+    ("rs_completion_file_path", MatchTypeEnum.FILE_PATH_STATUS),
+    ("rs_settlement_status", MatchTypeEnum.EXACT),
+)
+
+
+def service_list_filter_values(
+    reappraisal_id: Optional[str] = None,
+    appraiser_id: Optional[str] = None,
+    branch_id: Optional[str] = None,
+    service_date: Optional[int] = None,
+    service_from: Optional[int] = None,
+    service_to: Optional[int] = None,
+    bank_name: Optional[str] = None,
+    appraiser_name: Optional[str] = None,
+    service_statuses: List[Optional[str]] = Query(None),
+    file_path_status: Optional[str] = None,
+    settlement_statuses: List[Optional[str]] = Query(None),
+) -> tuple:
+    """Search values of SERVICE_LIST_FILTER_FIELDS from the query string."""
+    return (
+        reappraisal_id,
+        appraiser_id,
+        branch_id,
+        service_date,
+        # Services overlapping [service_from, service_to]; an omitted
+        # bound is open
+        (
+            [service_from, service_to]
+            if service_from is not None or service_to is not None
+            else None
+        ),
+        appraiser_name,
+        service_statuses,
+        file_path_status,
+        settlement_statuses,
+    )
+
+
+ServiceListFilterValues = Annotated[tuple, Depends(service_list_filter_values)]
+
+
 @router.get(
     "/v1/reappraisal_services",
     response_model=Union[
@@ -183,88 +241,109 @@ async def get_reappraisal_service(
 )
 async def get_reappraisal_services(
     session: DBSessionDependency,
-    reappraisal_id: Optional[str] = None,
-    appraiser_id: Optional[str] = None,
-    branch_id: Optional[str] = None,
-    service_date: Optional[int] = None,
-    bank_name: Optional[str] = None,
-    appraiser_name: Optional[str] = None,
-    service_statuses: List[Optional[str]] = Query(None),
-    file_path_status: Optional[str] = None,
-    settlement_statuses: List[Optional[str]] = Query(None),
+    filter_values: ServiceListFilterValues,
     page: Optional[int] = None,
     size: Optional[int] = None,
+    after: AfterQuery = None,
+    include_total: IncludeTotalQuery = None,
+    rank: RankBySimilarityQuery = None,
 ):
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("list")
 
 
     # Build query params
     query = BaseQueryParams(
-        search_values=(
-            reappraisal_id,
-            appraiser_id,
-            service_date,
-            appraiser_name,
-            service_statuses,
-            file_path_status,
-            settlement_statuses,
-        ),
-        fields=(
-            ("reappraisal_service_id", MatchTypeEnum.EXACT),
-            ("rs_appraiser_id", MatchTypeEnum.EXACT),
-            ("rs_branch_id", MatchTypeEnum.EXACT),  # will handle list of branch_ids too
-            (("rs_start_epoch", "rs_end_epoch"), MatchTypeEnum.EPOCH_RANGE),
-            (("full_name"), MatchTypeEnum.PARTIAL),
-            ("rs_status", MatchTypeEnum.EXACT),
-            ("rs_completion_file_path", MatchTypeEnum.FILE_PATH_STATUS),
-            ("rs_settlement_status", MatchTypeEnum.EXACT),
-        ),
+        search_values=filter_values,
+        fields=SERVICE_LIST_FILTER_FIELDS,
         page=page,
         size=size,
+        after=after,
+        include_total=include_total,
+        rank_by_similarity=bool(rank),
     )
 
-    # Fetch from app.api.dao
-    reappraisal_service = await reappraisal_serviceDao.get_reappraisal_services(query)
+    # Services, names and financial totals come back from a single statement
+    reappraisal_services = await reappraisal_serviceDao.get_reappraisal_service_list(query)
 
-    if not reappraisal_service:
+    rows = (
+        reappraisal_services.items
+        if isinstance(reappraisal_services, PaginationResponse)
+        else reappraisal_services
+    )
+    if not rows:
         raise ReappraisalServiceDetailsNotFoundAPIException()
 
-    # Transform data to match the new response structure
-    response_list = []
-    for service in reappraisal_service:
-        # Get bank and branch details
-        bankDao = BankDao(session)
-        branchDao = BranchDao(session)
-
-        bank = await bankDao.get_bank(service.rs_bank_id)
-        branch = await branchDao.get_branch_by_id_or_ids(service.rs_branch_id)
+    return fast_list_response(
+        reappraisal_services,
+        ReappraisalServiceGetResponse,
+        lambda row: dict(
+            reappraisal_service_id=row.reappraisal_service_id,
+            appraiser_name=row.appraiser_name,
+            bank_name=row.bank_name,
+            branch_name=row.branch_name,
+            start_epoch=row.rs_start_epoch,
+            end_epoch=row.rs_end_epoch,
+            no_of_packets=row.rs_packet_count,
+            status=row.rs_status,
+            total_amount=row.total_amount,
+        ),
+    )
 
-        # Get reimbursement and advance amounts for total calculation
-        reimbursement_serviceDao = ReappraisalServiceReimbursementDAO(session)
-        reimbursement_amount = await reimbursement_serviceDao.get_total_reimbursement_amount(
-            service.reappraisal_service_id
-        )
 
-        advanceDao = ReappraisalServiceAdvanceDAO(session)
-        advance_amount = await advanceDao.get_total_advance_amount(service.reappraisal_service_id)
-
-        # Calculate total amount: rs_charge + reimbursement - advance
-        total_amount = service.rs_charge + reimbursement_amount - advance_amount
-
-        response_item = {
-            "reappraisal_service_id": service.reappraisal_service_id,
-            "appraiser_name": service.appraiser.appraiser_full_name if service.appraiser else "",
-            "bank_name": bank.bank_name if bank else "",
-            "branch_name": branch.branch_name if branch else "",
-            "start_epoch": service.rs_start_epoch,
-            "end_epoch": service.rs_end_epoch,
-            "no_of_packets": service.rs_packet_count,
-            "status": service.rs_status,
-            "total_amount": total_amount,
+@router.get(
+    "/v1/reappraisal_services/export",
+    summary="Export Reappraisal Services",
+    description="Streams every reappraisal service matching the listing filters as NDJSON "
+    "or CSV, with appraiser, bank and branch names and the financial totals.",
+    responses={
+        200: {
+            "description": "Reappraisal Services Exported",
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
         }
-        response_list.append(ReappraisalServiceGetResponse(**response_item))
+    },
+)
+async def export_reappraisal_services(
+    session: DBSessionDependency,
+    filter_values: ServiceListFilterValues,
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+):
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("list")
+    query = BaseQueryParams(
+        search_values=filter_values,
+        fields=SERVICE_LIST_FILTER_FIELDS,
+    )
+    # Rows are read and sent one batch at a time while the response streams
+    return export_response(
+        reappraisal_serviceDao.stream_reappraisal_service_list(query, EXPORT_BATCH_SIZE),
+        ReappraisalServiceDAO.service_list_columns(),
+        format,
+        "reappraisal_services",
+    )
 
-    return response_list
+
+@router.post(
+    "/v1/reappraisal_services:batchGet",
+    response_model=ReappraisalServiceBatchGetResponse,
+    summary="Retrieve Reappraisal Services by ID in Bulk",
+    description="Retrieves many reappraisal services by ID with a single query. Results follow the request order; IDs with no live service are listed in not_found.",
+    responses={200: {"description": "Reappraisal Services Retrieved"}},
+)
+async def get_reappraisal_services_batch(
+    payload: ReappraisalServiceBatchGetRequest, session: DBSessionDependency
+):
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("list")
+    reappraisal_services = await reappraisal_serviceDao.get_reappraisal_services_by_ids(
+        payload.reappraisal_service_ids
+    )
+    found_ids = {service.reappraisal_service_id for service in reappraisal_services}
+    return {
+        "items": reappraisal_services,
+        "not_found": [
+            reappraisal_service_id
+            for reappraisal_service_id in payload.reappraisal_service_ids
+            if reappraisal_service_id not in found_ids
+        ],
+    }
 
 
 @router.put(
@@ -327,15 +406,15 @@ async def delete_reappraisal_service(
     summary="Upload Completion Certificate",
     description="Uploads a completion certificate file for the specified reappraisal service.",
     responses={201: {"description": "File Uploaded Successfully"}},
+    openapi_extra=multipart_file_openapi("completion_file"),
 )
 async def create_reappraisal_file(
     reappraisal_service_id: ReappraisalServiceIDPath,
     session: DBSessionDependency,
     s3: S3ClientDependency,
-    completion_file: UploadFile = File(...),
+    request: Request,
 ):
-    validate_reappraisal_file(completion_file)  # for validating the file
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
 
     # Fetch reappraisal service
     existing_service = await reappraisal_serviceDao.get_reappraisal_service(
@@ -353,10 +432,84 @@ async def create_reappraisal_file(
         category="completion_certificates",
     )
 
-    file_url = await s3.upload_file(
-        file=completion_file,
+    completion_file = await MultipartFileStream(request, "completion_file").open()
+    file_url = await s3.upload_stream(
+        completion_file.chunks(),
+        key_prefix=key_prefix,
+        file_extension=completion_file.file_extension,
+        content_type=completion_file.content_type,
+        old_file_url=existing_service.rs_completion_file_path,
+        owner_type=DocumentOwnerEnum.REAPPRAISAL_SERVICE,
+        owner_id=reappraisal_service_id,
+    )
+
+    update_data = ReappraisalFileUpdate(rs_completion_file_path=file_url)
+    await reappraisal_serviceDao.update_reappraisal_service(
+        reappraisal_service_id, update_data
+    )
+
+    return {"reappraisal_id": reappraisal_service_id, "file_url": file_url}
+
+
+@router.post(
+    "/v1/reappraisal_service/{reappraisal_service_id}/completion_certificates/presigned_upload",
+    response_model=PresignedUploadResponse,
+    summary="Get Completion Certificate Upload URL",
+    description="Issues a short-lived presigned S3 URL to upload a completion certificate to directly. Call the finalize endpoint with the returned key once the upload is done.",
+    responses={200: {"description": "Upload URL Issued"}},
+)
+async def create_reappraisal_file_upload_url(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    payload: PresignedUploadRequest,
+    session: DBSessionDependency,
+    s3: S3ClientDependency,
+):
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
+    existing_service = await reappraisal_serviceDao.get_reappraisal_service(
+        reappraisal_service_id
+    )
+    if not existing_service:
+        raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
+
+    key_prefix = await DAO.build_s3_key_prefix(
+        appraiser_id=existing_service.rs_appraiser_id,
+        reappraisal_service_id=reappraisal_service_id,
+        category="completion_certificates",
+    )
+    return await presigned_upload(s3, key_prefix, payload)
+
+
+@router.post(
+    "/v1/reappraisal_service/{reappraisal_service_id}/completion_certificates/finalize_upload",
+    summary="Finalize Completion Certificate Upload",
+    description="Validates a completion certificate uploaded through a presigned URL and records it on the reappraisal service, replacing the previous file.",
+    responses={201: {"description": "File Uploaded Successfully"}},
+)
+async def finalize_reappraisal_file_upload(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    payload: PresignedUploadFinalizeRequest,
+    session: DBSessionDependency,
+    s3: S3ClientDependency,
+):
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
+    existing_service = await reappraisal_serviceDao.get_reappraisal_service(
+        reappraisal_service_id
+    )
+    if not existing_service:
+        raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
+
+    key_prefix = await DAO.build_s3_key_prefix(
+        appraiser_id=existing_service.rs_appraiser_id,
+        reappraisal_service_id=reappraisal_service_id,
+        category="completion_certificates",
+    )
+    file_url = await finalize_presigned_upload(
+        s3,
         key_prefix=key_prefix,
+        key=payload.key,
         old_file_url=existing_service.rs_completion_file_path,
+        owner_type=DocumentOwnerEnum.REAPPRAISAL_SERVICE,
+        owner_id=reappraisal_service_id,
     )
 
     update_data = ReappraisalFileUpdate(rs_completion_file_path=file_url)
@@ -370,16 +523,27 @@ async def create_reappraisal_file(
 @router.get(
     "/v1/reappraisal_service/{reappraisal_service_id}/fetch_completion_certificates",
     summary="Fetch Completion Certificate",
-    description="Streams the completion certificate file for the specified reappraisal service directly from S3.",
-    responses={200: {"description": "File Streamed Successfully"}},
+    description="Streams the completion certificate file for the specified reappraisal service directly from S3. Supports `Range`, `If-None-Match` and `If-Modified-Since` request headers. Set `redirect=true` to get a redirect to a short-lived presigned S3 URL instead.",
+    responses={
+        200: {"description": "File Streamed Successfully"},
+        206: {"description": "Requested Byte Range Streamed"},
+        304: {"description": "File Not Modified"},
+        307: {"description": "Redirect to a Presigned File URL"},
+    },
 )
 async def get_reappraisal_file(
     reappraisal_service_id: ReappraisalServiceIDPath,
     session: DBSessionDependency,
     s3: S3ClientDependency,
     download: bool = Query(False, description="Set to true to force download"),
+    redirect: bool = Query(
+        False, description="Set to true to redirect to a presigned S3 URL"
+    ),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    if_modified_since: Optional[str] = Header(None, alias="If-Modified-Since"),
 ):
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
     existing_service = await reappraisal_serviceDao.get_reappraisal_service(
         reappraisal_service_id
     )
@@ -392,7 +556,17 @@ async def get_reappraisal_file(
     if not file_url:
         raise FileNotFoundAPIException(file_url=file_url)
 
-    return await s3.stream_file(file_url=file_url, download=download)
+    if redirect:
+        return RedirectResponse(
+            await s3.presigned_download_url(file_url=file_url, download=download)
+        )
+    return await s3.stream_file(
+        file_url=file_url,
+        download=download,
+        range_header=range_header,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    )
 
 
 @router.get(
@@ -408,7 +582,7 @@ async def generate_authorisation_letter(
     s3: S3ClientDependency,
 ):
     # fetch from app.api.dao + microservices
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("pdf")
     service = await reappraisal_serviceDao.get_reappraisal_service(
         reappraisal_service_id
     )
@@ -445,7 +619,11 @@ async def generate_authorisation_letter(
     # Upload copy to S3
     filename = f"{document_id}.pdf"
     file_url = await s3.upload_bytesio(
-        buffer=upload_buffer, key_prefix=key_prefix, filename=filename
+        buffer=upload_buffer,
+        key_prefix=key_prefix,
+        filename=filename,
+        owner_type=DocumentOwnerEnum.REAPPRAISAL_SERVICE,
+        owner_id=reappraisal_service_id,
     )
 
     # Reset main buffer for StreamingResponse
@@ -489,7 +667,7 @@ async def delete_reappraisal_file(
     session: DBSessionDependency,
     s3: S3ClientDependency,
 ):
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
 
     # Fetch reappraisal service
     existing_service = await reappraisal_serviceDao.get_reappraisal_service(
@@ -1,5 +1,6 @@
-from typing import List, Optional, Union
-from fastapi import APIRouter, Query, UploadFile, File
+from typing import Any, Dict, List, Optional, Union
+from fastapi import APIRouter, Body, Header, Query, Request
+from fastapi.responses import RedirectResponse
 from app.api.dao.dao import DAO
 from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
 from app.api.dao.reimbursement_dao import ReappraisalServiceReimbursementDAO
@@ -8,20 +9,48 @@ from app.api.db_connection.db_connection import DBSessionDependency
 from app.api.exceptions.reappraisal_service_exception import (
     ReappraisalServiceNotFoundAPIException,
 )
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceIDPath,
+)
 from app.api.repository.s3_repository import S3ClientDependency
-from app.api.services.S3_service.file_validation import validate_reappraisal_file
+from app.api.services.batch.batch import (
+    MAX_BATCH_SIZE,
+    BatchResponse,
+    batch_response,
+    validate_batch,
+)
+from app.api.model.enum.document_owner_enum import DocumentOwnerEnum
+from app.api.model.general.presigned_file import (
+    PresignedUploadFinalizeRequest,
+    PresignedUploadRequest,
+    PresignedUploadResponse,
+)
+from app.api.services.S3_service.presigned_upload import (
+    finalize_presigned_upload,
+    presigned_upload,
+)
+from app.api.services.S3_service.streaming_upload import (
+    MultipartFileStream,
+    multipart_file_openapi,
+)
 from app.api.services.search_filter.basequery import BaseQueryParams
-from app.api.services.pagination.pagination import PaginationResponse
+from app.api.services.pagination.pagination import (
+    AfterQuery,
+    IncludeTotalQuery,
+    PaginationResponse,
+)
+from app.api.services.fast_json.fast_json import fast_list_response
 from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
 
 from app.api.services.search_filter.basequery import BaseQueryParams
-from app.api.services.pagination.pagination import PaginationResponse
 from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
 from app.api.model.reimbursement.reimbursement_table import (
     ReappraisalServiceReimbursementTable,
     ReappraisalServiceReimbursementIdPath,
 )
 from app.api.model.reimbursement.reimbursement_create import (
+    ReappraisalServiceReimbursementBatchDeleteRequest,
+    ReappraisalServiceReimbursementBatchUpdateRequest,
     ReappraisalServiceReimbursementCreateRequest,
     ReappraisalServiceReimbursementCreateResponse,
     ReimbursementFileUpdate,
@@ -56,6 +85,99 @@ async def create_rs_reimbursement(
     return rs_reimbursement
 
 
+@router.post(
+    "/v1/reappraisal_service/{reappraisal_service_id}/reimbursements:batch",
+    response_model=BatchResponse[ReappraisalServiceReimbursementCreateResponse],
+    summary="Create Reappraisal Service Reimbursements in Bulk",
+    description="Creates many reimbursements of one reappraisal service in a single transaction. Each item is validated on its own; invalid items are reported and skipped.",
+    responses={201: {"description": "Reappraisal Service Reimbursements Created"}},
+)
+async def create_rs_reimbursements_batch(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    session: DBSessionDependency,
+    payload: List[Dict[str, Any]] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+):
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("write")
+    if not await reappraisal_serviceDao.get_reappraisal_service(reappraisal_service_id):
+        raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
+
+    valid, failures = validate_batch(
+        payload,
+        ReappraisalServiceReimbursementCreateRequest,
+        rs_reappraisal_service_id=reappraisal_service_id,
+    )
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    created = await rs_reimbursementDao.create_rs_reimbursements(
+        [ReappraisalServiceReimbursementTable.model_validate(item) for _, item in valid]
+    )
+    return batch_response(
+        len(payload),
+        {index: record for (index, _), record in zip(valid, created)},
+        failures,
+        ReappraisalServiceReimbursementCreateResponse,
+    )
+
+
+@router.patch(
+    "/v1/reappraisal_service/{reappraisal_service_id}/reimbursements:batch",
+    response_model=BatchResponse[ReappraisalServiceReimbursementCreateResponse],
+    summary="Update Reappraisal Service Reimbursements in Bulk",
+    description="Updates many reimbursements of one reappraisal service in a single transaction. Items that fail validation or match no live reimbursement of the service are reported and skipped.",
+    responses={200: {"description": "Reappraisal Service Reimbursements Updated"}},
+)
+async def update_rs_reimbursements_batch(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    session: DBSessionDependency,
+    payload: List[Dict[str, Any]] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+):
+    valid, failures = validate_batch(
+        payload,
+        ReappraisalServiceReimbursementBatchUpdateRequest,
+        rs_reappraisal_service_id=reappraisal_service_id,
+    )
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    updated = await rs_reimbursementDao.update_rs_reimbursements(
+        reappraisal_service_id,
+        {item.rs_reimbursement_id: item for _, item in valid},
+    )
+    updated_by_id = {record.rs_reimbursement_id: record for record in updated}
+    return batch_response(
+        len(payload),
+        {
+            index: updated_by_id[item.rs_reimbursement_id]
+            for index, item in valid
+            if item.rs_reimbursement_id in updated_by_id
+        },
+        failures,
+        ReappraisalServiceReimbursementCreateResponse,
+    )
+
+
+@router.post(
+    "/v1/reappraisal_service/{reappraisal_service_id}/reimbursements:batchDelete",
+    summary="Delete Reappraisal Service Reimbursements in Bulk",
+    description="Soft-deletes many reimbursements of one reappraisal service with a single statement.",
+    responses={200: {"description": "Reappraisal Service Reimbursements Deleted"}},
+)
+async def delete_rs_reimbursements_batch(
+    reappraisal_service_id: ReappraisalServiceIDPath,
+    payload: ReappraisalServiceReimbursementBatchDeleteRequest,
+    session: DBSessionDependency,
+):
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    deleted_ids = await rs_reimbursementDao.delete_rs_reimbursements(
+        reappraisal_service_id, payload.rs_reimbursement_ids
+    )
+    return {
+        "deleted": deleted_ids,
+        "not_found": [
+            rs_reimbursement_id
+            for rs_reimbursement_id in payload.rs_reimbursement_ids
+            if rs_reimbursement_id not in deleted_ids
+        ],
+    }
+
+
 @router.get(
     "/v1/reimbursements",
     response_model=Union[
@@ -77,8 +199,10 @@ async def get_rs_reimbursements(
     reimbursement_settlement_statuses: List[Optional[str]] = Query(None),
     page: Optional[str] = None,
     size: Optional[str] = None,
+    after: AfterQuery = None,
+    include_total: IncludeTotalQuery = None,
 ):
-    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("list")
     query = BaseQueryParams(
         search_values=(
             rsr_transaction_epoch,
@@ -100,11 +224,17 @@ async def get_rs_reimbursements(
         ),
         page=page,
         size=size,
+        after=after,
+        include_total=include_total,
     )
     rs_reimbursement = await rs_reimbursementDao.get_rs_reimbursements(query)
-    if not rs_reimbursement:
+    if not (
+        rs_reimbursement.items
+        if isinstance(rs_reimbursement, PaginationResponse)
+        else rs_reimbursement
+    ):
         raise RsReimbursementDetailsNotFoundAPIException()
-    return rs_reimbursement
+    return fast_list_response(rs_reimbursement, ReappraisalServiceReimbursementGetResponse)
 
 
 @router.get(
@@ -118,7 +248,7 @@ async def get_rs_reimbursement(
     rs_reimbursement_id: ReappraisalServiceReimbursementIdPath,
     session: DBSessionDependency,
 ):
-    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("detail")
     rs_reimbursement = await rs_reimbursementDao.get_rs_reimbursement(
         rs_reimbursement_id
     )
@@ -172,16 +302,16 @@ async def delete_rs_reimbursement(
     summary="Upload Reimbursement Proof File",
     description="This API Endpoint is used for uploading reimbursement proof files to S3 and updating the reimbursement record with the file URL.",
     responses={201: {"description": "Reimbursement Proof File Uploaded"}},
+    openapi_extra=multipart_file_openapi("proof_file"),
 )
 async def upload_reimbursement_proof(
     rs_reimbursement_id: ReappraisalServiceReimbursementIdPath,
     session: DBSessionDependency,
     s3: S3ClientDependency,
-    proof_file: UploadFile = File(...),
+    request: Request,
 ):
-    validate_reappraisal_file(proof_file)  # for validating the file
-    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
-    reappraisal_serviceDao = ReappraisalServiceDAO(session)
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("file")
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
     # 1. Fetch reimbursement
     existing_reimbursement = await rs_reimbursementDao.get_rs_reimbursement(
         rs_reimbursement_id
@@ -205,10 +335,109 @@ async def upload_reimbursement_proof(
         reimbursement_id=rs_reimbursement_id,
     )
     # 5. Upload new proof
-    file_url = await s3.upload_file(
-        file=proof_file,
+    proof_file = await MultipartFileStream(request, "proof_file").open()
+    file_url = await s3.upload_stream(
+        proof_file.chunks(),
+        key_prefix=key_prefix,
+        file_extension=proof_file.file_extension,
+        content_type=proof_file.content_type,
+        old_file_url=existing_reimbursement.rs_reimbursement_file_path,
+        owner_type=DocumentOwnerEnum.REIMBURSEMENT,
+        owner_id=rs_reimbursement_id,
+    )
+    # 6. Update DB
+    update_data = ReimbursementFileUpdate(rs_reimbursement_file_path=file_url)
+    await rs_reimbursementDao.update_rs_reimbursement(rs_reimbursement_id, update_data)
+    return {
+        "reimbursement_id": rs_reimbursement_id,
+        "file_url": file_url,
+    }
+
+
+@router.post(
+    "/v1/reimbursement/{rs_reimbursement_id}/reimbursement_proofs/presigned_upload",
+    response_model=PresignedUploadResponse,
+    summary="Get Reimbursement Proof Upload URL",
+    description="This API Endpoint is used for issuing a short-lived presigned S3 URL to upload a reimbursement proof file to directly. Call the finalize endpoint with the returned key once the upload is done.",
+    responses={200: {"description": "Upload URL Issued"}},
+)
+async def create_reimbursement_proof_upload_url(
+    rs_reimbursement_id: ReappraisalServiceReimbursementIdPath,
+    payload: PresignedUploadRequest,
+    session: DBSessionDependency,
+    s3: S3ClientDependency,
+):
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("file")
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
+    # 1. Fetch reimbursement
+    existing_reimbursement = await rs_reimbursementDao.get_rs_reimbursement(
+        rs_reimbursement_id
+    )
+    if not existing_reimbursement:
+        raise RsReimbursementNotFoundAPIException(rs_reimbursement_id)
+    # 2. Get reappraisal_service_id from reimbursement
+    reappraisal_service_id = existing_reimbursement.rs_reappraisal_service_id
+    # 3. Fetch reappraisal service to get appraiser_id
+    reappraisal_service = await reappraisal_serviceDao.get_reappraisal_service(
+        reappraisal_service_id
+    )
+    if not reappraisal_service:
+        raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
+    appraiser_id = reappraisal_service.rs_appraiser_id
+    # 4. Build S3 prefix
+    key_prefix = await DAO.build_s3_key_prefix(
+        appraiser_id=appraiser_id,
+        reappraisal_service_id=reappraisal_service_id,
+        category="reimbursement_proofs",
+        reimbursement_id=rs_reimbursement_id,
+    )
+    return await presigned_upload(s3, key_prefix, payload)
+
+
+@router.post(
+    "/v1/reimbursement/{rs_reimbursement_id}/reimbursement_proofs/finalize_upload",
+    summary="Finalize Reimbursement Proof Upload",
+    description="This API Endpoint is used for validating a reimbursement proof file uploaded through a presigned URL and updating the reimbursement record with the file URL.",
+    responses={201: {"description": "Reimbursement Proof File Uploaded"}},
+)
+async def finalize_reimbursement_proof_upload(
+    rs_reimbursement_id: ReappraisalServiceReimbursementIdPath,
+    payload: PresignedUploadFinalizeRequest,
+    session: DBSessionDependency,
+    s3: S3ClientDependency,
+):
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("file")
+    reappraisal_serviceDao = ReappraisalServiceDAO(session).with_profile("file")
+    # 1. Fetch reimbursement
+    existing_reimbursement = await rs_reimbursementDao.get_rs_reimbursement(
+        rs_reimbursement_id
+    )
+    if not existing_reimbursement:
+        raise RsReimbursementNotFoundAPIException(rs_reimbursement_id)
+    # 2. Get reappraisal_service_id from reimbursement
+    reappraisal_service_id = existing_reimbursement.rs_reappraisal_service_id
+    # 3. Fetch reappraisal service to get appraiser_id
+    reappraisal_service = await reappraisal_serviceDao.get_reappraisal_service(
+        reappraisal_service_id
+    )
+    if not reappraisal_service:
+        raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id)
+    appraiser_id = reappraisal_service.rs_appraiser_id
+    # 4. Build S3 prefix
+    key_prefix = await DAO.build_s3_key_prefix(
+        appraiser_id=appraiser_id,
+        reappraisal_service_id=reappraisal_service_id,
+        category="reimbursement_proofs",
+        reimbursement_id=rs_reimbursement_id,
+    )
+    # 5. Validate the uploaded proof and replace the old one
+    file_url = await finalize_presigned_upload(
+        s3,
         key_prefix=key_prefix,
+        key=payload.key,
         old_file_url=existing_reimbursement.rs_reimbursement_file_path,
+        owner_type=DocumentOwnerEnum.REIMBURSEMENT,
+        owner_id=rs_reimbursement_id,
     )
     # 6. Update DB
     update_data = ReimbursementFileUpdate(rs_reimbursement_file_path=file_url)
@@ -222,17 +451,28 @@ async def upload_reimbursement_proof(
 @router.get(
     "/v1/reimbursement/{reimbursement_id}/fetch_reimbursement_proofs",
     summary="Fetch Reimbursement Proof File",
-    description="This API Endpoint is used for fetching reimbursement proof files from S3. Set `download=true` to force download in browser, or `download=false` to preview inline (PDF/image in browser).",
-    responses={200: {"description": "Reimbursement Proof File Fetched"}},
+    description="This API Endpoint is used for fetching reimbursement proof files from S3. Set `download=true` to force download in browser, or `download=false` to preview inline (PDF/image in browser). Supports `Range`, `If-None-Match` and `If-Modified-Since` request headers for partial and conditional fetches. Set `redirect=true` to get a redirect to a short-lived presigned S3 URL instead of the streamed file.",
+    responses={
+        200: {"description": "Reimbursement Proof File Fetched"},
+        206: {"description": "Requested Byte Range Fetched"},
+        304: {"description": "Reimbursement Proof File Not Modified"},
+        307: {"description": "Redirect to a Presigned File URL"},
+    },
 )
 async def get_reimbursement_file(
     reimbursement_id: ReappraisalServiceReimbursementIdPath,
     session: DBSessionDependency,
     s3: S3ClientDependency,
     download: bool = Query(False, description="Set to true to force download"),
+    redirect: bool = Query(
+        False, description="Set to true to redirect to a presigned S3 URL"
+    ),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    if_modified_since: Optional[str] = Header(None, alias="If-Modified-Since"),
 ):
 
-    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("file")
     existing_reimbursement = await rs_reimbursementDao.get_rs_reimbursement(
         reimbursement_id
     )
@@ -243,7 +483,17 @@ async def get_reimbursement_file(
     if not file_url:
         raise FileNotFoundAPIException(file_url)
 
-    return await s3.stream_file(file_url=file_url, download=download)
+    if redirect:
+        return RedirectResponse(
+            await s3.presigned_download_url(file_url=file_url, download=download)
+        )
+    return await s3.stream_file(
+        file_url=file_url,
+        download=download,
+        range_header=range_header,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    )
 
 
 @router.delete(
@@ -257,7 +507,7 @@ async def delete_reimbursement_proof(
     session: DBSessionDependency,
     s3: S3ClientDependency,
 ):
-    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session)
+    rs_reimbursementDao = ReappraisalServiceReimbursementDAO(session).with_profile("file")
 
     # Fetch the existing reimbursement record
     existing_reimbursement = await rs_reimbursementDao.get_rs_reimbursement(
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy import select
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -7,6 +7,7 @@ from app.api.model.advance.advance_table import (
     ReappraisalServiceAdvanceTable,
 )
 from app.api.dao.dao import DAO
+from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
 
 from app.api.services.search_filter.basequery import BaseQueryParams
 
@@ -16,15 +17,53 @@ from app.api.services.search_filter.basequery import BaseQueryParams
 class ReappraisalServiceAdvanceDAO:
     dao: DAO[ReappraisalServiceAdvanceTable, str]
 
+    # Advance responses embed their service
+    LOAD_PROFILES = {"list": ("service",), "detail": ("service",)}
+
     def __init__(self, session: AsyncSession):
         self.dao = DAO[ReappraisalServiceAdvanceTable, str](
-            session, ReappraisalServiceAdvanceTable
+            session, ReappraisalServiceAdvanceTable, self.LOAD_PROFILES
+        )
+
+    def with_profile(self, profile: str) -> "ReappraisalServiceAdvanceDAO":
+        """Loads only the relationships of the named LOAD_PROFILES entry."""
+        self.dao = self.dao.with_profile(profile)
+        return self
+
+    async def _commit_with_totals(self, reappraisal_service_ids) -> None:
+        """Brings the totals of the services a write touched in step, then commits."""
+        await ReappraisalServiceDAO(self.dao.session).refresh_totals(
+            reappraisal_service_ids
         )
+        await self.dao.session.commit()
+
+    async def _lock_services(self, reappraisal_service_ids) -> None:
+        """Locks the services a write will touch, before it writes."""
+        await ReappraisalServiceDAO(self.dao.session).lock_services(
+            reappraisal_service_ids
+        )
+
+    @staticmethod
+    def _moved_to(updates: SQLModel) -> List[str]:
+        # The service an update moves the advance to, if it does
+        service_id = updates.model_dump(exclude_unset=True).get("reappraisal_service_id")
+        return [service_id] if service_id else []
+
+    async def _service_ids_of(self, rs_advance_ids: List[str]) -> List[str]:
+        result = await self.dao.session.exec(
+            select(ReappraisalServiceAdvanceTable.reappraisal_service_id).where(
+                ReappraisalServiceAdvanceTable.rs_advance_id.in_(rs_advance_ids)
+            )
+        )
+        return result.scalars().all()
 
     async def create_rs_advance(
         self, rs_advance: ReappraisalServiceAdvanceTable
     ) -> Optional[ReappraisalServiceAdvanceTable]:
-        return await self.dao.create_record(rs_advance)
+        await self._lock_services([rs_advance.reappraisal_service_id])
+        created = await self.dao.create_record(rs_advance, is_commit=False)
+        await self._commit_with_totals([created.reappraisal_service_id])
+        return created
 
     async def get_rs_advance(
         self, rs_advance_id: str
@@ -36,27 +75,85 @@ class ReappraisalServiceAdvanceDAO:
         rs_advance_id: str,
         rs_advance_update: SQLModel,
     ) -> Optional[ReappraisalServiceAdvanceTable]:
-        return await self.dao.update_record(rs_advance_id, rs_advance_update)
+        # The update may move the advance to another service; both totals change
+        previous_service_ids = await self._service_ids_of([rs_advance_id])
+        await self._lock_services(
+            [*previous_service_ids, *self._moved_to(rs_advance_update)]
+        )
+        updated = await self.dao.update_record(
+            rs_advance_id, rs_advance_update, is_commit=False
+        )
+        if updated is None:
+            return None
+        await self._commit_with_totals(
+            [*previous_service_ids, updated.reappraisal_service_id]
+        )
+        return updated
 
     async def delete_rs_advance(
         self, rs_advance_id: str, soft_del: bool = True
     ) -> bool:
+        await self._lock_services(await self._service_ids_of([rs_advance_id]))
         if soft_del:
-            return await self.dao.delete_record(
+            deleted = await self.dao.delete_record(
                 record_id=rs_advance_id,
                 field_name="deleted_at_epoch",
                 time=int(datetime.now().timestamp()),
+                is_commit=False,
             )
-        return await self.dao.delete_record(rs_advance_id)
+            service_ids = [deleted.reappraisal_service_id] if deleted else []
+        else:
+            service_ids = await self._service_ids_of([rs_advance_id])
+            deleted = await self.dao.delete_record(rs_advance_id, is_commit=False)
+        if deleted:
+            await self._commit_with_totals(service_ids)
+        return deleted
 
-    async def get_rs_advances(
-        self, query: BaseQueryParams
+    async def create_rs_advances(
+        self, rs_advances: List[ReappraisalServiceAdvanceTable]
+    ) -> List[ReappraisalServiceAdvanceTable]:
+        await self._lock_services(record.reappraisal_service_id for record in rs_advances)
+        created = await self.dao.create_records(rs_advances, is_commit=False)
+        await self._commit_with_totals(
+            record.reappraisal_service_id for record in created
+        )
+        return created
+
+    async def update_rs_advances(
+        self, reappraisal_service_id: str, rs_advance_updates: Dict[str, SQLModel]
     ) -> List[ReappraisalServiceAdvanceTable]:
-        return await self.dao.get_records(query)
+        await self._lock_services(
+            [reappraisal_service_id]
+            + [
+                service_id
+                for updates in rs_advance_updates.values()
+                for service_id in self._moved_to(updates)
+            ]
+        )
+        updated = await self.dao.update_records(
+            rs_advance_updates,
+            ReappraisalServiceAdvanceTable.reappraisal_service_id == reappraisal_service_id,
+            is_commit=False,
+        )
+        await self._commit_with_totals(
+            [reappraisal_service_id]
+            + [record.reappraisal_service_id for record in updated]
+        )
+        return updated
 
-    async def get_total_advance_amount(self, reappraisal_service_id: str) -> int:
-        return await self.dao.get_total(
-            amount_column=ReappraisalServiceAdvanceTable.rs_advance_amount,
-            filter_column=ReappraisalServiceAdvanceTable.reappraisal_service_id,
-            filter_value=reappraisal_service_id,
+    async def delete_rs_advances(
+        self, reappraisal_service_id: str, rs_advance_ids: List[str]
+    ) -> List[str]:
+        await self._lock_services([reappraisal_service_id])
+        deleted_ids = await self.dao.soft_delete_records(
+            rs_advance_ids,
+            ReappraisalServiceAdvanceTable.reappraisal_service_id == reappraisal_service_id,
+            is_commit=False,
         )
+        await self._commit_with_totals([reappraisal_service_id] if deleted_ids else [])
+        return deleted_ids
+
+    async def get_rs_advances(
+        self, query: BaseQueryParams
+    ) -> List[ReappraisalServiceAdvanceTable]:
+        return await self.dao.get_records_functionalities(query)
@@ -14,8 +14,32 @@ from app.api.services.search_filter.basequery import BaseQueryParams
 class AppraiserDAO:
     dao: DAO[AppraiserTable, str]
 
+    # Columns the direct appraiser listing renders
+    PROJECTIONS = {
+        "list": (
+            "appraiser_id",
+            "appraiser_full_name",
+            "appraiser_email",
+            "appraiser_phone",
+            "appraiser_pan",
+            "appraiser_address",
+            "appraiser_account_number",
+            "appraiser_account_ifsc_code",
+            "appraiser_bank_name",
+            "appraiser_branch_name",
+            "created_at_epoch",
+        ),
+    }
+
     def __init__(self, session: AsyncSession):
-        self.dao = DAO[AppraiserTable, str](session, AppraiserTable)
+        self.dao = DAO[AppraiserTable, str](
+            session, AppraiserTable, projections=self.PROJECTIONS
+        )
+
+    def with_projection(self, projection: str) -> "AppraiserDAO":
+        """Lists only the fields of the named PROJECTIONS entry, as plain rows."""
+        self.dao = self.dao.with_projection(projection)
+        return self
 
     async def create_appraiser(
         self, appraiser: AppraiserTable
@@ -25,6 +49,9 @@ class AppraiserDAO:
     async def get_appraiser(self, appraiser_id: str) -> Optional[AppraiserTable]:
         return await self.dao.get_record_id(appraiser_id)
 
+    async def get_appraisers_by_ids(self, appraiser_ids: List[str]) -> List[AppraiserTable]:
+        return await self.dao.get_records_by_ids(appraiser_ids)
+
     async def update_appraiser(
         self, appraiser_id: str, appraiser_update: SQLModel
     ) -> Optional[AppraiserTable]:
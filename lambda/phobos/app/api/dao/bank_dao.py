@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 from sqlalchemy import select, func
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -10,13 +10,43 @@ from ..model.bank.bank_create import BankCreateResponse
 from ..dao.dao import DAO
 from ..services.search_filter.basequery import BaseQueryParams
 from ..services.search_filter.matchtype_enum import MatchTypeEnum
+from ..services.pagination.pagination import PaginationResponse
+from ..services.reference_cache.reference_cache import MISSING, reference_cache
 
 
 class BankDao:
     dao: DAO[BankTable, int]
 
+    # Bank responses never render branches or services
+    LOAD_PROFILES = {"list": (), "detail": ()}
+
+    # Columns the bank listing renders (see BankGetResponse.from_db_record)
+    PROJECTIONS = {
+        "list": (
+            "bank_id",
+            "bank_name",
+            "bank_code",
+            "bank_head_office_address",
+            "bank_contact_email",
+            "bank_contact_number",
+            "created_at_epoch",
+        ),
+    }
+
     def __init__(self, session: AsyncSession):
-        self.dao = DAO[BankTable, int](session, BankTable)
+        self.dao = DAO[BankTable, int](
+            session, BankTable, self.LOAD_PROFILES, self.PROJECTIONS
+        )
+
+    def with_profile(self, profile: str) -> "BankDao":
+        """Loads only the relationships of the named LOAD_PROFILES entry."""
+        self.dao = self.dao.with_profile(profile)
+        return self
+
+    def with_projection(self, projection: str) -> "BankDao":
+        """Lists only the fields of the named PROJECTIONS entry, as plain rows."""
+        self.dao = self.dao.with_projection(projection)
+        return self
 
     async def create_bank(self, bank: BankTable) -> Optional[BankCreateResponse]:
         bank_record = await self.dao.create_record(bank)
@@ -25,11 +55,28 @@ class BankDao:
         return None
 
     async def get_bank(self, bank_id: int) -> Optional[BankGetResponse]:
+        """Read through the reference cache; the bank controller invalidates it on writes."""
+        bank_response = reference_cache.get(BankTable.__tablename__, bank_id)
+        if bank_response is not MISSING:
+            return bank_response
         bank_record = await self.dao.get_record_id(bank_id)
         if bank_record:
-            return BankGetResponse.from_db_record(bank_record)
+            bank_response = BankGetResponse.from_db_record(bank_record)
+            reference_cache.set(BankTable.__tablename__, bank_id, bank_response)
+            return bank_response
         return None
 
+    async def get_banks_by_ids(self, bank_ids: List[int]) -> List[BankGetResponse]:
+        """Live banks in input order; the ones not in the reference cache are fetched in one query."""
+
+        async def load(missing_ids: List[str]) -> dict:
+            return {
+                bank_record.bank_id: BankGetResponse.from_db_record(bank_record)
+                for bank_record in await self.dao.get_records_by_ids(missing_ids)
+            }
+
+        return await reference_cache.get_many(BankTable.__tablename__, bank_ids, load)
+
     async def update_bank(
         self, bank_id: int, bank_updates: SQLModel
     ) -> Optional[BankGetResponse]:
@@ -47,9 +94,10 @@ class BankDao:
             )
         return await self.dao.delete_record(bank_id)
 
-    async def get_banks(self, query: BaseQueryParams) -> List[BankGetResponse]:
-        bank_records = await self.dao.get_records(query)
-        return [BankGetResponse.from_db_record(bank) for bank in bank_records]
+    async def get_banks(
+        self, query: BaseQueryParams
+    ) -> Union[List[BankTable], PaginationResponse[BankTable]]:
+        return await self.dao.get_records_functionalities(query)
 
     async def count_branches(self, bank_id: int) -> int:
         """Count the number of branches for a given bank using back-population."""
@@ -8,13 +8,43 @@ from ..model.branch.branch_table import BranchTable
 from ..model.reappraisal_service.reappraisal_service_table import ReappraisalServiceTable
 from ..model.enum.reappraisal_service_status_enum import ReappraisalServiceStatusEnum
 from  ..dao.dao import DAO
+from ..services.reference_cache.reference_cache import reference_cache
 
 
 class BranchDao:
     dao: DAO[BranchTable, str]
 
+    # Branch responses never render their bank or services
+    LOAD_PROFILES = {"list": (), "detail": ()}
+
+    # Columns the branch listing renders (see BranchGetResponse.from_db_record)
+    PROJECTIONS = {
+        "list": (
+            "branch_id",
+            "branch_bank_id",
+            "branch_name",
+            "branch_sol_id",
+            "branch_address",
+            "branch_phone",
+            "branch_email",
+            "created_at_epoch",
+        ),
+    }
+
     def __init__(self, session: AsyncSession):
-        self.dao = DAO[BranchTable, str](session, BranchTable)
+        self.dao = DAO[BranchTable, str](
+            session, BranchTable, self.LOAD_PROFILES, self.PROJECTIONS
+        )
+
+    def with_profile(self, profile: str) -> "BranchDao":
+        """Loads only the relationships of the named LOAD_PROFILES entry."""
+        self.dao = self.dao.with_profile(profile)
+        return self
+
+    def with_projection(self, projection: str) -> "BranchDao":
+        """Lists only the fields of the named PROJECTIONS entry, as plain rows."""
+        self.dao = self.dao.with_projection(projection)
+        return self
 
     async def create_branch(self, branch: BranchTable) -> Optional[BranchTable]:
         return await self.dao.create_record(branch)
@@ -22,7 +52,26 @@ class BranchDao:
     async def get_branch_by_id_or_ids(
         self, branch_ids: Union[str, List[str]]
     ) -> Union[Optional[BranchTable], List[BranchTable]]:
-        return await self.dao.get_record_id(branch_ids)
+        """
+        One branch, or the live branches of a list of ids in input order. Both
+        read through the reference cache, which holds session-free copies of
+        the branch columns; the branch controller invalidates it on writes.
+        """
+
+        async def load(missing_ids: List[str]) -> dict:
+            return {
+                branch_record.branch_id: BranchTable(**branch_record.model_dump())
+                for branch_record in await self.dao.get_records_by_ids(missing_ids)
+            }
+
+        if isinstance(branch_ids, list):
+            return await reference_cache.get_many(
+                BranchTable.__tablename__, branch_ids, load
+            )
+        branches = await reference_cache.get_many(
+            BranchTable.__tablename__, [branch_ids], load
+        )
+        return branches[0] if branches else None
 
     async def update_branch(
         self, branch_id: str, branch_updates: SQLModel
@@ -41,7 +90,7 @@ class BranchDao:
         return await self.dao.delete_record(branch_id)
 
     async def get_branches(self, query: BaseQueryParams) -> List[BranchTable]:
-        return await self.dao.get_records(query)
+        return await self.dao.get_records_functionalities(query)
 
     async def count_active_reappraisal_services(self, branch_id: str) -> int:
         """Count active reappraisal services for a given branch"""
@@ -1,12 +1,46 @@
+from copy import copy
+from datetime import datetime
 from math import ceil
-from sqlalchemy import func
-from typing import Any, Generic, List, Optional, Tuple, Type, TypeVar, Union
+from sqlalchemy import ARRAY, any_, bindparam, delete, func, insert, tuple_, update
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from sqlmodel import SQLModel, and_, inspect, or_, select, cast, String
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.services.search_filter.basequery import BaseQueryParams
-from app.api.services.search_filter.searchfilter import T, DAOFilterSearchParam, MatchTypeEnum
-from app.api.services.pagination.pagination import PaginationData, PaginationResponse
-from sqlalchemy.orm import class_mapper, selectinload
+from app.api.services.search_filter.searchfilter import (
+    T,
+    DAOFilterSearchParam,
+    MatchTypeEnum,
+    filter_bind_params,
+    filter_shape,
+    projection_statement,
+    rank_bind_name,
+    selects_entity,
+)
+from app.api.services.search_filter.statement_cache import statement_cache
+from app.api.services.pagination.pagination import (
+    PaginationData,
+    PaginationResponse,
+    decode_cursor,
+    encode_cursor,
+)
+from app.api.services.pagination.count_cache import (
+    count_cache,
+    fingerprint_statement,
+    statement_tables,
+)
+from app.api.exceptions.searchfilter_exception import BadRequestException
+from sqlalchemy.orm import class_mapper, noload, selectinload
 
 DAOModel = TypeVar("DAOModel", bound=SQLModel)
 DAORecordId = TypeVar("DAORecordId")
@@ -17,76 +51,387 @@ class DAO(Generic[DAOModel, DAORecordId]):
     session: AsyncSession
     model_class: type[DAOModel]
 
-    def __init__(self, session: AsyncSession, model_class: type[DAOModel]):
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_class: type[DAOModel],
+        load_profiles: Optional[Dict[str, Tuple[str, ...]]] = None,
+        projections: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ):
         self.session = session
         self.model_class = model_class
+        # Relationships each endpoint renders, keyed by profile name
+        self.load_profiles = load_profiles or {}
+        self.load_profile: Optional[str] = None
+        self.load_options: Optional[list] = None
+        # Field lists listing endpoints render, keyed by projection name
+        self.projections = projections or {}
+        self.projection: Optional[str] = None
+
+    def with_profile(self, profile: str) -> "DAO[DAOModel, DAORecordId]":
+        """
+        Copy of this DAO whose reads load only the relationships listed for
+        `profile` and skip every other one, instead of following the mapper's
+        lazy="selectin" defaults down the whole relationship graph.
+        """
+        if profile not in self.load_profiles:
+            raise ValueError(
+                f"Unknown load profile '{profile}' for {self.model_class.__name__}"
+            )
+        dao = copy(self)
+        dao.load_profile = profile
+        dao.load_options = [
+            selectinload(getattr(self.model_class, relationship)).noload("*")
+            for relationship in self.load_profiles[profile]
+        ] + [noload("*")]
+        return dao
+
+    def with_projection(self, projection: str) -> "DAO[DAOModel, DAORecordId]":
+        """
+        Copy of this DAO whose listings select only the fields named by
+        `projection` (own or related columns, see field_resolution) and
+        return plain rows instead of ORM objects. Include the primary key and
+        the sort key in a projection used with cursor pagination.
+        """
+        if projection not in self.projections:
+            raise ValueError(
+                f"Unknown projection '{projection}' for {self.model_class.__name__}"
+            )
+        dao = copy(self)
+        dao.projection = projection
+        return dao
+
+    def _base_statement(self, joined_rels: set[str]) -> select:
+        if self.projection is not None:
+            return projection_statement(
+                self.model_class, self.projections[self.projection], joined_rels
+            )
+        return select(self.model_class)
+
+    def _write_options(self) -> list:
+        # Written rows load only the active profile's relationships (none by default)
+        return self.load_options if self.load_options is not None else [noload("*")]
+
+    def _returning(self, stmt, **returning_kw):
+        """
+        Makes a write statement return the written rows as model objects,
+        overwriting any already in the session.
+        """
+        return (
+            stmt.returning(self.model_class, **returning_kw)
+            .options(*self._write_options())
+            .execution_options(populate_existing=True)
+        )
+
+    def _primary_key(self):
+        return class_mapper(self.model_class).primary_key[0]
+
+    def _insert_values(self, record: DAOModel) -> dict:
+        mapper = class_mapper(self.model_class)
+        values = {
+            attr.key: getattr(record, attr.key)
+            for attr in mapper.column_attrs
+            # Generated columns are computed by the database and cannot be written
+            if attr.columns[0].computed is None
+        }
+        # Leave unset primary keys to the database, as a flush would
+        for column in mapper.primary_key:
+            key = mapper.get_property_by_column(column).key
+            if values.get(key) is None:
+                values.pop(key, None)
+        return values
+
+    def _update_values(self, record_updates: SQLModel) -> dict:
+        columns = class_mapper(self.model_class).column_attrs.keys()
+        return {
+            key: value
+            for key, value in record_updates.model_dump(exclude_unset=True).items()
+            if key in columns
+        }
 
     async def create_record(self, record: DAOModel, is_commit: bool = True) -> DAOModel:
-        self.session.add(record)
+        """
+        Stores `record` with a single INSERT ... RETURNING and returns the
+        stored row, database-generated values included.
+        """
+        stmt = self._returning(
+            insert(self.model_class).values(self._insert_values(record))
+        )
+        created = (await self.session.exec(stmt)).scalars().one()
         if is_commit:
             await self.session.commit()
-            await self.session.refresh(record)
-        return record
+        count_cache.invalidate(self.model_class.__tablename__)
+        return created
 
     async def get_record_id(self, record_id: DAORecordId) -> Optional[DAOModel]:
-        result = await self.session.get(self.model_class, record_id)
+        result = await self.session.get(
+            self.model_class, record_id, options=self.load_options
+        )
         if not result:
             return None
         if result.deleted_at_epoch == -1:
             return result
 
+    async def get_records_by_ids(self, record_ids: List[Any]) -> List[DAOModel]:
+        """
+        Fetches the live records with the given ids in one
+        SELECT ... WHERE pk = ANY(:ids) and returns them in input order, once
+        per id. Ids are coerced to the key's type; ids with no live record
+        are skipped. A projection used here must include the primary key.
+        """
+        pk_column = self._primary_key()
+        pk_attr = class_mapper(self.model_class).get_property_by_column(pk_column).key
+        keys = {}
+        for record_id in record_ids:
+            try:
+                keys.setdefault(pk_column.type.python_type(record_id))
+            except (TypeError, ValueError):
+                continue
+        if not keys:
+            return []
+
+        stmt = self._base_statement(set()).where(
+            pk_column
+            == any_(bindparam("record_ids", list(keys), type_=ARRAY(pk_column.type))),
+            self.model_class.deleted_at_epoch == -1,
+        )
+        if self.load_options is not None and self.projection is None:
+            stmt = stmt.options(*self.load_options)
+        records = {
+            getattr(record, pk_attr): record
+            for record in (await self.session.exec(stmt)).all()
+        }
+        return [records[key] for key in keys if key in records]
+
     async def get_records(self, include_deleted: bool = False) -> List[DAOModel]:
-        query = select(self.model_class)
+        query = self._base_statement(set())
 
         # Exclude soft-deleted records unless include_deleted=True
         if not include_deleted and hasattr(self.model_class, "deleted_at_epoch"):
             query = query.where(self.model_class.deleted_at_epoch == -1)
 
+        if self.load_options is not None and self.projection is None:
+            query = query.options(*self.load_options)
+
         result = await self.session.exec(query)
         return result.all()
     
     async def update_record(
-        self, record_id: DAORecordId, record_updates: SQLModel
+        self, record_id: DAORecordId, record_updates: SQLModel, is_commit: bool = True
     ) -> Optional[DAOModel]:
-        record = await self.get_record_id(record_id)
-        if record:
-            record_data = record_updates.model_dump(exclude_unset=True)
-            for key, value in record_data.items():
-                setattr(record, key, value)
+        """
+        Applies the set fields of `record_updates` with a single
+        UPDATE ... RETURNING on a live (not soft-deleted) record. Returns None
+        when no such record exists.
+        """
+        values = {
+            getattr(self.model_class, key): value
+            for key, value in self._update_values(record_updates).items()
+        }
+        if not values:
+            return await self.get_record_id(record_id)
+
+        stmt = self._returning(
+            update(self.model_class)
+            .where(
+                self._primary_key() == record_id,
+                self.model_class.deleted_at_epoch == -1,
+            )
+            .values(values)
+        )
+        record = (await self.session.exec(stmt)).scalars().one_or_none()
+        if record is None:
+            return None
+        if is_commit:
             await self.session.commit()
-            await self.session.refresh(record)
+        count_cache.invalidate(self.model_class.__tablename__)
         return record
 
     async def delete_record(
         self,
         record_id: DAORecordId,
-        field_name: DAORecordId,
-        time: Any,
+        field_name: Optional[str] = None,
+        time: Any = None,
         is_commit: bool = True,
-    ) -> bool:
-        record = await self.get_record_id(record_id)
-        if record:
-            if field_name and time:
-                if hasattr(record, field_name):
-                    setattr(record, field_name, time)
-                    if is_commit:
-                        await self.session.commit()
-                        await self.session.refresh(record)
-                    return record
-            else:
-                await self.session.delete(record)
-                if is_commit:
-                    await self.session.commit()
-                return True
-        return False
+    ) -> Union[DAOModel, bool]:
+        """
+        Soft-deletes by setting `field_name` to `time` (UPDATE ... RETURNING),
+        or hard-deletes without them (DELETE ... RETURNING). Either way it is
+        one statement on a live record; False when there is none.
+        """
+        live = and_(
+            self._primary_key() == record_id, self.model_class.deleted_at_epoch == -1
+        )
+        if field_name and time:
+            if not hasattr(self.model_class, field_name):
+                return False
+            stmt = self._returning(
+                update(self.model_class)
+                .where(live)
+                .values({getattr(self.model_class, field_name): time})
+            )
+            deleted = (await self.session.exec(stmt)).scalars().one_or_none()
+        else:
+            stmt = delete(self.model_class).where(live).returning(self._primary_key())
+            deleted = (await self.session.exec(stmt)).first() is not None
+
+        if not deleted:
+            return False
+        if is_commit:
+            await self.session.commit()
+        count_cache.invalidate(self.model_class.__tablename__)
+        return deleted
+
+    async def create_records(
+        self, records: List[DAOModel], is_commit: bool = True
+    ) -> List[DAOModel]:
+        """
+        Stores `records` with one multi-row INSERT ... RETURNING in a single
+        transaction and returns the stored rows in input order.
+        """
+        if not records:
+            return []
+        stmt = self._returning(insert(self.model_class), sort_by_parameter_order=True)
+        result = await self.session.exec(
+            stmt, params=[self._insert_values(record) for record in records]
+        )
+        created = result.scalars().all()
+        if is_commit:
+            await self.session.commit()
+        count_cache.invalidate(self.model_class.__tablename__)
+        return created
+
+    async def update_records(
+        self,
+        record_updates: Dict[DAORecordId, SQLModel],
+        *conditions,
+        is_commit: bool = True,
+    ) -> List[DAOModel]:
+        """
+        Applies each update to its live record in one transaction: one SELECT
+        of the live ids matching `conditions`, one executemany UPDATE by
+        primary key and one SELECT of the results. Ids with no live record
+        are skipped and missing from the returned list.
+        """
+        if not record_updates:
+            return []
+        pk_column = self._primary_key()
+        pk_attr = class_mapper(self.model_class).get_property_by_column(pk_column).key
+        live = and_(
+            pk_column.in_(list(record_updates)),
+            self.model_class.deleted_at_epoch == -1,
+            *conditions,
+        )
+        live_ids = set((await self.session.exec(select(pk_column).where(live))).all())
+        if not live_ids:
+            return []
+
+        rows = []
+        for record_id, updates in record_updates.items():
+            values = self._update_values(updates)
+            if record_id in live_ids and values:
+                rows.append({pk_attr: record_id, **values})
+        if rows:
+            await self.session.exec(update(self.model_class), params=rows)
+
+        result = await self.session.exec(
+            select(self.model_class)
+            .where(pk_column.in_(live_ids))
+            .options(*self._write_options())
+            .execution_options(populate_existing=True)
+        )
+        updated = result.all()
+        if is_commit:
+            await self.session.commit()
+        count_cache.invalidate(self.model_class.__tablename__)
+        return updated
+
+    async def soft_delete_records(
+        self,
+        record_ids: List[DAORecordId],
+        *conditions,
+        field_name: str = "deleted_at_epoch",
+        time: Optional[int] = None,
+        is_commit: bool = True,
+    ) -> List[DAORecordId]:
+        """
+        Soft-deletes every live record in `record_ids` matching `conditions`
+        with one UPDATE ... RETURNING and returns the ids it deleted.
+        """
+        if not record_ids:
+            return []
+        pk_column = self._primary_key()
+        deleted_at = time or int(datetime.now().timestamp())
+        stmt = (
+            update(self.model_class)
+            .where(
+                pk_column.in_(record_ids),
+                self.model_class.deleted_at_epoch == -1,
+                *conditions,
+            )
+            .values({getattr(self.model_class, field_name): deleted_at})
+            .returning(pk_column)
+        )
+        deleted_ids = (await self.session.exec(stmt)).scalars().all()
+        if is_commit:
+            await self.session.commit()
+        count_cache.invalidate(self.model_class.__tablename__)
+        return deleted_ids
 
     async def get_records_functionalities(
-        self, query: BaseQueryParams
+        self,
+        query: BaseQueryParams,
+        stmt: Optional[select] = None,
+        cache_key: Optional[str] = None,
     ) -> Union[List[T], PaginationResponse[T]]:
-        stmt = select(self.model_class)
-        filters = []
-        joined_rels: set[Type[SQLModel]] = set()
+        """
+        Applies the search filters in `query` and returns the matching records.
+        A custom base `stmt` (e.g. one selecting extra joined columns) can be
+        passed instead of the default `select(model_class)`; give it a
+        `cache_key` naming that base statement to let its filtered templates
+        be cached too.
+        """
+        stmt, params = await self._filtered_statement(query, stmt, cache_key)
+        return await self._fetch(stmt, query, params)
+
+    async def stream_records(
+        self,
+        query: BaseQueryParams,
+        stmt: Optional[select] = None,
+        cache_key: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Yields the records matching the filters in `query` in batches of
+        `batch_size`, read through a server-side cursor so memory stays flat
+        whatever the row count. Pagination in `query` is ignored; rows come
+        in (sort_key, primary key) order. `stmt` and `cache_key` are as for
+        get_records_functionalities.
+        """
+        if not hasattr(self.model_class, query.sort_key):
+            raise BadRequestException(error_details={"sort_key": query.sort_key})
+        stmt, params = await self._filtered_statement(query, stmt, cache_key)
+        stmt = stmt.order_by(
+            getattr(self.model_class, query.sort_key), self._primary_key()
+        )
+        result = await self.session.stream(
+            stmt, params=params, execution_options={"yield_per": batch_size}
+        )
+        async for rows in result.partitions():
+            yield rows
 
+    async def _filtered_statement(
+        self,
+        query: BaseQueryParams,
+        stmt: Optional[select] = None,
+        cache_key: Optional[str] = None,
+    ) -> Tuple[select, dict]:
+        """
+        The statement applying the search filters in `query`, and the values
+        bound to its filter parameters. Statements are cached as templates by
+        the filters they apply, never by their values.
+        """
+        active_filters = []
         for value, field_info in zip(query.search_values, query.fields):
             if value is None or (isinstance(value, str) and not value.strip()):
                 continue
@@ -103,13 +448,61 @@ class DAO(Generic[DAOModel, DAORecordId]):
                 # Single string field
                 field, match_type = field_info, MatchTypeEnum.EXACT
 
+            bind_name = f"filter_{len(active_filters)}"
+            active_filters.append((bind_name, field, match_type, value))
+
+        params = {}
+        for bind_name, _, match_type, value in active_filters:
+            params.update(filter_bind_params(bind_name, match_type, value))
+
+        # A similarity order would break the keyset order cursors seek on
+        rank = query.rank_by_similarity and not (query.size and not query.page)
+        if rank:
+            params.update(
+                (rank_bind_name(bind_name), value.strip())
+                for bind_name, _, match_type, value in active_filters
+                if match_type == MatchTypeEnum.PARTIAL and isinstance(value, str)
+            )
+
+        template_key = None
+        if stmt is None or cache_key is not None:
+            template_key = (
+                self.model_class,
+                cache_key,
+                self.load_profile,
+                self.projection,
+                tuple(
+                    (field, match_type, filter_shape(match_type, value))
+                    for _, field, match_type, value in active_filters
+                ),
+                rank,
+            )
+            template = statement_cache.get(template_key)
+            if template is not None:
+                return template, params
+
+        joined_rels: set[str] = set()
+        if stmt is None:
+            stmt = self._base_statement(joined_rels)
+        if self.load_options is not None and selects_entity(stmt, self.model_class):
+            stmt = stmt.options(*self.load_options)
+        filters = []
+        ranks = []
+
+        for bind_name, field, match_type, value in active_filters:
             condition = None
 
             # --- Apply filter based on MatchTypeEnum ---
             if match_type == MatchTypeEnum.EPOCH_RANGE:
                 start_field, end_field = field
                 stmt, condition = await DAOFilterSearchParam.epoch_date(
-                    stmt, self.model_class, value, start_field, end_field, joined_rels
+                    stmt,
+                    self.model_class,
+                    value,
+                    start_field,
+                    end_field,
+                    joined_rels,
+                    bind_name,
                 )
 
             elif match_type == MatchTypeEnum.FILE_PATH_STATUS:
@@ -126,8 +519,12 @@ class DAO(Generic[DAOModel, DAORecordId]):
                     value=value,
                     stmt=stmt,
                     joined_rels=joined_rels,
+                    bind_name=bind_name,
+                    rank=rank,
                 )
                 stmt, condition = await filter_obj.generic_filter()
+                if filter_obj.rank_expression is not None:
+                    ranks.append(filter_obj.rank_expression)
 
             if condition is not None:
                 filters.append(condition)
@@ -139,14 +536,44 @@ class DAO(Generic[DAOModel, DAORecordId]):
         if filters:
             stmt = stmt.where(and_(*filters))
 
+        if ranks:
+            stmt = stmt.order_by(func.greatest(*ranks).desc())
+
+        if template_key is not None:
+            statement_cache.set(template_key, stmt)
+
+        return stmt, params
+
+    async def _fetch(
+        self, stmt: select, query: BaseQueryParams, params: dict
+    ) -> Union[List[T], PaginationResponse[T]]:
+        """Runs a filtered statement with its bound filter values, paginated as asked."""
         # Pagination
         if getattr(query, "page", None) and getattr(query, "size", None):
-            return await self.paginate(stmt, query.page, query.size)
+            include_total = query.include_total is not False
+            return await self.paginate(
+                stmt, query.page, query.size, include_total, params, query.sort_key
+            )
+
+        if getattr(query, "size", None):
+            return await self.cursor_paginate(
+                stmt,
+                query.size,
+                query.after,
+                query.sort_key,
+                bool(query.include_total),
+                params,
+            )
 
-        result = await self.session.exec(stmt)
+        result = await self.session.exec(stmt, params=params)
         items = result.unique().all()
+        if self.load_profile is not None:
+            return items
+
         # Force relationship loading while session is active
         for item in items:
+            if not isinstance(item, self.model_class):
+                continue
             for relationship_name in class_mapper(
                 self.model_class
             ).relationships.keys():
@@ -162,19 +589,36 @@ class DAO(Generic[DAOModel, DAORecordId]):
         stmt: select,
         page: int,
         size: int,
+        include_total: bool = True,
+        params: Optional[dict] = None,
+        sort_key: str = "created_at_epoch",
     ) -> PaginationResponse[Any]:
+        """
+        Page/offset pagination. Pages follow the similarity rank when a
+        ranked search ordered the statement, else sort_key, with the primary
+        key breaking ties so no row repeats or goes missing between pages.
+        """
+        if not hasattr(self.model_class, sort_key):
+            raise BadRequestException(error_details={"sort_key": sort_key})
 
         # count total
-        count_query = select(func.count()).select_from(stmt.subquery())
-        total_count = (await self.session.exec(count_query)).one()
+        total_count = total_pages = None
+        if include_total:
+            total_count = await self.count(stmt, params)
+            total_pages = ceil(total_count / size) if size else 1
 
         # fetch page
         offset = (page - 1) * size
-        result = await self.session.exec(stmt.limit(size).offset(offset))
-
-        total_pages = ceil(total_count / size) if size else 1
+        if stmt._order_by_clauses:
+            # Already ordered by the search rank
+            stmt = stmt.order_by(self._primary_key())
+        else:
+            stmt = stmt.order_by(getattr(self.model_class, sort_key), self._primary_key())
+        result = await self.session.exec(
+            stmt.limit(size).offset(offset), params=params
+        )
 
-        return PaginationResponse(
+        return PaginationResponse[Any](
             items=result.all(),
             pagination_data=PaginationData(
                 total_data=total_count,
@@ -184,6 +628,76 @@ class DAO(Generic[DAOModel, DAORecordId]):
             ),
         )
 
+    async def cursor_paginate(
+        self,
+        stmt: select,
+        size: int,
+        after: Optional[str] = None,
+        sort_key: str = "created_at_epoch",
+        include_total: bool = False,
+        params: Optional[dict] = None,
+    ) -> PaginationResponse[Any]:
+        """
+        Keyset pagination ordered by (sort_key, primary key). Seeks past the
+        `after` cursor with a row-value comparison, so every page costs the
+        same regardless of depth, and no total count is run.
+        """
+        if not hasattr(self.model_class, sort_key):
+            raise BadRequestException(error_details={"sort_key": sort_key})
+
+        pagination_data = None
+        if include_total:
+            pagination_data = PaginationData(
+                total_data=await self.count(stmt, params), size=size
+            )
+
+        mapper = class_mapper(self.model_class)
+        pk_column = mapper.primary_key[0]
+        pk_attr = mapper.get_property_by_column(pk_column).key
+        sort_column = getattr(self.model_class, sort_key)
+
+        if after:
+            sort_value, record_id = decode_cursor(after)
+            stmt = stmt.where(tuple_(sort_column, pk_column) > tuple_(sort_value, record_id))
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.session.exec(
+            stmt.order_by(sort_column, pk_column).limit(size + 1), params=params
+        )
+        items = result.all()
+
+        next_cursor = None
+        if len(items) > size:
+            items = items[:size]
+            last = items[-1]
+            # Entity rows carry the model first; projections carry the labels
+            record = last
+            if not isinstance(last, self.model_class) and isinstance(
+                last[0], self.model_class
+            ):
+                record = last[0]
+            next_cursor = encode_cursor(
+                getattr(record, sort_key), getattr(record, pk_attr)
+            )
+
+        return PaginationResponse[Any](
+            items=items, pagination_data=pagination_data, next_cursor=next_cursor
+        )
+
+    async def count(self, stmt: select, params: Optional[dict] = None) -> int:
+        """
+        Total rows matched by a filtered statement. Served from the count
+        cache when the same filter was counted recently; writes through this
+        DAO invalidate the cached counts of their table.
+        """
+        key = fingerprint_statement(stmt, params)
+        total_count = count_cache.get(key)
+        if total_count is None:
+            count_query = select(func.count()).select_from(stmt.subquery())
+            total_count = (await self.session.exec(count_query, params=params)).one()
+            count_cache.set(key, total_count, statement_tables(stmt))
+        return total_count
+
     async def build_s3_key_prefix(
         appraiser_id: str,
         reappraisal_service_id: str,
@@ -207,11 +721,3 @@ class DAO(Generic[DAOModel, DAORecordId]):
             raise ValueError(
                 f"Invalid category '{category}' or missing reimbursement_id"
             )
-
-    async def get_total(self, amount_column, filter_column, filter_value) -> int:
-        result = await self.session.exec(
-            select(func.coalesce(func.sum(amount_column), 0)).where(
-                filter_column == filter_value, self.model_class.deleted_at_epoch == -1
-            )
-        )
-        return result.first()
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import func, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.dao.dao import DAO
+from app.api.model.document.document_table import DocumentTable
+
+
+class DocumentDAO:
+    dao: DAO[DocumentTable, str]
+
+    def __init__(self, session: AsyncSession):
+        self.dao = DAO[DocumentTable, str](session, DocumentTable)
+
+    def _live(self, key: str):
+        return (
+            DocumentTable.document_key == key,
+            DocumentTable.deleted_at_epoch == -1,
+        )
+
+    async def get_document_by_key(self, key: str) -> Optional[DocumentTable]:
+        result = await self.dao.session.exec(select(DocumentTable).where(*self._live(key)))
+        return result.scalars().one_or_none()
+
+    async def get_documents_by_sha256(self, sha256: str) -> List[DocumentTable]:
+        """Live documents with the given contents, oldest first."""
+        result = await self.dao.session.exec(
+            select(DocumentTable)
+            .where(
+                DocumentTable.document_sha256 == sha256,
+                DocumentTable.deleted_at_epoch == -1,
+            )
+            .order_by(DocumentTable.created_at_epoch)
+        )
+        return result.scalars().all()
+
+    async def record_document(self, document: DocumentTable) -> DocumentTable:
+        """
+        Catalogs a stored object. An object written over an existing key
+        replaces that key's document.
+        """
+        await self.delete_document_by_key(document.document_key, is_commit=False)
+        return await self.dao.create_record(document)
+
+    async def delete_document_by_key(self, key: str, is_commit: bool = True) -> bool:
+        result = await self.dao.session.exec(
+            update(DocumentTable)
+            .where(*self._live(key))
+            .values(deleted_at_epoch=int(datetime.now().timestamp()))
+            .returning(DocumentTable.document_id)
+        )
+        deleted = result.first() is not None
+        if is_commit:
+            await self.dao.session.commit()
+        return deleted
+
+    async def storage_usage(self) -> List[tuple]:
+        """(owner type, documents, bytes) of the live documents per owner type."""
+        result = await self.dao.session.exec(
+            select(
+                DocumentTable.document_owner_type,
+                func.count(),
+                func.coalesce(func.sum(DocumentTable.document_size), 0),
+            )
+            .where(DocumentTable.deleted_at_epoch == -1)
+            .group_by(DocumentTable.document_owner_type)
+            .order_by(DocumentTable.document_owner_type)
+        )
+        return result.all()
@@ -1,37 +1,158 @@
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import select
+from functools import cache
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence, Union
+from sqlalchemy import BigInteger, String, cast, func, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.model.reappraisal_service.reappraisal_service_table import (
+    BookingCondition,
+    BookingConstraint,
     ReappraisalServiceTable,
 )
+from app.api.model.general.epoch_range import epoch_range
+from app.api.model.appraiser.appraiser_table import AppraiserTable
+from app.api.model.bank.bank_table import BankTable
+from app.api.model.branch.branch_table import BranchTable
+from app.api.model.advance.advance_table import ReappraisalServiceAdvanceTable
+from app.api.model.reimbursement.reimbursement_table import (
+    ReappraisalServiceReimbursementTable,
+)
 from app.api.dao.dao import DAO
 from app.api.services.search_filter.basequery import BaseQueryParams
+from app.api.services.pagination.pagination import PaginationResponse
+from app.api.services.pagination.count_cache import count_cache
+from app.api.exceptions.reappraisal_service_exception import (
+    AppraiserDoubleBookedAPIException,
+    ReappraisalServiceNotFoundAPIException,
+)
 
 
 class ReappraisalServiceDAO:
     dao: DAO[ReappraisalServiceTable, str]
 
+    # Relationships each endpoint renders; everything else is not loaded
+    LOAD_PROFILES = {
+        "list": (),
+        "detail": ("appraiser", "reimbursements", "advances"),
+        "pdf": ("appraiser",),
+        "file": (),
+        "write": (),
+    }
+
     def __init__(self, session: AsyncSession):
-        self.dao = DAO[ReappraisalServiceTable, str](session, ReappraisalServiceTable)
+        self.dao = DAO[ReappraisalServiceTable, str](
+            session, ReappraisalServiceTable, self.LOAD_PROFILES
+        )
+
+    def with_profile(self, profile: str) -> "ReappraisalServiceDAO":
+        """Loads only the relationships of the named LOAD_PROFILES entry."""
+        self.dao = self.dao.with_profile(profile)
+        return self
 
     async def create_reappraisal_service(
         self, reappraisal_service: ReappraisalServiceTable
     ) -> Optional[ReappraisalServiceTable]:
-        return await self.dao.create_record(reappraisal_service)
+        try:
+            return await self.dao.create_record(reappraisal_service)
+        except IntegrityError as e:
+            await self._raise_if_double_booked(
+                e,
+                reappraisal_service.rs_appraiser_id,
+                reappraisal_service.rs_start_epoch,
+                reappraisal_service.rs_end_epoch,
+            )
+            raise
 
     async def get_reappraisal_service(
         self, reappraisal_service_id: str
     ) -> Optional[ReappraisalServiceTable]:
         return await self.dao.get_record_id(reappraisal_service_id)
 
+    async def get_reappraisal_services_by_ids(
+        self, reappraisal_service_ids: List[str]
+    ) -> List[ReappraisalServiceTable]:
+        return await self.dao.get_records_by_ids(reappraisal_service_ids)
+
     async def update_reappraisal_service(
         self, reappraisal_service_id: str, reappraisal_service_update: SQLModel
     ) -> Optional[ReappraisalServiceTable]:
-        return await self.dao.update_record(
-            reappraisal_service_id, reappraisal_service_update
+        try:
+            return await self.dao.update_record(
+                reappraisal_service_id, reappraisal_service_update
+            )
+        except IntegrityError as e:
+            if BookingConstraint not in str(e.orig):
+                raise
+            await self.dao.session.rollback()
+            record = await self.dao.get_record_id(reappraisal_service_id)
+            if record is None:
+                # Deleted since the update was attempted
+                raise ReappraisalServiceNotFoundAPIException(reappraisal_service_id) from e
+            changes = reappraisal_service_update.model_dump(exclude_unset=True)
+            await self._raise_if_double_booked(
+                e,
+                changes.get("rs_appraiser_id", record.rs_appraiser_id),
+                changes.get("rs_start_epoch", record.rs_start_epoch),
+                changes.get("rs_end_epoch", record.rs_end_epoch),
+                reappraisal_service_id,
+            )
+            raise
+
+    async def get_appraiser_bookings(
+        self, appraiser_id: Any, from_epoch: int, to_epoch: int
+    ) -> List[Any]:
+        """
+        (reappraisal_service_id, rs_start_epoch, rs_end_epoch) rows of the
+        appraiser's services overlapping [from_epoch, to_epoch], earliest
+        first. Served by the GiST index behind the appraiser period
+        exclusion constraint, so past services do not add to its cost.
+        """
+        period = epoch_range(
+            ReappraisalServiceTable.rs_start_epoch, ReappraisalServiceTable.rs_end_epoch
         )
+        window = epoch_range(cast(from_epoch, BigInteger), cast(to_epoch, BigInteger))
+        stmt = (
+            select(
+                ReappraisalServiceTable.reappraisal_service_id,
+                ReappraisalServiceTable.rs_start_epoch,
+                ReappraisalServiceTable.rs_end_epoch,
+            )
+            .where(
+                ReappraisalServiceTable.rs_appraiser_id == str(appraiser_id),
+                period.op("&&")(window),
+                text(BookingCondition),
+            )
+            .order_by(ReappraisalServiceTable.rs_start_epoch)
+        )
+        return (await self.dao.session.exec(stmt)).all()
+
+    async def _raise_if_double_booked(
+        self,
+        error: IntegrityError,
+        appraiser_id: Any,
+        start_epoch: int,
+        end_epoch: int,
+        reappraisal_service_id: Optional[str] = None,
+    ) -> None:
+        """
+        Turns a violation of the appraiser period exclusion constraint into
+        AppraiserDoubleBookedAPIException naming the conflicting services.
+        """
+        if BookingConstraint not in str(error.orig):
+            return
+        if self.dao.session.in_transaction():
+            await self.dao.session.rollback()
+        bookings = await self.get_appraiser_bookings(appraiser_id, start_epoch, end_epoch)
+        raise AppraiserDoubleBookedAPIException(
+            appraiser_id=appraiser_id,
+            conflicting_service_ids=[
+                booking.reappraisal_service_id
+                for booking in bookings
+                if booking.reappraisal_service_id != reappraisal_service_id
+            ],
+        ) from error
 
     async def delete_reappraisal_service(
         self, reappraisal_service_id: str, soft_del: bool = True
@@ -44,7 +165,199 @@ class ReappraisalServiceDAO:
             )
         return await self.dao.delete_record(reappraisal_service_id)
 
+    async def lock_services(self, reappraisal_service_ids: Iterable[str]) -> None:
+        """
+        Locks the given service rows until the caller's transaction ends,
+        in id order so concurrent writers queue instead of deadlocking.
+        Child DAOs lock before writing reimbursements or advances: a second
+        writer of the same service then only writes (and sums) once the
+        first has committed, so refresh_totals' sums, read from the
+        statement's snapshot under READ COMMITTED, include its rows.
+        """
+        reappraisal_service_ids = sorted(
+            {
+                reappraisal_service_id
+                for reappraisal_service_id in reappraisal_service_ids
+                if reappraisal_service_id is not None
+            }
+        )
+        if not reappraisal_service_ids:
+            return
+        await self.dao.session.exec(
+            select(ReappraisalServiceTable.reappraisal_service_id)
+            .where(
+                ReappraisalServiceTable.reappraisal_service_id.in_(
+                    reappraisal_service_ids
+                )
+            )
+            .order_by(ReappraisalServiceTable.reappraisal_service_id)
+            .with_for_update()
+        )
+
+    async def refresh_totals(self, reappraisal_service_ids: Iterable[str]) -> None:
+        """
+        Recomputes the stored reimbursement and advance totals of the given
+        services from their live rows, in the caller's transaction. Child
+        DAOs call it after every write, before committing, having locked the
+        services with lock_services before the write.
+        """
+        reappraisal_service_ids = [
+            reappraisal_service_id
+            for reappraisal_service_id in set(reappraisal_service_ids)
+            if reappraisal_service_id is not None
+        ]
+        if not reappraisal_service_ids:
+            return
+        reimbursement_total, advance_total = _computed_totals()
+        await self.dao.session.exec(
+            update(ReappraisalServiceTable)
+            .where(
+                ReappraisalServiceTable.reappraisal_service_id.in_(
+                    reappraisal_service_ids
+                )
+            )
+            .values(
+                rs_reimbursement_total=reimbursement_total,
+                rs_advance_total=advance_total,
+            )
+        )
+        count_cache.invalidate(ReappraisalServiceTable.__tablename__)
+
+    async def reconcile_totals(self, repair: bool = False) -> List[Any]:
+        """
+        Returns every service (soft-deleted ones included) whose stored totals
+        differ from the sums of its live reimbursements and advances, as rows
+        of reappraisal_service_id, the stored and the computed totals. With
+        `repair` the drifted totals are recomputed and committed.
+        """
+        reimbursement_total, advance_total = _computed_totals()
+        result = await self.dao.session.exec(
+            select(
+                ReappraisalServiceTable.reappraisal_service_id,
+                ReappraisalServiceTable.rs_reimbursement_total,
+                reimbursement_total.label("computed_reimbursement_total"),
+                ReappraisalServiceTable.rs_advance_total,
+                advance_total.label("computed_advance_total"),
+            ).where(
+                or_(
+                    ReappraisalServiceTable.rs_reimbursement_total
+                    != reimbursement_total,
+                    ReappraisalServiceTable.rs_advance_total != advance_total,
+                )
+            )
+        )
+        drifted = result.all()
+        if repair and drifted:
+            service_ids = [row.reappraisal_service_id for row in drifted]
+            await self.lock_services(service_ids)
+            await self.refresh_totals(service_ids)
+            await self.dao.session.commit()
+        return drifted
+
     async def get_reappraisal_services(
         self, query: BaseQueryParams
     ) -> List[ReappraisalServiceTable]:
-        return await self.dao.get_records(query)
+        return await self.dao.get_records_functionalities(query)
+
+    async def get_reappraisal_service_list(
+        self, query: BaseQueryParams
+    ) -> Union[List[Any], PaginationResponse[Any]]:
+        """
+        Returns the filtered services together with appraiser, bank and branch
+        names and the reimbursement/advance totals, all from one statement.
+        Rows are plain projections (no ORM objects) with the service columns
+        the listing renders plus appraiser_name, bank_name, branch_name,
+        reimbursement_amount, advance_amount and total_amount.
+        """
+        return await self.dao.get_records_functionalities(
+            query, stmt=_service_list_statement(), cache_key="reappraisal_service_list"
+        )
+
+    def stream_reappraisal_service_list(
+        self, query: BaseQueryParams, batch_size: int
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        The rows of get_reappraisal_service_list for every matching service,
+        unpaginated, in batches read through a server-side cursor.
+        """
+        return self.dao.stream_records(
+            query,
+            stmt=_service_list_statement(),
+            cache_key="reappraisal_service_list",
+            batch_size=batch_size,
+        )
+
+    @staticmethod
+    def service_list_columns() -> List[str]:
+        """Field names of the service listing rows, in column order."""
+        return list(_service_list_statement().selected_columns.keys())
+
+
+def _computed_totals():
+    """
+    Correlated sums of a service's live reimbursements and advances, as
+    maintained in rs_reimbursement_total and rs_advance_total.
+    """
+    reimbursement = ReappraisalServiceReimbursementTable
+    advance = ReappraisalServiceAdvanceTable
+    reimbursement_total = (
+        select(func.coalesce(func.sum(reimbursement.rs_reimbursement_amount), 0))
+        .where(
+            reimbursement.rs_reappraisal_service_id
+            == ReappraisalServiceTable.reappraisal_service_id,
+            reimbursement.deleted_at_epoch == -1,
+        )
+        .scalar_subquery()
+    )
+    advance_total = (
+        select(func.coalesce(func.sum(advance.rs_advance_amount), 0))
+        .where(
+            advance.reappraisal_service_id
+            == ReappraisalServiceTable.reappraisal_service_id,
+            advance.deleted_at_epoch == -1,
+        )
+        .scalar_subquery()
+    )
+    return reimbursement_total, advance_total
+
+
+@cache
+def _service_list_statement():
+    """
+    Base statement of the service listing. Statements are immutable, so it
+    is built once per process and shared by every request.
+    """
+    # Aliased so they never clash with joins added by the search filters
+    appraiser = aliased(AppraiserTable)
+    bank = aliased(BankTable)
+    branch = aliased(BranchTable)
+
+    stmt = (
+        select(
+            ReappraisalServiceTable.reappraisal_service_id,
+            ReappraisalServiceTable.rs_start_epoch,
+            ReappraisalServiceTable.rs_end_epoch,
+            ReappraisalServiceTable.rs_packet_count,
+            ReappraisalServiceTable.rs_status,
+            ReappraisalServiceTable.created_at_epoch,
+            func.coalesce(appraiser.appraiser_full_name, "").label("appraiser_name"),
+            func.coalesce(bank.bank_name, "").label("bank_name"),
+            func.coalesce(branch.branch_name, "").label("branch_name"),
+            ReappraisalServiceTable.rs_reimbursement_total.label("reimbursement_amount"),
+            ReappraisalServiceTable.rs_advance_total.label("advance_amount"),
+            ReappraisalServiceTable.rs_total_amount.label("total_amount"),
+        )
+        .outerjoin(
+            appraiser,
+            cast(appraiser.appraiser_id, String)
+            == ReappraisalServiceTable.rs_appraiser_id,
+        )
+        .outerjoin(
+            bank, cast(bank.bank_id, String) == ReappraisalServiceTable.rs_bank_id
+        )
+        .outerjoin(
+            branch,
+            cast(branch.branch_id, String) == ReappraisalServiceTable.rs_branch_id,
+        )
+    )
+    return stmt
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy import select
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -8,21 +8,61 @@ from app.api.model.reimbursement.reimbursement_table import (
     ReappraisalServiceReimbursementTable,
 )
 from app.api.dao.dao import DAO
+from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
 from app.api.services.search_filter.basequery import BaseQueryParams
 
 
 class ReappraisalServiceReimbursementDAO:
     dao: DAO[ReappraisalServiceReimbursementTable, str]
 
+    # Reimbursement responses embed their service; file endpoints need no relationship
+    LOAD_PROFILES = {"list": ("service",), "detail": ("service",), "file": ()}
+
     def __init__(self, session: AsyncSession):
         self.dao = DAO[ReappraisalServiceReimbursementTable, str](
-            session, ReappraisalServiceReimbursementTable
+            session, ReappraisalServiceReimbursementTable, self.LOAD_PROFILES
+        )
+
+    def with_profile(self, profile: str) -> "ReappraisalServiceReimbursementDAO":
+        """Loads only the relationships of the named LOAD_PROFILES entry."""
+        self.dao = self.dao.with_profile(profile)
+        return self
+
+    async def _commit_with_totals(self, reappraisal_service_ids) -> None:
+        """Brings the totals of the services a write touched in step, then commits."""
+        await ReappraisalServiceDAO(self.dao.session).refresh_totals(
+            reappraisal_service_ids
+        )
+        await self.dao.session.commit()
+
+    async def _lock_services(self, reappraisal_service_ids) -> None:
+        """Locks the services a write will touch, before it writes."""
+        await ReappraisalServiceDAO(self.dao.session).lock_services(
+            reappraisal_service_ids
         )
 
+    @staticmethod
+    def _moved_to(updates: SQLModel) -> List[str]:
+        # The service an update moves the reimbursement to, if it does
+        service_id = updates.model_dump(exclude_unset=True).get("rs_reappraisal_service_id")
+        return [service_id] if service_id else []
+
+    async def _service_ids_of(self, rs_reimbursement_ids: List[str]) -> List[str]:
+        reimbursement = ReappraisalServiceReimbursementTable
+        result = await self.dao.session.exec(
+            select(reimbursement.rs_reappraisal_service_id).where(
+                reimbursement.rs_reimbursement_id.in_(rs_reimbursement_ids)
+            )
+        )
+        return result.scalars().all()
+
     async def create_rs_reimbursement(
         self, reimbursement: ReappraisalServiceReimbursementTable
     ) -> Optional[ReappraisalServiceReimbursementTable]:
-        return await self.dao.create_record(reimbursement)
+        await self._lock_services([reimbursement.rs_reappraisal_service_id])
+        created = await self.dao.create_record(reimbursement, is_commit=False)
+        await self._commit_with_totals([created.rs_reappraisal_service_id])
+        return created
 
     async def get_rs_reimbursement(
         self, rs_reimbursement_id: str
@@ -32,34 +72,89 @@ class ReappraisalServiceReimbursementDAO:
     async def update_rs_reimbursement(
         self, rs_reimbursement_id: str, reimbursement_update: SQLModel
     ) -> Optional[ReappraisalServiceReimbursementTable]:
-        return await self.dao.update_record(rs_reimbursement_id, reimbursement_update)
+        # The update may move the reimbursement to another service; both totals change
+        previous_service_ids = await self._service_ids_of([rs_reimbursement_id])
+        await self._lock_services(
+            [*previous_service_ids, *self._moved_to(reimbursement_update)]
+        )
+        updated = await self.dao.update_record(
+            rs_reimbursement_id, reimbursement_update, is_commit=False
+        )
+        if updated is None:
+            return None
+        await self._commit_with_totals(
+            [*previous_service_ids, updated.rs_reappraisal_service_id]
+        )
+        return updated
 
     async def delete_rs_reimbursement(
         self, rs_reimbursement_id: str, soft_del: bool = True
     ) -> bool:
+        await self._lock_services(await self._service_ids_of([rs_reimbursement_id]))
         if soft_del:
-            return await self.dao.delete_record(
+            deleted = await self.dao.delete_record(
                 record_id=rs_reimbursement_id,
                 field_name="deleted_at_epoch",
                 time=int(datetime.now().timestamp()),
+                is_commit=False,
             )
-        return await self.dao.delete_record(rs_reimbursement_id)
+            service_ids = [deleted.rs_reappraisal_service_id] if deleted else []
+        else:
+            service_ids = await self._service_ids_of([rs_reimbursement_id])
+            deleted = await self.dao.delete_record(rs_reimbursement_id, is_commit=False)
+        if deleted:
+            await self._commit_with_totals(service_ids)
+        return deleted
 
-    async def get_rs_reimbursements(
-        self, query: BaseQueryParams
+    async def create_rs_reimbursements(
+        self, reimbursements: List[ReappraisalServiceReimbursementTable]
     ) -> List[ReappraisalServiceReimbursementTable]:
-        return await self.dao.get_records(query)
+        await self._lock_services(
+            record.rs_reappraisal_service_id for record in reimbursements
+        )
+        created = await self.dao.create_records(reimbursements, is_commit=False)
+        await self._commit_with_totals(
+            record.rs_reappraisal_service_id for record in created
+        )
+        return created
 
-    async def get_total_reimbursement_amount(self, reappraisal_service_id: str) -> int:
-        return await self.dao.get_total(
-            amount_column=ReappraisalServiceReimbursementTable.rs_reimbursement_amount,
-            filter_column=ReappraisalServiceReimbursementTable.rs_reappraisal_service_id,
-            filter_value=reappraisal_service_id,
+    async def update_rs_reimbursements(
+        self, reappraisal_service_id: str, reimbursement_updates: Dict[str, SQLModel]
+    ) -> List[ReappraisalServiceReimbursementTable]:
+        await self._lock_services(
+            [reappraisal_service_id]
+            + [
+                service_id
+                for updates in reimbursement_updates.values()
+                for service_id in self._moved_to(updates)
+            ]
         )
+        updated = await self.dao.update_records(
+            reimbursement_updates,
+            ReappraisalServiceReimbursementTable.rs_reappraisal_service_id
+            == reappraisal_service_id,
+            is_commit=False,
+        )
+        await self._commit_with_totals(
+            [reappraisal_service_id]
+            + [record.rs_reappraisal_service_id for record in updated]
+        )
+        return updated
 
-    async def get_total_reimbursement_amount(self, reappraisal_service_id: str) -> int:
-        return await self.dao.get_total(
-            amount_column=ReappraisalServiceReimbursementTable.rs_reimbursement_amount,
-            filter_column=ReappraisalServiceReimbursementTable.rs_reappraisal_service_id,
-            filter_value=reappraisal_service_id,
+    async def delete_rs_reimbursements(
+        self, reappraisal_service_id: str, rs_reimbursement_ids: List[str]
+    ) -> List[str]:
+        await self._lock_services([reappraisal_service_id])
+        deleted_ids = await self.dao.soft_delete_records(
+            rs_reimbursement_ids,
+            ReappraisalServiceReimbursementTable.rs_reappraisal_service_id
+            == reappraisal_service_id,
+            is_commit=False,
         )
+        await self._commit_with_totals([reappraisal_service_id] if deleted_ids else [])
+        return deleted_ids
+
+    async def get_rs_reimbursements(
+        self, query: BaseQueryParams
+    ) -> List[ReappraisalServiceReimbursementTable]:
+        return await self.dao.get_records_functionalities(query)
@@ -3,6 +3,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import create_async_engine
 import boto3
+from botocore.config import Config
 
 # Load environment variables based on environment
 if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
@@ -122,13 +123,18 @@ AWS_REGION = os.getenv("AWS_REGION")
 AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
 AWS_S3_BASE_URL = os.getenv("AWS_S3_BASE_URL")
 
+# Connections kept by the shared S3 client. S3Client runs at most this many
+# calls at once, so no call waits for a free connection.
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "10"))
+s3_config = Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
+
 # Create S3 client
 # In Lambda: Uses IAM role automatically (no credentials needed)
 # Locally: Uses credentials from .env or AWS profile
 try:
     if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
         # Running in Lambda - use IAM role (no explicit credentials)
-        s3_client = boto3.client("s3", region_name=AWS_REGION)
+        s3_client = boto3.client("s3", region_name=AWS_REGION, config=s3_config)
         print("✅ S3 client created using Lambda IAM role")
     else:
         # Running locally - use explicit credentials if available
@@ -138,11 +144,12 @@ try:
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
                 region_name=AWS_REGION,
+                config=s3_config,
             )
             print("✅ S3 client created using explicit credentials")
         else:
             # Fall back to AWS profile from environment
-            s3_client = boto3.client("s3", region_name=AWS_REGION)
+            s3_client = boto3.client("s3", region_name=AWS_REGION, config=s3_config)
             print("✅ S3 client created using AWS profile")
 except Exception as e:
     s3_client = None
@@ -7,8 +7,14 @@ from app.api.db_connection.db_config import engine
 
 # Create session factory only if engine is available
 if engine:
+    # Objects stay readable after commit: DAO writes return their rows via
+    # RETURNING instead of re-reading them
     SessionLocal = async_sessionmaker(
-        autocommit=False, autoflush=False, bind=engine, class_=AsyncSession
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+        class_=AsyncSession,
     )
 else:
     SessionLocal = None
@@ -30,6 +30,9 @@ class ApiErrorCode(StrEnum):
         "REAPPRAISAL_SERVICE_ADVANCE_DETAILS_NOT_FOUND"
     )
     FILE_NOT_FOUND = "FILE_NOT_FOUND"
+    FILE_MISSING = "FILE_MISSING"
+    FILE_TYPE_NOT_ALLOWED = "FILE_TYPE_NOT_ALLOWED"
+    FILE_TOO_LARGE = "FILE_TOO_LARGE"
     PAYOUT_CYCLE_NOT_FOUND = "PAYOUT_CYCLE_NOT_FOUND"
     PAYOUT_CYCLE_DETAILS_NOT_FOUND = "PAYOUT_CYCLE_DETAILS_NOT_FOUND"
 
@@ -78,3 +81,6 @@ class ApiErrorCode(StrEnum):
     REAPPRAISAL_SERVICE_INVALID_STATUS = "REAPPRAISAL_SERVICE_INVALID_STATUS"
     REAPPRAISAL_SERVICE_DATE_INCORRECT = "REAPPRAISAL_SERVICE_DATE_INCORRECT"
     REAPPRAISAL_SERVICE_DELETE_NOT_ALLOWED = "REAPPRAISAL_SERVICE_DELETE_NOT_ALLOWED"
+    REAPPRAISAL_SERVICE_APPRAISER_DOUBLE_BOOKED = (
+        "REAPPRAISAL_SERVICE_APPRAISER_DOUBLE_BOOKED"
+    )
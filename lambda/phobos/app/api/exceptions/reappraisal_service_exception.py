@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import status, HTTPException
 from app.api.exceptions.api_error_codes import ApiErrorCode
@@ -125,3 +125,16 @@ class ReappraisalServiceDeleteNotAllowedAPIException(ApiException):
                 "allowed_status": "ACTIVE",
             },
         )
+
+
+class AppraiserDoubleBookedAPIException(ApiException):
+    def __init__(self, appraiser_id: str, conflicting_service_ids: List[str]):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code=ApiErrorCode.REAPPRAISAL_SERVICE_APPRAISER_DOUBLE_BOOKED,
+            error_message="Appraiser already has an active service in this period",
+            error_details={
+                "appraiser_id": appraiser_id,
+                "conflicting_service_ids": conflicting_service_ids,
+            },
+        )
@@ -31,3 +31,33 @@ class FileNotFoundAPIException(ApiException):
             error_message="File not found",
             error_details={"file_url": file_url},
         )
+
+
+class FileMissingAPIException(ApiException):
+    def __init__(self, field_name: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error_code=ApiErrorCode.FILE_MISSING,
+            error_message="No file uploaded",
+            error_details={"field": field_name},
+        )
+
+
+class FileTypeNotAllowedAPIException(ApiException):
+    def __init__(self, content_type: str, allowed_types):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            error_code=ApiErrorCode.FILE_TYPE_NOT_ALLOWED,
+            error_message="Unsupported file type. Allowed: PNG, JPG, PDF.",
+            error_details={"content_type": content_type, "allowed_types": list(allowed_types)},
+        )
+
+
+class FileTooLargeAPIException(ApiException):
+    def __init__(self, max_size_mb: int):
+        super().__init__(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            error_code=ApiErrorCode.FILE_TOO_LARGE,
+            error_message=f"File too large. Max allowed: {max_size_mb} MB.",
+            error_details={"max_size_mb": max_size_mb},
+        )
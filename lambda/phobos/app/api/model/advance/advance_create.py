@@ -7,7 +7,10 @@ from app.api.model.advance.advance_table import (
     ReappraisalServiceAdvanceSettlementStatusField,
     ReappraisalServiceAdvanceTransactionEpochField,
 )
-from sqlmodel import SQLModel
+from typing import List
+from app.api.model.general.generic_regex import IdRegexPattern
+from app.api.services.batch.batch import MAX_BATCH_SIZE
+from sqlmodel import Field, SQLModel
 
 
 class ReappraisalServiceAdvanceCreateRequest(SQLModel):
@@ -18,6 +21,23 @@ class ReappraisalServiceAdvanceCreateRequest(SQLModel):
    
 
 
+class ReappraisalServiceAdvanceBatchUpdateRequest(ReappraisalServiceAdvanceCreateRequest):
+    rs_advance_id: str = Field(
+        title="Reappraisal Service Advance ID",
+        description="Advance to update, formatted as a UUID.",
+        schema_extra={"pattern": IdRegexPattern},
+    )
+
+
+class ReappraisalServiceAdvanceBatchDeleteRequest(SQLModel):
+    rs_advance_ids: List[str] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        title="Reappraisal Service Advance IDs",
+        description="Advances to soft-delete.",
+    )
+
+
 class ReappraisalServiceAdvanceCreateResponse(SQLModel):
     rs_advance_id: str = ReappraisalServiceAdvanceIDField
     reappraisal_service_id: str = ReappraisalServiceIDField
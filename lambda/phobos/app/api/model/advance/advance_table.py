@@ -6,9 +6,11 @@ from sqlmodel import (
     Enum,
     Field,
     ForeignKey,
+    Index,
     Integer,
     Relationship,
     String,
+    text,
 )
 from typing import List, TYPE_CHECKING
 from app.api.model import enum
@@ -111,4 +113,25 @@ class ReappraisalServiceAdvanceTable(BaseTable, table=True):
     rs_advance_amount: int = ReappraisalServiceAdvanceAmountField
     rs_advance_description: str = ReappraisalServiceAdvanceDescriptionField
     service: "ReappraisalServiceTable" = ServiceRelationship
+
+    # Supports cursor pagination ordered by (created_at_epoch, id)
+    __table_args__ = (
+        Index(
+            "ix_reappraisal_service_advance_created_at_epoch_rsa_id",
+            "created_at_epoch",
+            "rsa_id",
+        ),
+        # Supports the per-service totals kept on reappraisal_service
+        Index(
+            "ix_reappraisal_service_advance_rs_id_live",
+            "rs_id",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+        # List filter on the transaction date of live rows
+        Index(
+            "ix_reappraisal_service_advance_rsa_transaction_epoch_live",
+            "rsa_transaction_epoch",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+    )
    
@@ -66,3 +66,18 @@ class PANResponse(SQLModel):
 class BankAccountResponse(SQLModel):
     appraiser_id: str
     appraiser_account_number: str
+
+
+class AppraiserBookingResponse(SQLModel):
+    reappraisal_service_id: str
+    rs_start_epoch: int
+    rs_end_epoch: int
+
+
+class AppraiserAvailabilityResponse(SQLModel):
+    appraiser_id: str  # Formatted as "APR-0001"
+    from_epoch: int
+    to_epoch: int
+    available: bool
+    # Active services overlapping the window, earliest first
+    bookings: List[AppraiserBookingResponse] = []
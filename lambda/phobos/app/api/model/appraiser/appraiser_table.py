@@ -3,6 +3,7 @@ from fastapi import Path, Query
 from sqlmodel import Column, Enum, Field, Index, Integer, Relationship, String
 from typing import List, TYPE_CHECKING
 from app.api.model.general.generic_model import BaseTable
+from app.api.model.general.trigram import trigram_index
 from app.api.model.general.generic_regex import (
     NameRegexPattern,
     IdRegexPattern,
@@ -137,7 +138,13 @@ class AppraiserTable( BaseTable, table=True):
     services: List["ReappraisalServiceTable"] = ServiceRelationship
    
 
-    __table_args__ = (Index("ix_appraiser_fullname", "ap_full_name"),)
+    __table_args__ = (
+        Index("ix_appraiser_fullname", "ap_full_name"),
+        # Serves PARTIAL (ILIKE '%...%') name searches
+        trigram_index("ix_appraiser_full_name_trgm", "ap_full_name"),
+        # Supports cursor pagination ordered by (created_at_epoch, id)
+        Index("ix_appraiser_created_at_epoch_ap_id", "created_at_epoch", "ap_id"),
+    )
 
     # Generate APR-0001 formatted ID dynamically
     @property
@@ -27,9 +27,9 @@ class BankGetResponse(SQLModel):
         return 0
 
     @classmethod
-    def from_db_record(cls, bank_record):
-        """Convert BankTable record to formatted response"""
-        return cls(
+    def db_record_fields(cls, bank_record) -> dict:
+        """Response fields of a BankTable record"""
+        return dict(
             bank_id=f"BNK-{bank_record.bank_id:04d}",
             bank_name=bank_record.bank_name,
             bank_code=bank_record.bank_code,
@@ -39,6 +39,11 @@ class BankGetResponse(SQLModel):
             branches=[]
         )
 
+    @classmethod
+    def from_db_record(cls, bank_record):
+        """Convert BankTable record to formatted response"""
+        return cls(**cls.db_record_fields(bank_record))
+
 
 class BranchWithServicesCountResponse(SQLModel):
     branch_id: str
@@ -1,10 +1,11 @@
 from typing import Annotated, Optional, TYPE_CHECKING
 from fastapi import Path, Query
-from sqlmodel import Column, Field, ForeignKey, Integer, Relationship, SQLModel, String
+from sqlmodel import Column, Field, ForeignKey, Index, Integer, Relationship, SQLModel, String
 from typing import List
 
 from app.api.model.reappraisal_service.reappraisal_service_table import ReappraisalServiceTable
 from app.api.model.general.generic_model import BaseTable
+from app.api.model.general.trigram import trigram_index
 from app.api.model.general.generic_regex import (
     BanknameRegexPattern,
     BankCodeRegexPattern,
@@ -96,6 +97,13 @@ class BankTable(BaseTable, table=True):
     branches: List["BranchTable"] = BranchRelationship
     service: List["ReappraisalServiceTable"] = ReappraisalServiceRelationship
 
+    # Supports cursor pagination ordered by (created_at_epoch, id)
+    __table_args__ = (
+        Index("ix_bank_created_at_epoch_bk_id", "created_at_epoch", "bk_id"),
+        # Serves PARTIAL (ILIKE '%...%') name searches
+        trigram_index("ix_bank_name_trgm", "bk_name"),
+    )
+
     # Generate BNK-0001 formatted ID dynamically
     @property
     def formatted_bank_id(self) -> Optional[str]:
@@ -29,9 +29,9 @@ class BranchGetResponse(SQLModel):
         return False
 
     @classmethod
-    def from_db_record(cls, branch_record, bank_name=None):
-        """Convert BranchTable record to formatted response"""
-        return cls(
+    def db_record_fields(cls, branch_record) -> dict:
+        """Response fields of a BranchTable record"""
+        return dict(
             branch_id=f"BRN-{branch_record.branch_id:04d}",
             bank_id=f"BNK-{branch_record.branch_bank_id:04d}",
             branch_name=branch_record.branch_name,
@@ -42,6 +42,11 @@ class BranchGetResponse(SQLModel):
             bank=None
         )
 
+    @classmethod
+    def from_db_record(cls, branch_record, bank_name=None):
+        """Convert BranchTable record to formatted response"""
+        return cls(**cls.db_record_fields(branch_record))
+
 
 class BranchWithServicesCountResponse(SQLModel):
     branch_id: str = BranchIDField
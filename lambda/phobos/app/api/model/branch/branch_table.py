@@ -1,10 +1,11 @@
 from typing import Annotated, Optional
 from fastapi import Path
-from sqlmodel import Column, Field, ForeignKey, Integer, Relationship, SQLModel, String
+from sqlmodel import Column, Field, ForeignKey, Index, Integer, Relationship, SQLModel, String
 from typing import List, TYPE_CHECKING
 
 from app.api.model.reappraisal_service.reappraisal_service_table import ReappraisalServiceTable
 from app.api.model.general.generic_model import BaseTable
+from app.api.model.general.trigram import trigram_index
 from app.api.model.general.generic_regex import (
     IdRegexPattern,
     SolIdRegexPattern,
@@ -100,6 +101,13 @@ class BranchTable(BaseTable, table=True):
     bank: "BankTable" = BankRelationship
     service: List["ReappraisalServiceTable"] = ReappraisalServiceRelationship
 
+    # Supports cursor pagination ordered by (created_at_epoch, id)
+    __table_args__ = (
+        Index("ix_branch_created_at_epoch_br_id", "created_at_epoch", "br_id"),
+        # Serves PARTIAL (ILIKE '%...%') name searches
+        trigram_index("ix_branch_name_trgm", "br_name"),
+    )
+
     # Generate BRN-0001 formatted ID dynamically
     @property
     def formatted_branch_id(self) -> Optional[str]:
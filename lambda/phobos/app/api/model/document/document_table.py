@@ -0,0 +1,99 @@
+from typing import Optional
+import uuid
+from sqlmodel import BigInteger, Column, Enum, Field, Index, String, text
+from app.api.model.enum.document_owner_enum import DocumentOwnerEnum
+from app.api.model.general.generic_model import BaseTable
+from app.api.model.general.generic_regex import IdRegexPattern
+
+
+DocumentIDField = Field(
+    default_factory=lambda: str(uuid.uuid4()),
+    sa_column=Column("doc_id", String(36), primary_key=True),
+    title="Document ID",
+    description="Unique identifier for the document, formatted as a UUID.",
+    schema_extra={
+        "examples": ["123e4567-e89b-12d3-a456-426614174000"],
+        "pattern": IdRegexPattern,
+    },
+)
+DocumentKeyField = Field(
+    sa_column=Column("doc_key", String(1024), nullable=False),
+    title="Document Key",
+    description="S3 key the document is stored under.",
+    schema_extra={
+        "examples": ["7/reappraisal/123e4567-e89b-12d3-a456-426614174000/completion_certificates/cert.pdf"]
+    },
+)
+DocumentSizeField = Field(
+    sa_column=Column("doc_size", BigInteger, nullable=False),
+    title="Document Size",
+    description="Size of the document in bytes.",
+    ge=0,
+    schema_extra={"examples": [248213]},
+)
+DocumentSha256Field = Field(
+    sa_column=Column("doc_sha256", String(64), nullable=False),
+    title="Document SHA-256",
+    description="Hex SHA-256 digest of the document contents.",
+    schema_extra={
+        "examples": ["9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"]
+    },
+)
+DocumentContentTypeField = Field(
+    sa_column=Column("doc_content_type", String(255), nullable=False),
+    title="Document Content Type",
+    description="MIME type the document is served with.",
+    schema_extra={"examples": ["application/pdf"]},
+)
+DocumentOwnerTypeField = Field(
+    default=None,
+    sa_column=Column("doc_owner_type", Enum(DocumentOwnerEnum), nullable=True),
+    title="Document Owner Type",
+    description="Kind of record the document belongs to; empty for exports.",
+    schema_extra={"examples": ["REAPPRAISAL_SERVICE"]},
+)
+DocumentOwnerIDField = Field(
+    default=None,
+    sa_column=Column("doc_owner_id", String(36), nullable=True),
+    title="Document Owner ID",
+    description="Identifier of the record the document belongs to.",
+    schema_extra={
+        "examples": ["123e4567-e89b-12d3-a456-426614174000"],
+        "pattern": IdRegexPattern,
+    },
+)
+
+
+class DocumentTable(BaseTable, table=True):
+    __tablename__ = "document"
+
+    document_id: str = DocumentIDField
+    document_key: str = DocumentKeyField
+    document_size: int = DocumentSizeField
+    document_sha256: str = DocumentSha256Field
+    document_content_type: str = DocumentContentTypeField
+    document_owner_type: Optional[DocumentOwnerEnum] = DocumentOwnerTypeField
+    document_owner_id: Optional[str] = DocumentOwnerIDField
+
+    __table_args__ = (
+        # One live document per stored object, looked up by key on every fetch
+        Index(
+            "ix_document_doc_key_live",
+            "doc_key",
+            unique=True,
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+        # Duplicate detection by contents
+        Index(
+            "ix_document_doc_sha256_live",
+            "doc_sha256",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+        # Storage usage per owner
+        Index(
+            "ix_document_doc_owner_live",
+            "doc_owner_type",
+            "doc_owner_id",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+    )
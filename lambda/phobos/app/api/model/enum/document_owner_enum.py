@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class DocumentOwnerEnum(StrEnum):
+
+    REAPPRAISAL_SERVICE = "REAPPRAISAL_SERVICE"
+    REIMBURSEMENT = "REIMBURSEMENT"
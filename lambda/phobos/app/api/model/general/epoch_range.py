@@ -0,0 +1,54 @@
+from typing import Any
+from sqlalchemy import DDL, Index, event, func, literal_column, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlmodel import SQLModel
+
+# Exclusion constraints compare their scalar key with = in a GiST index,
+# which needs the btree_gist operator classes
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
+
+def epoch_range(start: Any, end: Any) -> Any:
+    """
+    int8range covering [start, end], both bounds inclusive; a NULL bound is
+    unbounded. Filters, indexes and constraints all build it this way so
+    Postgres matches filters to the indexed expression.
+    """
+    # The bounds flag is rendered inline: a bound parameter would not match
+    # the indexed expression
+    return func.int8range(start, end, literal_column("'[]'"))
+
+
+def epoch_range_index(name: str, start: Any, end: Any) -> Index:
+    """
+    GiST index of the live rows' epoch_range(start, end). Serves the
+    containment (@>) and overlap (&&) filters of EPOCH_RANGE, which two
+    btree columns only serve as a scan of one bound.
+    """
+    return Index(
+        name,
+        epoch_range(start, end),
+        postgresql_using="gist",
+        postgresql_where=text("deleted_at_epoch = -1"),
+    )
+
+
+def epoch_range_exclusion(
+    name: str, key: Any, start: Any, end: Any, where: str
+) -> ExcludeConstraint:
+    """
+    Rejects two rows matching `where` with the same `key` and overlapping
+    epoch_range(start, end). Its GiST index also serves overlap lookups by
+    key with the same `where`. Postgres only; other dialects skip it.
+    """
+    return ExcludeConstraint(
+        (key, "="),
+        (epoch_range(start, end), "&&"),
+        name=name,
+        using="gist",
+        where=text(where),
+    ).ddl_if(dialect="postgresql")
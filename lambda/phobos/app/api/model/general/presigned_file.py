@@ -0,0 +1,46 @@
+from typing import Dict
+from sqlmodel import Field, SQLModel
+
+
+class PresignedUploadRequest(SQLModel):
+    filename: str = Field(
+        min_length=1,
+        max_length=255,
+        title="File Name",
+        description="Name of the file to upload; its extension is kept in the S3 key.",
+        schema_extra={"examples": ["certificate.pdf"]},
+    )
+    content_type: str = Field(
+        title="Content Type",
+        description="MIME type of the file. The upload must send it as its Content-Type header.",
+        schema_extra={"examples": ["application/pdf"]},
+    )
+
+
+class PresignedUploadResponse(SQLModel):
+    upload_url: str = Field(
+        title="Upload URL",
+        description="Presigned S3 URL to PUT the file to.",
+    )
+    key: str = Field(
+        title="S3 Key",
+        description="Key the file is stored under; pass it to the finalize endpoint.",
+    )
+    expires_in: int = Field(
+        title="Expires In",
+        description="Seconds the upload URL stays valid.",
+        schema_extra={"examples": [300]},
+    )
+    headers: Dict[str, str] = Field(
+        title="Headers",
+        description="Headers the PUT request must send.",
+        schema_extra={"examples": [{"Content-Type": "application/pdf"}]},
+    )
+
+
+class PresignedUploadFinalizeRequest(SQLModel):
+    key: str = Field(
+        min_length=1,
+        title="S3 Key",
+        description="Key returned with the presigned upload URL.",
+    )
@@ -0,0 +1,40 @@
+from typing import Any
+from sqlalchemy import DDL, Index, event
+from sqlmodel import SQLModel
+
+TRIGRAM_OPS = "gin_trgm_ops"
+
+# The trigram operator classes come from pg_trgm, which must exist before
+# create_all builds the indexes below
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def trigram_index(name: str, column_name: str) -> Index:
+    """
+    GIN trigram index on a text column. Postgres uses it for ILIKE '%value%'
+    (a PARTIAL filter) and similarity ranking, which a btree cannot serve.
+    """
+    return Index(
+        name,
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: TRIGRAM_OPS},
+    )
+
+
+def has_trigram_index(column: Any) -> bool:
+    """Whether a mapped attribute (or an alias of one) has a trigram index."""
+    table_column = column.property.columns[0]
+    table = getattr(table_column, "table", None)
+    for index in getattr(table, "indexes", ()):
+        postgresql = index.dialect_options["postgresql"]
+        if (
+            postgresql["using"] == "gin"
+            and (postgresql["ops"] or {}).get(table_column.name) == TRIGRAM_OPS
+        ):
+            return True
+    return False
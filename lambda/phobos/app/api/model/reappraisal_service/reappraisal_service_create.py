@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from app.api.model.reappraisal_service.reappraisal_service_table import (
     ReappraisalServiceBankIdField,
     ReappraisalServiceBranchIdField,
@@ -12,7 +12,8 @@ from app.api.model.reappraisal_service.reappraisal_service_table import (
     ReappraisalServiceIDField,
     ReappraisalServiceStartEpochField,
 )
-from sqlmodel import SQLModel
+from app.api.services.batch.batch import MAX_BATCH_SIZE
+from sqlmodel import Field, SQLModel
 
 
 class ReappraisalServiceCreateRequest(SQLModel):
@@ -47,6 +48,20 @@ class ReappraisalServiceCreateResponse(SQLModel):
     rs_description :str = ReappraisalServiceDescriptionsField
 
 
+class ReappraisalServiceBatchGetRequest(SQLModel):
+    reappraisal_service_ids: List[str] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        title="Reappraisal Service IDs",
+        description="Reappraisal services to retrieve.",
+    )
+
+
+class ReappraisalServiceBatchGetResponse(SQLModel):
+    items: List[ReappraisalServiceCreateResponse]
+    not_found: List[str]
+
+
 class ReappraisalServiceQueueRequest(SQLModel):
     reappraisal_service_id: str = ReappraisalServiceIDField
     rs_status: str = ReappraisalServiceStatusField
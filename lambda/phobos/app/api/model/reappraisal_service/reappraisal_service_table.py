@@ -3,17 +3,22 @@ import uuid
 from fastapi import Path
 from sqlmodel import (
     Column,
+    Computed,
     Field,
     ForeignKey,
     Integer,
     Relationship,
     String,
     Enum,
+    CheckConstraint,
+    Index,
+    text,
 )
 from typing import List, TYPE_CHECKING
 from app.api.model import enum
 from app.api.model.enum.reappraisal_service_status_enum import ReappraisalServiceStatusEnum
 from app.api.model.general.generic_model import BaseTable
+from app.api.model.general.epoch_range import epoch_range_exclusion, epoch_range_index
 from app.api.model.general.generic_regex import (
     IdRegexPattern,
     FilePathRegexPattern,
@@ -135,6 +140,37 @@ ReappraisalServiceChargeField = Field(
     ge=0,
     schema_extra={"examples": [50000]},  # stored as paisa
 )
+ReappraisalServiceReimbursementTotalField = Field(
+    default=0,
+    sa_column=Column(
+        "rs_reimbursement_total", Integer, nullable=False, default=0, server_default="0"
+    ),
+    title="Reimbursement Total (in paisa)",
+    description="Sum of the live reimbursements of the service, kept in step on every reimbursement write.",
+    ge=0,
+    schema_extra={"examples": [12000]},
+)
+ReappraisalServiceAdvanceTotalField = Field(
+    default=0,
+    sa_column=Column(
+        "rs_advance_total", Integer, nullable=False, default=0, server_default="0"
+    ),
+    title="Advance Total (in paisa)",
+    description="Sum of the live advances of the service, kept in step on every advance write.",
+    ge=0,
+    schema_extra={"examples": [5000]},
+)
+ReappraisalServiceTotalAmountField = Field(
+    default=None,
+    sa_column=Column(
+        "rs_total_amount",
+        Integer,
+        Computed("rs_charge + rs_reimbursement_total - rs_advance_total", persisted=True),
+    ),
+    title="Total Amount (in paisa)",
+    description="Charge plus reimbursement total minus advance total, generated by the database.",
+    schema_extra={"examples": [57000]},
+)
 ReappraisalServiceStatusField = Field(
     default=ReappraisalServiceStatusEnum.ACTIVE,
     sa_column=Column("rs_status", Enum(ReappraisalServiceStatusEnum), index=True),
@@ -199,6 +235,9 @@ class ReappraisalServiceTable(BaseTable, table=True):
     rs_end_epoch: int = ReappraisalServiceEndEpochField
     rs_packet_count: int = ReappraisalServicePacketCountField
     rs_charge: int = ReappraisalServiceChargeField
+    rs_reimbursement_total: int = ReappraisalServiceReimbursementTotalField
+    rs_advance_total: int = ReappraisalServiceAdvanceTotalField
+    rs_total_amount: Optional[int] = ReappraisalServiceTotalAmountField
     rs_status: ReappraisalServiceStatusEnum = ReappraisalServiceStatusField
     rs_completion_file_path: Optional[str] = ReappraisalServiceCompletionFilePathField
     rs_description :str = ReappraisalServiceDescriptionsField
@@ -210,4 +249,51 @@ class ReappraisalServiceTable(BaseTable, table=True):
         ReimbursmentsRelationship
     )
     advances: List["ReappraisalServiceAdvanceTable"] = AdvancesRelationship
+
+    __table_args__ = (
+        # Supports cursor pagination ordered by (created_at_epoch, id)
+        Index("ix_reappraisal_service_created_at_epoch_rs_id", "created_at_epoch", "rs_id"),
+        # List filters on live rows: by appraiser (optionally with status)
+        # and by branch within a date range. Date ranges alone use the GiST
+        # index on the service period below.
+        Index(
+            "ix_reappraisal_service_ap_id_rs_status_live",
+            "ap_id",
+            "rs_status",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+        Index(
+            "ix_reappraisal_service_rs_branch_id_rs_start_epoch_live",
+            "rs_branch_id",
+            "rs_start_epoch",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+        # int8range rejects a lower bound above the upper one
+        CheckConstraint(
+            "rs_start_epoch <= rs_end_epoch", name="ck_reappraisal_service_period"
+        ),
+    )
+
+
+epoch_range_index(
+    "ix_reappraisal_service_period_live",
+    ReappraisalServiceTable.__table__.c.rs_start_epoch,
+    ReappraisalServiceTable.__table__.c.rs_end_epoch,
+)
+
+# Services that book their appraiser for their period. Overlap lookups must
+# repeat this condition verbatim for Postgres to use the constraint's index.
+BookingCondition = "deleted_at_epoch = -1 AND rs_status = 'ACTIVE'"
+
+# An appraiser cannot be booked on two overlapping services
+BookingConstraint = "ex_reappraisal_service_appraiser_period"
+ReappraisalServiceTable.__table__.append_constraint(
+    epoch_range_exclusion(
+        BookingConstraint,
+        ReappraisalServiceTable.__table__.c.ap_id,
+        ReappraisalServiceTable.__table__.c.rs_start_epoch,
+        ReappraisalServiceTable.__table__.c.rs_end_epoch,
+        where=BookingCondition,
+    )
+)
  
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from app.api.model.reimbursement.reimbursement_table import (
     ReappraisalServiceReimbursementIDField,
     ReappraisalReimbursementCategoryField,
@@ -9,7 +9,9 @@ from app.api.model.reimbursement.reimbursement_table import (
     ReappraisalServiceReimbursementFilePathField,
     ReappraisalServiceIDField,
 )
-from sqlmodel import SQLModel
+from app.api.model.general.generic_regex import IdRegexPattern
+from app.api.services.batch.batch import MAX_BATCH_SIZE
+from sqlmodel import Field, SQLModel
 
 
 class ReappraisalServiceReimbursementCreateRequest(SQLModel):
@@ -27,6 +29,25 @@ class ReappraisalServiceReimbursementCreateRequest(SQLModel):
   
 
 
+class ReappraisalServiceReimbursementBatchUpdateRequest(
+    ReappraisalServiceReimbursementCreateRequest
+):
+    rs_reimbursement_id: str = Field(
+        title="Reappraisal Service Reimbursement ID",
+        description="Reimbursement to update, formatted as a UUID.",
+        schema_extra={"pattern": IdRegexPattern},
+    )
+
+
+class ReappraisalServiceReimbursementBatchDeleteRequest(SQLModel):
+    rs_reimbursement_ids: List[str] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        title="Reappraisal Service Reimbursement IDs",
+        description="Reimbursements to soft-delete.",
+    )
+
+
 class ReimbursementFileUpdate(SQLModel):
     rs_reimbursement_file_path: Optional[str] = (
         ReappraisalServiceReimbursementFilePathField
@@ -6,9 +6,11 @@ from sqlmodel import (
     Enum,
     Field,
     ForeignKey,
+    Index,
     Integer,
     Relationship,
     String,
+    text,
 )
 from typing import List, TYPE_CHECKING
 from app.api.model import enum
@@ -139,4 +141,25 @@ class ReappraisalServiceReimbursementTable(BaseTable, table=True):
     )
    
     service: "ReappraisalServiceTable" = ServiceRelationship
+
+    # Supports cursor pagination ordered by (created_at_epoch, id)
+    __table_args__ = (
+        Index(
+            "ix_reappraisal_service_reimbursement_created_at_epoch_rsr_id",
+            "created_at_epoch",
+            "rsr_id",
+        ),
+        # Supports the per-service totals kept on reappraisal_service
+        Index(
+            "ix_reappraisal_service_reimbursement_rs_id_live",
+            "rs_id",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+        # List filter on the transaction date of live rows
+        Index(
+            "ix_reappraisal_service_reimbursement_rsr_transaction_epoch_live",
+            "rsr_transaction_epoch",
+            postgresql_where=text("deleted_at_epoch = -1"),
+        ),
+    )
    
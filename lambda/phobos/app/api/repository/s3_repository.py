@@ -1,42 +1,167 @@
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from email.utils import format_datetime, parsedate_to_datetime
 from io import BytesIO
-from typing import Annotated
+from typing import IO, Annotated, Any, AsyncIterator, Callable, Tuple
 import uuid
+from botocore.exceptions import ClientError
 from fastapi import UploadFile, Depends
 from urllib.parse import urlparse
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.dao.document_dao import DocumentDAO
+from app.api.db_connection.db_connection import DBSessionDependency
 from app.api.db_connection.db_config import (
     s3_client,
     AWS_S3_BUCKET,
     AWS_S3_BASE_URL,
     AWS_REGION,
+    S3_MAX_POOL_CONNECTIONS,
 )
 import mimetypes
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from app.api.model.document.document_table import DocumentTable
+from app.api.model.enum.document_owner_enum import DocumentOwnerEnum
+
+# boto3 blocks while it talks to S3, so S3Client runs every call on this
+# pool instead of the event loop. One thread per pooled connection.
+S3_EXECUTOR = ThreadPoolExecutor(
+    max_workers=S3_MAX_POOL_CONNECTIONS, thread_name_prefix="s3"
+)
+
+# Bytes read from S3 per streamed chunk
+S3_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bytes per part of a streamed upload, and so the most held in memory.
+# S3 requires every part but the last to be at least 5 MiB.
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_UPLOAD_PART_SIZE = max(
+    int(os.getenv("S3_UPLOAD_PART_SIZE", str(S3_MIN_PART_SIZE))), S3_MIN_PART_SIZE
+)
+
+# Cache-Control of streamed files. Files are private, and a replaced file is
+# served from the same endpoint, so clients revalidate with the ETag each time.
+S3_FILE_CACHE_CONTROL = os.getenv("S3_FILE_CACHE_CONTROL", "private, no-cache")
+
+# Lifetime of presigned upload and download URLs
+S3_PRESIGNED_URL_EXPIRY = int(os.getenv("S3_PRESIGNED_URL_EXPIRY", "300"))
+
+
+def file_digest(fileobj: IO[bytes]) -> Tuple[int, str]:
+    """Size and hex SHA-256 of a file object from its current position, which it is left at."""
+    start = fileobj.tell()
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := fileobj.read(S3_STREAM_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(start)
+    return size, digest.hexdigest()
 
 
 class S3Client:
-    def __init__(self):
+    def __init__(self, session: AsyncSession | None = None):
         self.s3 = s3_client
         self.bucket = AWS_S3_BUCKET
         self.base_url_template = AWS_S3_BASE_URL
         self.region = AWS_REGION
+        # Uploads are cataloged in the document table when given a session
+        self.documents = DocumentDAO(session) if session is not None else None
+
+    async def _run(self, call: Callable[..., Any], *args, **kwargs) -> Any:
+        """Runs a blocking S3 client call on S3_EXECUTOR."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(S3_EXECUTOR, partial(call, *args, **kwargs))
+
+    async def _read_body(self, body: Any) -> AsyncIterator[bytes]:
+        """Streams a get_object body, reading each chunk off the event loop."""
+        try:
+            while chunk := await self._run(body.read, S3_STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            body.close()
+
+    async def _catalog(
+        self,
+        key: str,
+        size: int,
+        sha256: str,
+        content_type: str,
+        owner_type: DocumentOwnerEnum | None = None,
+        owner_id: str | None = None,
+    ) -> None:
+        if self.documents is None:
+            return
+        await self.documents.record_document(
+            DocumentTable(
+                document_key=key,
+                document_size=size,
+                document_sha256=sha256,
+                document_content_type=content_type,
+                document_owner_type=owner_type,
+                document_owner_id=owner_id,
+            )
+        )
+
+    async def _content_type(self, key: str) -> str:
+        """
+        The type the file at key is served with: the one it was cataloged
+        with, guessed from the key for files the catalog does not know.
+        """
+        document = (
+            await self.documents.get_document_by_key(key)
+            if self.documents is not None
+            else None
+        )
+        if document is not None:
+            return document.document_content_type
+        content_type, _ = mimetypes.guess_type(key)
+        return content_type or "application/octet-stream"
+
+    async def _replace(
+        self,
+        key: str,
+        size: int,
+        sha256: str,
+        content_type: str,
+        old_file_url: str | None,
+        owner_type: DocumentOwnerEnum | None,
+        owner_id: str | None,
+    ) -> str:
+        """
+        Catalogs a newly stored object that replaces old_file_url and deletes
+        the old file. A new object with the same contents as the old file is
+        a duplicate: it is deleted instead and the old URL kept. Live copies
+        held by other records are left alone, since deleting either record's
+        file would break the other's URL.
+        """
+        if self.documents is not None and old_file_url:
+            old_key = self.file_key(old_file_url)
+            duplicates = await self.documents.get_documents_by_sha256(sha256)
+            if old_key != key and any(doc.document_key == old_key for doc in duplicates):
+                await self._run(self.s3.delete_object, Bucket=self.bucket, Key=key)
+                return old_file_url
+
+        await self._catalog(key, size, sha256, content_type, owner_type, owner_id)
+        file_url = self.file_url(key)
+        if old_file_url != file_url:
+            await self.delete_file(old_file_url)
+        return file_url
 
     async def upload_file(
         self,
         file: UploadFile,
         key_prefix: str,  # generic "folder path" (built outside)
         old_file_url: str | None = None,
+        owner_type: DocumentOwnerEnum | None = None,
+        owner_id: str | None = None,
     ) -> str:
         """
-        Deletes old file (if any) and uploads new file to S3 using the given key_prefix.
-        Returns the new file URL.
+        Uploads new file to S3 using the given key_prefix, then deletes the old
+        file (if any). Returns the new file URL.
         """
-        # Delete old file if exists
-        if old_file_url:
-            parsed = urlparse(old_file_url)
-            key = parsed.path.lstrip("/")
-            if key:
-                self.s3.delete_object(Bucket=self.bucket, Key=key)
-
         # Generate unique filename
         file_extension = file.filename.split(".")[-1]
         unique_filename = f"{uuid.uuid4()}.{file_extension}"
@@ -45,49 +170,275 @@ class S3Client:
         key = f"{key_prefix}/{unique_filename}"
 
         # Upload to S3
-        self.s3.upload_fileobj(file.file, self.bucket, key)
+        size, sha256 = await self._run(file_digest, file.file)
+        await self._run(self.s3.upload_fileobj, file.file, self.bucket, key)
 
-        # Build final file URL
-        base_url = self.base_url_template.format(bucket=self.bucket, region=self.region)
-        file_url = f"{base_url}/{key}"
+        content_type = file.content_type or "application/octet-stream"
+        return await self._replace(
+            key, size, sha256, content_type, old_file_url, owner_type, owner_id
+        )
 
-        return file_url
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        key_prefix: str,
+        file_extension: str,
+        content_type: str,
+        old_file_url: str | None = None,
+        owner_type: DocumentOwnerEnum | None = None,
+        owner_id: str | None = None,
+    ) -> str:
+        """
+        Uploads a byte stream to a new key under key_prefix in parts of
+        S3_UPLOAD_PART_SIZE, holding at most one part in memory. A stream
+        that fits in one part goes up with a single put_object, a longer one
+        as a multipart upload, which is aborted if the stream raises. The
+        old file (if any) is deleted once the new one is stored.
+        Returns the new file URL.
+        """
+        key = f"{key_prefix}/{uuid.uuid4()}.{file_extension}"
+        pending = bytearray()
+        upload_id = None
+        parts = []
+        digest = hashlib.sha256()
+        size = 0
+
+        async def upload_part(data: bytes) -> None:
+            response = await self._run(
+                self.s3.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=data,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                pending += chunk
+                while len(pending) >= S3_UPLOAD_PART_SIZE:
+                    if upload_id is None:
+                        upload = await self._run(
+                            self.s3.create_multipart_upload,
+                            Bucket=self.bucket,
+                            Key=key,
+                            ContentType=content_type,
+                        )
+                        upload_id = upload["UploadId"]
+                    part = bytes(pending[:S3_UPLOAD_PART_SIZE])
+                    del pending[:S3_UPLOAD_PART_SIZE]
+                    await upload_part(part)
+
+            if upload_id is None:
+                await self._run(
+                    self.s3.put_object,
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=bytes(pending),
+                    ContentType=content_type,
+                )
+            else:
+                if pending:
+                    await upload_part(bytes(pending))
+                await self._run(
+                    self.s3.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            # Uploaded parts are stored (and billed) until the upload is aborted
+            if upload_id is not None:
+                await self._run(
+                    self.s3.abort_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            raise
+
+        return await self._replace(
+            key, size, digest.hexdigest(), content_type, old_file_url, owner_type, owner_id
+        )
+
+    async def catalog_upload(
+        self,
+        key: str,
+        content_type: str,
+        old_file_url: str | None = None,
+        owner_type: DocumentOwnerEnum | None = None,
+        owner_id: str | None = None,
+    ) -> str:
+        """
+        Catalogs an object uploaded to S3 directly (through a presigned URL),
+        hashing it as it is read back, and replaces old_file_url with it.
+        Returns the file URL.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        if self.documents is not None:
+            obj = await self._run(self.s3.get_object, Bucket=self.bucket, Key=key)
+            async for chunk in self._read_body(obj["Body"]):
+                digest.update(chunk)
+                size += len(chunk)
+        return await self._replace(
+            key, size, digest.hexdigest(), content_type, old_file_url, owner_type, owner_id
+        )
 
     async def stream_file(
         self,
         file_url: str,
         download: bool = False,
-    ) -> StreamingResponse:
+        range_header: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
+    ) -> Response:
+        """
+        Streams a stored file. Range, If-None-Match and If-Modified-Since
+        request headers are passed through to S3, so a byte range comes back
+        as 206 and an unchanged file as 304 with no body.
+        """
         parsed = urlparse(file_url)
         key = parsed.path.lstrip("/").replace("//", "/")
 
-        content_type, _ = mimetypes.guess_type(key)
-        if not content_type:
-            content_type = "application/octet-stream"
-
+        content_type = await self._content_type(key)
         disposition = "attachment" if download else "inline"
 
-        obj = self.s3.get_object(Bucket=self.bucket, Key=key)
-        file_stream = obj["Body"]
+        conditions = {}
+        if range_header:
+            conditions["Range"] = range_header
+        if if_none_match:
+            conditions["IfNoneMatch"] = if_none_match
+        if if_modified_since:
+            # An invalid date is ignored, as HTTP requires
+            try:
+                conditions["IfModifiedSince"] = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                pass
+
+        try:
+            obj = await self._run(
+                self.s3.get_object, Bucket=self.bucket, Key=key, **conditions
+            )
+        except ClientError as e:
+            status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if status_code not in (304, 416):
+                raise
+            # Not modified, or the range is outside the file
+            headers = {"Accept-Ranges": "bytes", "Cache-Control": S3_FILE_CACHE_CONTROL}
+            s3_headers = e.response["ResponseMetadata"].get("HTTPHeaders", {})
+            if status_code == 304 and "etag" in s3_headers:
+                headers["ETag"] = s3_headers["etag"]
+            if status_code == 416 and "content-range" in s3_headers:
+                headers["Content-Range"] = s3_headers["content-range"]
+            return Response(status_code=status_code, headers=headers)
+
+        headers = {
+            "Content-Disposition": f"{disposition}; filename={key.split('/')[-1]}",
+            "Content-Length": str(obj["ContentLength"]),
+            "Accept-Ranges": "bytes",
+            "Cache-Control": S3_FILE_CACHE_CONTROL,
+        }
+        if obj.get("ETag"):
+            headers["ETag"] = obj["ETag"]
+        if obj.get("LastModified"):
+            headers["Last-Modified"] = format_datetime(obj["LastModified"], usegmt=True)
+        if obj.get("ContentRange"):
+            headers["Content-Range"] = obj["ContentRange"]
 
         return StreamingResponse(
-            file_stream,
+            self._read_body(obj["Body"]),
+            status_code=206 if obj.get("ContentRange") else 200,
             media_type=content_type,
-            headers={
-                "Content-Disposition": f"{disposition}; filename={key.split('/')[-1]}"
+            headers=headers,
+        )
+
+    def file_url(self, key: str) -> str:
+        """The file URL stored for an S3 key."""
+        base_url = self.base_url_template.format(bucket=self.bucket, region=self.region)
+        return f"{base_url}/{key}"
+
+    def file_key(self, file_url: str) -> str:
+        """The S3 key of a stored file URL."""
+        return urlparse(file_url).path.lstrip("/").replace("//", "/")
+
+    async def presigned_upload_url(self, key: str, content_type: str) -> str:
+        """
+        Presigned PUT URL for key, valid for S3_PRESIGNED_URL_EXPIRY seconds.
+        The upload must send the same Content-Type header.
+        """
+        return await self._run(
+            self.s3.generate_presigned_url,
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=S3_PRESIGNED_URL_EXPIRY,
+        )
+
+    async def presigned_download_url(self, file_url: str, download: bool = False) -> str:
+        """
+        Presigned GET URL for a stored file, valid for S3_PRESIGNED_URL_EXPIRY
+        seconds, served with the same headers as stream_file.
+        """
+        key = urlparse(file_url).path.lstrip("/").replace("//", "/")
+        disposition = "attachment" if download else "inline"
+        return await self._run(
+            self.s3.generate_presigned_url,
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ResponseContentType": await self._content_type(key),
+                "ResponseContentDisposition": f"{disposition}; filename={key.split('/')[-1]}",
             },
+            ExpiresIn=S3_PRESIGNED_URL_EXPIRY,
         )
 
+    async def head_object(self, key: str) -> dict | None:
+        """The object's metadata, or None if there is no object at key."""
+        try:
+            return await self._run(self.s3.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    async def read_range(self, key: str, length: int) -> bytes:
+        """The first length bytes of the object at key."""
+        obj = await self._run(
+            self.s3.get_object, Bucket=self.bucket, Key=key, Range=f"bytes=0-{length - 1}"
+        )
+        try:
+            return await self._run(obj["Body"].read)
+        finally:
+            obj["Body"].close()
+
     async def upload_bytesio(
         self,
         buffer: BytesIO,
         key_prefix: str,
         filename: str,
+        owner_type: DocumentOwnerEnum | None = None,
+        owner_id: str | None = None,
     ) -> str:
 
         key = f"{key_prefix}/{filename}"
         # Upload the buffer
-        self.s3.upload_fileobj(buffer, self.bucket, key)
+        size, sha256 = await self._run(file_digest, buffer)
+        await self._run(self.s3.upload_fileobj, buffer, self.bucket, key)
+
+        content_type, _ = mimetypes.guess_type(filename)
+        await self._catalog(
+            key,
+            size,
+            sha256,
+            content_type or "application/octet-stream",
+            owner_type,
+            owner_id,
+        )
 
         # Build final URL
         base_url = self.base_url_template.format(bucket=self.bucket, region=self.region)
@@ -103,11 +454,13 @@ class S3Client:
             parsed = urlparse(file_url)
             key = parsed.path.lstrip("/")
             if key:
-                self.s3.delete_object(Bucket=self.bucket, Key=key)
+                await self._run(self.s3.delete_object, Bucket=self.bucket, Key=key)
+                if self.documents is not None:
+                    await self.documents.delete_document_by_key(key)
 
 
-async def get_s3_client():
-    yield S3Client()
+async def get_s3_client(session: DBSessionDependency):
+    yield S3Client(session)
 
 
 S3ClientDependency = Annotated[S3Client, Depends(get_s3_client)]
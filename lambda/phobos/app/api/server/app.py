@@ -21,6 +21,8 @@ from app.api.controller.appraiser.appraiser_controller import router as appraise
 # from app.api.router import router as test_router
 from app.api.exceptions.appraiser_exception import DuplicatePanException, ValidationException
 from app.api.exceptions.api_error_codes import ApiErrorCode
+from app.api.services.search_filter.searchfilter import build_all_field_resolutions
+from app.api.services.reference_cache.reference_cache import reference_cache
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -60,6 +62,9 @@ app.include_router(appraiser_router, tags=["Appraiser_Api"])
 # app.include_router(advance_router, tags=["Advance_Api"])
 # app.include_router(test_router, tags=["Test_Api"])
 
+# Filter field tables are built once at import so ambiguous fields fail at startup
+build_all_field_resolutions()
+
 @app.get("/")
 async def root():
     """Root endpoint with comprehensive application status"""
@@ -75,3 +80,9 @@ async def root():
             "Lambda deployment ready",
         ],
     }
+
+
+@app.get("/v1/cache/reference/stats")
+async def reference_cache_stats():
+    """Hit, miss and eviction counters of this instance's bank/branch reference cache"""
+    return reference_cache.stats()
@@ -1,29 +1,51 @@
-from http.client import HTTPException
-from fastapi import UploadFile
+from app.api.exceptions.reimbursment_exception import (
+    FileTooLargeAPIException,
+    FileTypeNotAllowedAPIException,
+)
 
+# Reappraisal completion certificates and reimbursement proofs
+ALLOWED_FILE_TYPES = ("image/png", "image/jpeg", "application/pdf", "image/jpg")
+MAX_FILE_SIZE_MB = 5
 
-def validate_reappraisal_file(file: UploadFile, max_size_mb: int = 5):
+# Leading bytes of each allowed type, so a renamed file cannot pass as one
+FILE_SIGNATURES = {
+    "image/png": b"\x89PNG\r\n\x1a\n",
+    "image/jpeg": b"\xff\xd8\xff",
+    "image/jpg": b"\xff\xd8\xff",
+    "application/pdf": b"%PDF-",
+}
+
+
+class ReappraisalFileValidator:
     """
-    Validate file type and size for reappraisal completion certificates.
+    Validates a reappraisal file while it arrives, chunk by chunk: the
+    declared content type up front, then the file signature once its first
+    bytes are in, and the running size against the limit.
     Allowed: PNG, JPG, PDF
     Max Size: 5 MB
     """
-    allowed_types = ["image/png", "image/jpeg", "application/pdf", "image/jpg"]
-
-    # Check content type
-    if file.content_type not in allowed_types:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type: {file.content_type}. Allowed: PNG, JPG, PDF.",
-        )
-
-    # check size
-    file.file.seek(0, 2)  # move to end of file
-    size = file.file.tell()
-    file.file.seek(0)  # reset pointer
-
-    if size > max_size_mb * 1024 * 1024:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large: {size / (1024*1024):.2f} MB. Max allowed: {max_size_mb} MB.",
-        )
+
+    def __init__(self, content_type: str, max_size_mb: int = MAX_FILE_SIZE_MB):
+        if content_type not in ALLOWED_FILE_TYPES:
+            raise FileTypeNotAllowedAPIException(content_type, ALLOWED_FILE_TYPES)
+        self.content_type = content_type
+        self.max_size_mb = max_size_mb
+        self.size = 0
+        self._head = b""
+
+    def check(self, chunk: bytes) -> None:
+        """Accounts for the next chunk of the file."""
+        self.size += len(chunk)
+        if self.size > self.max_size_mb * 1024 * 1024:
+            raise FileTooLargeAPIException(self.max_size_mb)
+
+        signature = FILE_SIGNATURES[self.content_type]
+        if len(self._head) < len(signature):
+            self._head += chunk[: len(signature) - len(self._head)]
+            if not signature.startswith(self._head):
+                raise FileTypeNotAllowedAPIException(self.content_type, ALLOWED_FILE_TYPES)
+
+    def finish(self) -> None:
+        """Checks a file that ended before its signature was complete."""
+        if len(self._head) < len(FILE_SIGNATURES[self.content_type]):
+            raise FileTypeNotAllowedAPIException(self.content_type, ALLOWED_FILE_TYPES)
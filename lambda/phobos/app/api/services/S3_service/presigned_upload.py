@@ -0,0 +1,76 @@
+import uuid
+from app.api.exceptions.api_exception import ApiException
+from app.api.exceptions.reimbursment_exception import (
+    FileNotFoundAPIException,
+    FileTooLargeAPIException,
+)
+from app.api.model.enum.document_owner_enum import DocumentOwnerEnum
+from app.api.model.general.presigned_file import (
+    PresignedUploadRequest,
+    PresignedUploadResponse,
+)
+from app.api.repository.s3_repository import S3_PRESIGNED_URL_EXPIRY, S3Client
+from app.api.services.S3_service.file_validation import (
+    FILE_SIGNATURES,
+    ReappraisalFileValidator,
+)
+
+# Bytes fetched from an uploaded object to check its file signature
+SIGNATURE_LENGTH = max(len(signature) for signature in FILE_SIGNATURES.values())
+
+
+async def presigned_upload(
+    s3: S3Client, key_prefix: str, payload: PresignedUploadRequest
+) -> PresignedUploadResponse:
+    """
+    Presigned PUT URL for a new file under key_prefix. The content type is
+    checked up front; size and contents are checked when the upload is
+    finalized, since a presigned PUT cannot limit them.
+    """
+    ReappraisalFileValidator(payload.content_type)
+    key = f"{key_prefix}/{uuid.uuid4()}.{payload.filename.split('.')[-1]}"
+    return PresignedUploadResponse(
+        upload_url=await s3.presigned_upload_url(key, payload.content_type),
+        key=key,
+        expires_in=S3_PRESIGNED_URL_EXPIRY,
+        headers={"Content-Type": payload.content_type},
+    )
+
+
+async def finalize_presigned_upload(
+    s3: S3Client,
+    key_prefix: str,
+    key: str,
+    old_file_url: str | None = None,
+    owner_type: DocumentOwnerEnum | None = None,
+    owner_id: str | None = None,
+) -> str:
+    """
+    Validates a file uploaded through a presigned URL the same way a proxied
+    upload is validated, deleting it if it fails. Catalogs it, replaces (and
+    deletes) the old file and returns the new file URL.
+    """
+    # Only keys issued for this record, directly under its prefix
+    name = key.removeprefix(f"{key_prefix}/")
+    if name == key or not name or "/" in name:
+        raise FileNotFoundAPIException(file_url=key)
+
+    head = await s3.head_object(key)
+    if head is None:
+        raise FileNotFoundAPIException(file_url=key)
+
+    file_url = s3.file_url(key)
+    try:
+        validator = ReappraisalFileValidator(head.get("ContentType", ""))
+        if head["ContentLength"] > validator.max_size_mb * 1024 * 1024:
+            raise FileTooLargeAPIException(validator.max_size_mb)
+        if head["ContentLength"]:
+            validator.check(await s3.read_range(key, SIGNATURE_LENGTH))
+        validator.finish()
+    except ApiException:
+        await s3.delete_file(file_url)
+        raise
+
+    return await s3.catalog_upload(
+        key, head["ContentType"], old_file_url, owner_type, owner_id
+    )
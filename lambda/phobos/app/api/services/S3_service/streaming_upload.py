@@ -0,0 +1,151 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+from fastapi import Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+from app.api.exceptions.reimbursment_exception import FileMissingAPIException
+from app.api.services.S3_service.file_validation import (
+    MAX_FILE_SIZE_MB,
+    ReappraisalFileValidator,
+)
+
+
+class MultipartFileStream:
+    """
+    One file field of a multipart/form-data request, read straight off the
+    request body instead of spooled by UploadFile. open() reads up to the
+    field's part headers and checks its content type; chunks() then yields
+    the file as it arrives, validated on the way, so an oversized or
+    mislabelled file is rejected before the rest of it is read.
+    """
+
+    def __init__(
+        self, request: Request, field_name: str, max_size_mb: int = MAX_FILE_SIZE_MB
+    ):
+        self.request = request
+        self.field_name = field_name
+        self.max_size_mb = max_size_mb
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+
+        content_type, params = parse_options_header(request.headers.get("content-type"))
+        boundary = params.get(b"boundary")
+        if content_type != b"multipart/form-data" or not boundary:
+            raise FileMissingAPIException(field_name)
+
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+        self._body: Optional[AsyncIterator[bytes]] = None
+        self._validator: Optional[ReappraisalFileValidator] = None
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._in_file = False
+        self._found = False
+        self._complete = False
+        self._pending: List[bytes] = []
+
+    @property
+    def file_extension(self) -> str:
+        return self.filename.split(".")[-1]
+
+    # Parser callbacks
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, disposition = parse_options_header(self._headers.get(b"content-disposition"))
+        if self._found or disposition.get(b"name", b"").decode() != self.field_name:
+            return
+        self._in_file = self._found = True
+        self.filename = disposition.get(b"filename", b"").decode()
+        self.content_type = self._headers.get(
+            b"content-type", b"application/octet-stream"
+        ).decode()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._pending.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._complete = True
+
+    async def _feed(self) -> bool:
+        """Parses the next chunk of the request body. False once it is exhausted."""
+        try:
+            chunk = await self._body.__anext__()
+        except StopAsyncIteration:
+            return False
+        self._parser.write(chunk)
+        return True
+
+    async def open(self) -> "MultipartFileStream":
+        """Reads up to the file part and validates its declared content type."""
+        self._body = self.request.stream().__aiter__()
+        while not self._found:
+            if not await self._feed():
+                raise FileMissingAPIException(self.field_name)
+        if not self.filename:
+            raise FileMissingAPIException(self.field_name)
+        self._validator = ReappraisalFileValidator(self.content_type, self.max_size_mb)
+        return self
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yields the file contents, holding at most one request chunk at a time."""
+        while True:
+            pending, self._pending = self._pending, []
+            for data in pending:
+                self._validator.check(data)
+                yield data
+            if self._complete:
+                break
+            if not await self._feed():
+                # The body ended inside the file part
+                raise FileMissingAPIException(self.field_name)
+        self._validator.finish()
+
+
+def multipart_file_openapi(field_name: str) -> Dict[str, Any]:
+    """
+    openapi_extra documenting a multipart request body with one required
+    file field, for endpoints that read it with MultipartFileStream rather
+    than declaring an UploadFile parameter.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            field_name: {"type": "string", "format": "binary"}
+                        },
+                        "required": [field_name],
+                    }
+                }
+            },
+        }
+    }
@@ -0,0 +1,75 @@
+import json
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel, Field, ValidationError
+from sqlmodel import SQLModel
+
+# Upper bound on items per batch request
+MAX_BATCH_SIZE = 100
+
+T = TypeVar("T", bound=SQLModel)
+R = TypeVar("R", bound=SQLModel)
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    """Outcome of one item of a batch request, at its position in the request."""
+
+    index: int = Field(description="Position of the item in the request body")
+    ok: bool
+    item: Optional[T] = None
+    errors: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Validation errors, or why the item was skipped"
+    )
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    results: List[BatchItemResult[T]]
+    succeeded: int = 0
+    failed: int = 0
+
+
+def validate_batch(
+    items: List[Dict[str, Any]], request_model: Type[R], **overrides: Any
+) -> Tuple[List[Tuple[int, R]], Dict[int, List[Dict[str, Any]]]]:
+    """
+    Validates each raw item against `request_model` on its own, with
+    `overrides` (e.g. the parent id from the path) applied to every item.
+    Returns the valid items with their index and the errors of every invalid one.
+    """
+    valid: List[Tuple[int, R]] = []
+    failures: Dict[int, List[Dict[str, Any]]] = {}
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, request_model.model_validate({**item, **overrides})))
+        except ValidationError as e:
+            failures[index] = json.loads(e.json(include_url=False))
+    return valid, failures
+
+
+def batch_response(
+    total: int,
+    succeeded: Dict[int, Any],
+    failures: Dict[int, List[Dict[str, Any]]],
+    response_model: Type[T],
+) -> BatchResponse[T]:
+    """
+    Builds the per-item response in request order. Items neither succeeded
+    nor failed validation are reported as not found.
+    """
+    results = []
+    for index in range(total):
+        if index in succeeded:
+            results.append(
+                BatchItemResult[response_model](
+                    index=index,
+                    ok=True,
+                    item=response_model.model_validate(succeeded[index]),
+                )
+            )
+        else:
+            errors = failures.get(index) or [{"type": "not_found", "msg": "Record not found"}]
+            results.append(
+                BatchItemResult[response_model](index=index, ok=False, errors=errors)
+            )
+    return BatchResponse[response_model](
+        results=results, succeeded=len(succeeded), failed=total - len(succeeded)
+    )
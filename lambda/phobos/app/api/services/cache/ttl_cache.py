@@ -0,0 +1,57 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """
+    TTL + LRU mapping local to the process. Entries expire ttl_seconds after
+    they are set, and the least recently used entry is evicted past
+    max_entries. on_discard is called with the key and value of every entry
+    that leaves the cache, however it leaves.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        max_entries: int,
+        on_discard: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.on_discard = on_discard
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self.pop(key)
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.pop(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        while len(self._entries) > self.max_entries:
+            self.pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and self.on_discard is not None:
+            self.on_discard(key, entry[1])
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def clear(self) -> None:
+        for key in self.keys():
+            self.pop(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,133 @@
+import asyncio
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
+from fastapi import Depends
+from sqlalchemy.orm import class_mapper
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.dao.dao import DAO
+from app.api.db_connection.db_connection import DBSessionDependency
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+M = TypeVar("M", bound=SQLModel)
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Collects the keys passed to load() within one event-loop tick and
+    resolves them with a single call of `batch_load`, which returns the found
+    values by key (missing keys resolve to None). Results are memoized for
+    the loader's lifetime, so a key is fetched at most once.
+    """
+
+    def __init__(self, batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]]):
+        self.batch_load = batch_load
+        self._futures: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._queue: List[K] = []
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        asyncio.ensure_future(self._resolve(keys))
+
+    async def _resolve(self, keys: List[K]) -> None:
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            # Failures are not memoized; a later load retries the key
+            for key in keys:
+                self._futures.pop(key).set_exception(e)
+            return
+        for key in keys:
+            self._futures[key].set_result(values.get(key))
+
+
+class RequestLoaders:
+    """
+    One DataLoader per table for the lifetime of a request. Each batch is a
+    single DAO.get_records_by_ids query over live (not soft-deleted) rows,
+    loading no relationships. Batches for different tables share the
+    request's session, so they run one at a time.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._loaders: Dict[Type[SQLModel], DataLoader] = {}
+        self._lock = asyncio.Lock()
+
+    def loader(self, model_class: Type[M]) -> DataLoader[Any, M]:
+        loader = self._loaders.get(model_class)
+        if loader is None:
+            loader = DataLoader(
+                lambda record_ids: self._load_records(model_class, record_ids)
+            )
+            self._loaders[model_class] = loader
+        return loader
+
+    def load(self, model_class: Type[M], record_id: Any) -> "asyncio.Future[Optional[M]]":
+        """
+        Loads one live row by primary key. Ids are coerced to the key's type,
+        so the String(36) foreign keys on reappraisal_service resolve integer
+        keys such as bk_id.
+        """
+        pk_column = class_mapper(model_class).primary_key[0]
+        try:
+            key = pk_column.type.python_type(record_id)
+        except (TypeError, ValueError):
+            # An id that cannot be a key of the table matches no row
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(None)
+            return future
+        return self.loader(model_class).load(key)
+
+    async def load_many(
+        self, model_class: Type[M], record_ids: Iterable[Any]
+    ) -> List[Optional[M]]:
+        return list(
+            await asyncio.gather(
+                *(self.load(model_class, record_id) for record_id in record_ids)
+            )
+        )
+
+    async def _load_records(
+        self, model_class: Type[M], record_ids: List[Any]
+    ) -> Dict[Any, M]:
+        dao = DAO(self.session, model_class, {"loader": ()}).with_profile("loader")
+        pk_column = class_mapper(model_class).primary_key[0]
+        pk_attr = class_mapper(model_class).get_property_by_column(pk_column).key
+        async with self._lock:
+            records = await dao.get_records_by_ids(record_ids)
+        return {getattr(record, pk_attr): record for record in records}
+
+
+async def get_request_loaders(session: DBSessionDependency) -> RequestLoaders:
+    return RequestLoaders(session)
+
+
+RequestLoadersDependency = Annotated[RequestLoaders, Depends(get_request_loaders)]
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+import os
+from enum import Enum
+from typing import Any, AsyncIterator, List, Sequence
+from fastapi.responses import StreamingResponse
+from app.api.model.enum.export_format_enum import ExportFormatEnum
+
+# Rows fetched per server-side cursor round trip, and encoded per chunk
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+async def ndjson_chunks(
+    batches: AsyncIterator[Sequence[Any]], columns: List[str]
+) -> AsyncIterator[bytes]:
+    """One JSON object per row and line, one chunk per batch."""
+    async for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(columns, map(_plain, row)))) + "\n" for row in rows
+        ).encode()
+
+
+async def csv_chunks(
+    batches: AsyncIterator[Sequence[Any]], columns: List[str]
+) -> AsyncIterator[bytes]:
+    """A header row, then one chunk of CSV rows per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(map(_plain, row) for row in rows)
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    batches: AsyncIterator[Sequence[Any]],
+    columns: List[str],
+    export_format: ExportFormatEnum,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Streams row batches as an NDJSON or CSV attachment. Each batch is
+    encoded and sent before the next is read, so only one batch is held in
+    memory at a time.
+    """
+    encode = csv_chunks if export_format == ExportFormatEnum.CSV else ndjson_chunks
+    return StreamingResponse(
+        encode(batches, columns),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
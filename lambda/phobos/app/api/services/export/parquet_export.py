@@ -0,0 +1,164 @@
+import os
+import tempfile
+from dataclasses import dataclass
+from enum import Enum as PyEnum
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import BigInteger, Boolean, Enum, Integer, Table, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.model.advance.advance_table import ReappraisalServiceAdvanceTable
+from app.api.model.general.epoch_range import epoch_range
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceTable,
+)
+from app.api.model.reimbursement.reimbursement_table import (
+    ReappraisalServiceReimbursementTable,
+)
+from app.api.repository.s3_repository import S3Client
+
+# Rows per Parquet row group, which is also the number of rows held in
+# memory at a time
+PARQUET_ROW_GROUP_SIZE = int(os.getenv("PARQUET_ROW_GROUP_SIZE", "50000"))
+
+
+def _service_period(table: Table, from_epoch: int, to_epoch: int) -> Any:
+    # Services whose period overlaps the window, through the period GiST index
+    window = epoch_range(literal(from_epoch, BigInteger), literal(to_epoch, BigInteger))
+    return epoch_range(table.c.rs_start_epoch, table.c.rs_end_epoch).op("&&")(window)
+
+
+def _transaction_period(column_name: str) -> Callable[[Table, int, int], Any]:
+    def condition(table: Table, from_epoch: int, to_epoch: int) -> Any:
+        return table.c[column_name].between(from_epoch, to_epoch)
+
+    return condition
+
+
+# Exportable tables and the condition selecting a period's rows from each
+SNAPSHOT_TABLES: Dict[str, Callable[[Table, int, int], Any]] = {
+    ReappraisalServiceTable.__tablename__: _service_period,
+    ReappraisalServiceReimbursementTable.__tablename__: _transaction_period(
+        "rsr_transaction_epoch"
+    ),
+    ReappraisalServiceAdvanceTable.__tablename__: _transaction_period(
+        "rsa_transaction_epoch"
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SnapshotExport:
+    """Where a period snapshot was written and how many rows it holds."""
+
+    table: str
+    rows: int
+    location: str
+
+
+def snapshot_table(table_name: str) -> Table:
+    """The table behind a SNAPSHOT_TABLES name."""
+    if table_name not in SNAPSHOT_TABLES:
+        raise ValueError(
+            f"Unknown snapshot table {table_name!r}; expected one of "
+            f"{', '.join(SNAPSHOT_TABLES)}"
+        )
+    return ReappraisalServiceTable.metadata.tables[table_name]
+
+
+def snapshot_statement(table_name: str, from_epoch: int, to_epoch: int) -> Any:
+    """The live rows of a table that fall in [from_epoch, to_epoch]."""
+    table = snapshot_table(table_name)
+    return (
+        select(table)
+        .where(
+            table.c.deleted_at_epoch == -1,
+            SNAPSHOT_TABLES[table_name](table, from_epoch, to_epoch),
+        )
+        .order_by(*table.primary_key.columns)
+    )
+
+
+def arrow_schema(table: Table) -> pa.Schema:
+    """
+    Parquet schema of a table. Amounts and epochs stay integers (paisa and
+    seconds), enums become dictionary-encoded strings.
+    """
+    fields = []
+    for column in table.columns:
+        if isinstance(column.type, Enum):
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        elif isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Boolean):
+            arrow_type = pa.bool_()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def record_batch(rows: Sequence[Sequence[Any]], schema: pa.Schema) -> pa.Table:
+    """Row tuples, in schema column order, as an Arrow table."""
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        values = [value.value if isinstance(value, PyEnum) else value for value in values]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, field.type))
+    if not arrays:
+        return schema.empty_table()
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+async def write_parquet(
+    batches: AsyncIterator[Sequence[Sequence[Any]]], schema: pa.Schema, sink: Any
+) -> int:
+    """Writes each batch as one row group. Returns the number of rows written."""
+    rows = 0
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        async for batch in batches:
+            writer.write_table(record_batch(batch, schema))
+            rows += len(batch)
+    return rows
+
+
+async def export_snapshot(
+    session: AsyncSession,
+    table_name: str,
+    from_epoch: int,
+    to_epoch: int,
+    path: Optional[str] = None,
+    s3_key_prefix: Optional[str] = None,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> SnapshotExport:
+    """
+    Writes a table's rows for the period to a Parquet file at `path`, or
+    uploads it through S3Client under `s3_key_prefix`. Rows are read through
+    a server-side cursor one row group at a time, so memory stays bounded
+    whatever the period size; an S3 upload is spooled through a temporary
+    file rather than memory.
+    """
+    if (path is None) == (s3_key_prefix is None):
+        raise ValueError("Give exactly one of path or s3_key_prefix")
+    if from_epoch > to_epoch:
+        raise ValueError(f"Empty period: {from_epoch} > {to_epoch}")
+
+    schema = arrow_schema(snapshot_table(table_name))
+    result = await session.stream(
+        snapshot_statement(table_name, from_epoch, to_epoch),
+        execution_options={"yield_per": row_group_size},
+    )
+
+    if path is not None:
+        rows = await write_parquet(result.partitions(), schema, path)
+        return SnapshotExport(table=table_name, rows=rows, location=path)
+
+    with tempfile.TemporaryFile() as spool:
+        rows = await write_parquet(result.partitions(), schema, spool)
+        spool.seek(0)
+        location = await S3Client(session).upload_bytesio(
+            spool, s3_key_prefix, f"{table_name}_{from_epoch}_{to_epoch}.parquet"
+        )
+    return SnapshotExport(table=table_name, rows=rows, location=location)
@@ -0,0 +1,136 @@
+import os
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+from app.api.services.pagination.pagination import PaginationResponse, map_items
+
+# Kill switch: "false" sends listings back through response_model validation
+# and the stdlib encoder
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() != "false"
+
+# Defaults of these types can be shared by every payload instead of copied
+IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str)
+
+# Marks fields whose default is not shared
+MISSING = object()
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # Nested models (e.g. a loaded relationship) are the only values
+        # orjson cannot encode itself. Rows loaded together share related
+        # instances, so each is dumped once.
+        dumped: Dict[int, Any] = {}
+
+        def default(value: Any) -> Any:
+            if not isinstance(value, BaseModel):
+                raise TypeError(f"{type(value).__name__} is not JSON serializable")
+            if id(value) not in dumped:
+                dumped[id(value)] = value.model_dump(mode="json")
+            return dumped[id(value)]
+
+        return orjson.dumps(content, default=default)
+
+
+@lru_cache(maxsize=None)
+def _response_shape(
+    response_model: Type[BaseModel],
+) -> Tuple[Tuple[Tuple[str, Any, Any], ...], Tuple[Tuple[str, Callable[[Any], Any]], ...]]:
+    """
+    (field, field info, shared default) triples in output order, and the
+    computed fields. The shared default is MISSING when each payload needs
+    its own copy (or the field is required).
+    """
+    fields = tuple(
+        (
+            name,
+            info,
+            (
+                info.default
+                if info.default_factory is None
+                and isinstance(info.default, IMMUTABLE_DEFAULTS)
+                else MISSING
+            ),
+        )
+        for name, info in response_model.model_fields.items()
+    )
+    computed = tuple(
+        (name, info.wrapped_property.fget)
+        for name, info in response_model.model_computed_fields.items()
+    )
+    return fields, computed
+
+
+def trusted_payload(response_model: Type[BaseModel], values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The response body of one response model instance built from `values`,
+    without building or validating the model: fields in declaration order,
+    model defaults for those not given, then computed fields. Values must
+    already have the model's types, as database rows do.
+    """
+    fields, computed = _response_shape(response_model)
+    payload = {}
+    for name, info, default in fields:
+        if name in values:
+            payload[name] = values[name]
+        elif default is not MISSING:
+            payload[name] = default
+        else:
+            payload[name] = info.get_default(call_default_factory=True)
+    if computed:
+        instance = SimpleNamespace(**payload)
+        for name, getter in computed:
+            payload[name] = getter(instance)
+    return payload
+
+
+def _record_fields(response_model: Type[BaseModel], record: Any) -> Dict[str, Any]:
+    # The response fields the record has; model defaults fill in the rest
+    return {
+        name: getattr(record, name)
+        for name in response_model.model_fields
+        if hasattr(record, name)
+    }
+
+
+def result_items(result: Union[List[Any], PaginationResponse[Any]]) -> List[Any]:
+    """The rows of a plain list or a PaginationResponse."""
+    return result.items if isinstance(result, PaginationResponse) else result
+
+
+def fast_list_response(
+    result: Union[List[Any], PaginationResponse[Any]],
+    response_model: Type[BaseModel],
+    fields: Optional[Callable[[Any], Dict[str, Any]]] = None,
+) -> Union[Response, List[Any], PaginationResponse[Any]]:
+    """
+    Listing response for trusted database rows. `fields` maps a row to the
+    response model's fields (by default, the row attributes of the same
+    name). Rows become response bodies through trusted_payload and are sent
+    as a FastJSONResponse, which FastAPI returns as is instead of validating
+    it again against the route's response_model.
+    """
+    fields = fields or (lambda record: _record_fields(response_model, record))
+    if not FAST_JSON_RESPONSES:
+        return map_items(result, lambda record: response_model(**fields(record)))
+
+    items = [trusted_payload(response_model, fields(record)) for record in result_items(result)]
+    if isinstance(result, PaginationResponse):
+        return FastJSONResponse(
+            {
+                "items": items,
+                "pagination_data": (
+                    result.pagination_data.model_dump() if result.pagination_data else None
+                ),
+                "next_cursor": result.next_cursor,
+            }
+        )
+    return FastJSONResponse(items)
+
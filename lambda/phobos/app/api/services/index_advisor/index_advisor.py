@@ -0,0 +1,199 @@
+import ast
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel
+from app.api.model.general.trigram import has_trigram_index
+from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
+from app.api.services.search_filter.searchfilter import field_resolution
+
+CONTROLLER_PACKAGE = "app.api.controller"
+CONTROLLER_DIR = Path(__file__).resolve().parents[2] / "controller"
+
+
+@dataclass(frozen=True)
+class FilterPath:
+    """One (field, match type) entry of a BaseQueryParams.fields declaration."""
+
+    endpoint: str
+    model_class: Type[SQLModel]
+    field: str
+    match_type: MatchTypeEnum
+
+
+@dataclass(frozen=True)
+class IndexAdvice:
+    """
+    The column a filter path compares and the index serving it. `column` is
+    None when the field is not filterable on the model (the filter is
+    silently ignored); `index` is None when no index supports the filter.
+    """
+
+    path: FilterPath
+    column: Optional[str]
+    index: Optional[str]
+
+
+def _match_type(node: ast.expr) -> MatchTypeEnum:
+    if isinstance(node, ast.Attribute):
+        return MatchTypeEnum[node.attr]
+    return MatchTypeEnum(ast.literal_eval(node))
+
+
+def _field_entries(node: ast.expr) -> Iterator[Tuple[str, MatchTypeEnum]]:
+    """(field, match type) pairs of a literal `fields=(...)` argument."""
+    for entry in getattr(node, "elts", ()):
+        if isinstance(entry, ast.Tuple):
+            field = ast.literal_eval(entry.elts[0])
+            match_type = _match_type(entry.elts[1])
+        else:
+            field, match_type = ast.literal_eval(entry), MatchTypeEnum.EXACT
+        if field is None:
+            continue
+        # EPOCH_RANGE compares (start, end); the start column leads its index
+        yield (field[0] if isinstance(field, tuple) else field), match_type
+
+
+def _dao_class_name(node: ast.expr) -> Optional[str]:
+    """Name of the DAO class a (possibly chained) constructor call builds."""
+    while isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+            return name if name.lower().endswith("dao") else None
+        node = node.func.value if isinstance(node.func, ast.Attribute) else None
+    return None
+
+
+def _queried_dao(function: ast.AST, query_name: str) -> Optional[str]:
+    """Class name of the DAO the function passes its BaseQueryParams to."""
+    daos: Dict[str, str] = {}
+    for node in ast.walk(function):
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            dao_class = _dao_class_name(node.value)
+            if dao_class:
+                daos[node.targets[0].id] = dao_class
+    for node in ast.walk(function):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id in daos
+        ):
+            continue
+        args = list(node.args) + [keyword.value for keyword in node.keywords]
+        if any(isinstance(arg, ast.Name) and arg.id == query_name for arg in args):
+            return daos[node.func.value.id]
+    return None
+
+
+def controller_filter_paths(controller_dir: Path = CONTROLLER_DIR) -> List[FilterPath]:
+    """
+    Every filter path declared by the controllers: the `fields` of each
+    BaseQueryParams(...) built in an endpoint, given inline or as a
+    module-level tuple, against the model of the DAO the endpoint passes
+    that query to.
+    """
+    paths = []
+    for source in sorted(controller_dir.rglob("*_controller.py")):
+        module_name = ".".join(
+            (CONTROLLER_PACKAGE, *source.relative_to(controller_dir).with_suffix("").parts)
+        )
+        module = importlib.import_module(module_name)
+        tree = ast.parse(source.read_text())
+        # Module-level declarations shared by several endpoints
+        constants = {
+            node.targets[0].id: node.value
+            for node in tree.body
+            if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+        }
+
+        for function in ast.walk(tree):
+            if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for node in ast.walk(function):
+                if not (
+                    isinstance(node, ast.Assign)
+                    and isinstance(node.targets[0], ast.Name)
+                    and isinstance(node.value, ast.Call)
+                    and getattr(node.value.func, "id", None) == "BaseQueryParams"
+                ):
+                    continue
+                dao_class = _queried_dao(function, node.targets[0].id)
+                if dao_class is None:
+                    continue
+                model_class = getattr(module, dao_class)(None).dao.model_class
+                fields = next(
+                    (k.value for k in node.value.keywords if k.arg == "fields"), None
+                )
+                if isinstance(fields, ast.Name):
+                    fields = constants.get(fields.id)
+                for field, match_type in _field_entries(fields):
+                    paths.append(
+                        FilterPath(
+                            endpoint=f"{module.__name__}.{function.name}",
+                            model_class=model_class,
+                            field=field,
+                            match_type=match_type,
+                        )
+                    )
+    return paths
+
+
+def supporting_index(column: Any, match_type: MatchTypeEnum) -> Optional[str]:
+    """
+    Name of an index Postgres can use for the filter: a trigram index for
+    PARTIAL (ILIKE '%...%') filters, a GiST index on the period for
+    EPOCH_RANGE filters (led by their start column), otherwise any btree
+    index, primary key or unique constraint led by the column. Partial
+    indexes on live rows count, since every list query also filters
+    deleted_at_epoch = -1.
+    """
+    table_column = column.property.columns[0]
+    table = table_column.table
+
+    if match_type == MatchTypeEnum.PARTIAL:
+        if has_trigram_index(column):
+            return next(
+                index.name
+                for index in table.indexes
+                if table_column in index.columns.values()
+                and index.dialect_options["postgresql"]["using"] == "gin"
+            )
+        return None
+
+    access_methods = ("gist",) if match_type == MatchTypeEnum.EPOCH_RANGE else (False, "btree")
+    for index in sorted(table.indexes, key=lambda index: index.name):
+        if index.dialect_options["postgresql"]["using"] in access_methods:
+            if list(index.columns)[0] is table_column:
+                return index.name
+    if match_type == MatchTypeEnum.EPOCH_RANGE:
+        return None
+    if list(table.primary_key.columns)[0] is table_column:
+        return table.primary_key.name or f"{table.name}_pkey"
+    # Foreign keys get no index of their own in Postgres; unique constraints do
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            if list(constraint.columns)[0] is table_column:
+                return constraint.name or f"{table.name}_{table_column.name}_key"
+    return None
+
+
+def advise(paths: Optional[List[FilterPath]] = None) -> List[IndexAdvice]:
+    """The supporting index (or its absence) of every controller filter path."""
+    advice = []
+    for path in controller_filter_paths() if paths is None else paths:
+        filter_field = field_resolution(path.model_class).get(path.field)
+        if filter_field is None:
+            advice.append(IndexAdvice(path=path, column=None, index=None))
+            continue
+        table_column = filter_field.column.property.columns[0]
+        advice.append(
+            IndexAdvice(
+                path=path,
+                column=f"{table_column.table.name}.{table_column.name}",
+                index=supporting_index(filter_field.column, path.match_type),
+            )
+        )
+    return advice
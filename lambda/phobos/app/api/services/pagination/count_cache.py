@@ -0,0 +1,74 @@
+import hashlib
+import os
+from typing import Dict, Optional, Set, Tuple
+from sqlalchemy import Table
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.util import find_tables
+from app.api.services.cache.ttl_cache import TTLCache
+
+# Counts are per process, so a TTL bounds staleness from writes made by other
+# Lambda instances; local writes invalidate immediately.
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "60"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1024"))
+
+
+def fingerprint_statement(stmt: Select, params: Optional[dict] = None) -> str:
+    """
+    Stable key for a filtered statement: compiled SQL text plus bound values,
+    including the values passed separately at execution.
+    """
+    compiled = stmt.compile()
+    bound = sorted({**compiled.params, **(params or {})}.items())
+    return hashlib.sha256(f"{compiled.string}|{bound!r}".encode()).hexdigest()
+
+
+def statement_tables(stmt: Select) -> Set[str]:
+    """Names of every table a statement reads, including aliased and joined ones."""
+    return {
+        table.name
+        for table in find_tables(stmt, check_columns=True, include_aliases=True)
+        if isinstance(table, Table)
+    }
+
+
+class CountCache:
+    """
+    TTL + LRU cache of total counts for paginated listings. Entries are
+    indexed by every table the counted statement reads so a write to any of
+    them drops the affected counts.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = COUNT_CACHE_TTL_SECONDS,
+        max_entries: int = COUNT_CACHE_MAX_ENTRIES,
+    ):
+        self._entries = TTLCache(ttl_seconds, max_entries, on_discard=self._unindex)
+        self._keys_by_table: Dict[str, Set[str]] = {}
+
+    def get(self, key: str) -> Optional[int]:
+        entry: Optional[Tuple[int, Set[str]]] = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def set(self, key: str, count: int, tables: Set[str]) -> None:
+        self._entries.set(key, (count, tables))
+        for table in tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+
+    def invalidate(self, table: str) -> None:
+        for key in list(self._keys_by_table.get(table, ())):
+            self._entries.pop(key)
+
+    def _unindex(self, key: str, entry: Tuple[int, Set[str]]) -> None:
+        for table in entry[1]:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache()
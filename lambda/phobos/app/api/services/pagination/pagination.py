@@ -1,7 +1,10 @@
-from typing import Annotated, Generic, List, Optional, TypeVar
+import base64
+import json
+from typing import Annotated, Any, Callable, Generic, List, Optional, Tuple, TypeVar, Union
 from fastapi import Query
 from pydantic import BaseModel, Field
 from sqlmodel import SQLModel
+from app.api.exceptions.searchfilter_exception import BadRequestException
 
 # Query parameters for pagination
 PageQuery = Annotated[
@@ -21,11 +24,29 @@ SizeQuery = Annotated[
     ),
 ]
 
+IncludeTotalQuery = Annotated[
+    Optional[bool],
+    Query(
+        description="Return the total record count. Defaults to true for page "
+        "pagination and false for cursor pagination.",
+    ),
+]
+
+AfterQuery = Annotated[
+    Optional[str],
+    Query(
+        description="Cursor returned as `next_cursor` by the previous page. "
+        "Send `size` without `page` to page by cursor.",
+    ),
+]
+
 
 class PaginationData(BaseModel):
     """Metadata about pagination."""
 
-    total_data: int = Field(..., description="Total number of datas available")
+    total_data: Optional[int] = Field(
+        None, description="Total number of datas available, null unless include_total"
+    )
     page: Optional[int] = Field(None, description="Current page number")
     size: Optional[int] = Field(None, description="Number of records per page")
     pages: Optional[int] = Field(None, description="Total number of pages")
@@ -37,3 +58,35 @@ T = TypeVar("T", bound=SQLModel)
 class PaginationResponse(BaseModel, Generic[T]):
     items: List[T]
     pagination_data: Optional[PaginationData] = None
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+
+
+def encode_cursor(sort_value: Any, record_id: Any) -> str:
+    """Encodes the (sort_key, primary key) of the last row into an opaque token."""
+    payload = json.dumps([sort_value, record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Decodes a token built by `encode_cursor` back into (sort_key, primary key)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, record_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise BadRequestException(error_details={"after": cursor})
+    return sort_value, record_id
+
+
+def map_items(
+    result: Union[List[Any], PaginationResponse[Any]], mapper: Callable[[Any], Any]
+) -> Union[List[Any], PaginationResponse[Any]]:
+    """Applies `mapper` to each item of a plain list or a PaginationResponse."""
+    if isinstance(result, PaginationResponse):
+        return PaginationResponse[Any](
+            items=[mapper(item) for item in result.items],
+            pagination_data=result.pagination_data,
+            next_cursor=result.next_cursor,
+        )
+    return [mapper(item) for item in result]
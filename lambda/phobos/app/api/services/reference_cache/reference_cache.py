@@ -0,0 +1,132 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from app.api.services.cache.ttl_cache import TTLCache
+
+# Banks and branches change a few times a year, so entries can live longer
+# than the listing counts do; the TTL only matters for edits made through
+# another Lambda instance, which never reach this process's invalidate().
+REFERENCE_CACHE_TTL_SECONDS = int(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300"))
+REFERENCE_CACHE_MAX_ENTRIES = int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", "2048"))
+
+# Returned by backends for absent or expired keys
+MISSING = object()
+
+
+class ReferenceCacheBackend(ABC):
+    """Storage behind ReferenceCache. Keys are (namespace, id) tuples."""
+
+    evictions: int = 0
+
+    @abstractmethod
+    def get(self, key: Tuple[str, Hashable]) -> Any:
+        """Cached value, or MISSING when absent or expired."""
+
+    @abstractmethod
+    def set(self, key: Tuple[str, Hashable], value: Any) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: Tuple[str, Hashable]) -> None: ...
+
+    @abstractmethod
+    def delete_namespace(self, namespace: str) -> None: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+
+class InMemoryBackend(ReferenceCacheBackend):
+    """TTL + LRU store local to the process."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = REFERENCE_CACHE_TTL_SECONDS,
+        max_entries: int = REFERENCE_CACHE_MAX_ENTRIES,
+    ):
+        self._entries = TTLCache(ttl_seconds, max_entries)
+
+    @property
+    def evictions(self) -> int:
+        return self._entries.evictions
+
+    def get(self, key: Tuple[str, Hashable]) -> Any:
+        return self._entries.get(key, MISSING)
+
+    def set(self, key: Tuple[str, Hashable], value: Any) -> None:
+        self._entries.set(key, value)
+
+    def delete(self, key: Tuple[str, Hashable]) -> None:
+        self._entries.pop(key)
+
+    def delete_namespace(self, namespace: str) -> None:
+        for key in self._entries.keys():
+            if key[0] == namespace:
+                self._entries.pop(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ReferenceCache:
+    """
+    Read-through cache of rarely changing reference rows (banks, branches),
+    keyed by namespace and primary key. Ids are normalised to strings so a
+    bank looked up by the String(36) rs_bank_id and invalidated by its
+    integer bk_id share one entry. Values must be safe to share between
+    requests: session-free snapshots, never session-bound ORM objects.
+    """
+
+    def __init__(self, backend: Optional[ReferenceCacheBackend] = None):
+        self.backend = backend if backend is not None else InMemoryBackend()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, namespace: str, record_id: Any) -> Any:
+        value = self.backend.get((namespace, str(record_id)))
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, namespace: str, record_id: Any, value: Any) -> None:
+        self.backend.set((namespace, str(record_id)), value)
+
+    async def get_many(
+        self,
+        namespace: str,
+        record_ids: List[Any],
+        load: Callable[[List[str]], Awaitable[Dict[Any, Any]]],
+    ) -> List[Any]:
+        """
+        Values for `record_ids` in input order, once per id. The ids not
+        cached are passed together to `load`, which returns the values it
+        found by id; those are cached, the rest are skipped.
+        """
+        values = {
+            str(record_id): self.get(namespace, record_id) for record_id in record_ids
+        }
+        missing = [record_id for record_id, value in values.items() if value is MISSING]
+        if missing:
+            for record_id, value in (await load(missing)).items():
+                self.set(namespace, record_id, value)
+                values[str(record_id)] = value
+        return [value for value in values.values() if value is not MISSING]
+
+    def invalidate(self, namespace: str, record_id: Any = None) -> None:
+        """Drops one entry, or the whole namespace when no id is given."""
+        if record_id is None:
+            self.backend.delete_namespace(namespace)
+        else:
+            self.backend.delete((namespace, str(record_id)))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.backend.evictions,
+            "entries": len(self.backend),
+        }
+
+
+reference_cache = ReferenceCache()
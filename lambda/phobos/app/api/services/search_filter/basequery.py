@@ -5,7 +5,7 @@ from fastapi import Query, Depends
 
 
 class BaseQueryParams(BaseModel):
-    search_values: List[Union[str, List[str], List[int], int, None]]
+    search_values: List[Union[str, List[str], List[int], List[Optional[int]], int, None]]
 
     fields: List[
         Union[
@@ -18,3 +18,23 @@ class BaseQueryParams(BaseModel):
 
     page: Optional[int] = None
     size: Optional[int] = None
+
+    # Cursor (keyset) pagination: used when `size` is given without `page`
+    after: Optional[str] = None
+    sort_key: str = "created_at_epoch"
+
+    # None means: count for page pagination, skip for cursor pagination
+    include_total: Optional[bool] = None
+
+    # Order PARTIAL matches on trigram-indexed columns best match first.
+    # Cursor pagination keeps its keyset order and ignores this.
+    rank_by_similarity: bool = False
+
+
+RankBySimilarityQuery = Annotated[
+    Optional[bool],
+    Query(
+        description="Order name matches by similarity to the search text, best "
+        "first. Applies to page pagination and unpaginated lists.",
+    ),
+]
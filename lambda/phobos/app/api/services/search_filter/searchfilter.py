@@ -1,10 +1,8 @@
-from dataclasses import field, fields
-from select import select
-from sqlalchemy.orm import aliased
-from typing import Any, Optional, Tuple, Type, TypeVar, Generic, Set, List
-from sqlalchemy import cast, String, and_, func, or_
-from sqlalchemy.orm import contains_eager
-from sqlmodel import SQLModel, case
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Generic, Set, List
+from sqlalchemy import ARRAY, BigInteger, cast, String, any_, bindparam, func, or_, inspect
+from sqlalchemy.orm import aliased, configure_mappers, contains_eager
+from sqlmodel import SQLModel, case, select
 from app.api.exceptions.searchfilter_exception import (
     BadRequestException,
     ResourceNotFoundException,
@@ -12,10 +10,180 @@ from app.api.exceptions.searchfilter_exception import (
 )
 from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
 from app.api.services.search_filter.basequery import BaseQueryParams
+from app.api.model.general.epoch_range import epoch_range
+from app.api.model.general.trigram import has_trigram_index
 
 T = TypeVar("T", bound=SQLModel)
 
 
+class AmbiguousFilterFieldError(ValueError):
+    """Raised when a filter field name exists on more than one related model."""
+
+
+@dataclass(frozen=True)
+class FilterField:
+    """
+    Where a filterable field lives relative to the model being listed:
+    the column to filter on and, for related models, the relationship to
+    join through and the alias the column belongs to. `trigram` marks
+    columns with a pg_trgm index, which PARTIAL searches can rank by.
+    """
+
+    column: Any
+    relationship: Optional[str] = None
+    alias: Any = None
+    trigram: bool = False
+
+
+_field_resolution: Dict[Type[SQLModel], Dict[str, FilterField]] = {}
+
+
+def build_field_resolution(model: Type[T]) -> Dict[str, FilterField]:
+    """
+    Maps every column of `model` and of its directly related models to a
+    FilterField. Columns of the model itself win over related ones; a name
+    found on two relationships raises AmbiguousFilterFieldError.
+    """
+    mapper = inspect(model)
+    fields = {
+        attr.key: FilterField(
+            column=getattr(model, attr.key),
+            trigram=has_trigram_index(getattr(model, attr.key)),
+        )
+        for attr in mapper.column_attrs
+    }
+    owners: Dict[str, str] = {}
+
+    for rel in mapper.relationships:
+        rel_model = rel.mapper.class_
+        alias = aliased(rel_model, name=f"{model.__tablename__}_{rel.key}")
+        for attr in rel.mapper.column_attrs:
+            if attr.key in fields and attr.key not in owners:
+                continue
+            if attr.key in owners:
+                raise AmbiguousFilterFieldError(
+                    f"Filter field '{attr.key}' of {model.__name__} is ambiguous: "
+                    f"found on relationships '{owners[attr.key]}' and '{rel.key}'"
+                )
+            owners[attr.key] = rel.key
+            fields[attr.key] = FilterField(
+                column=getattr(alias, attr.key),
+                relationship=rel.key,
+                alias=alias,
+                trigram=has_trigram_index(getattr(alias, attr.key)),
+            )
+
+    return fields
+
+
+def field_resolution(model: Type[T]) -> Dict[str, FilterField]:
+    """Returns the precomputed FilterField table of `model`, building it once."""
+    fields = _field_resolution.get(model)
+    if fields is None:
+        fields = _field_resolution[model] = build_field_resolution(model)
+    return fields
+
+
+def build_all_field_resolutions() -> None:
+    """Builds the FilterField table of every mapped SQLModel table up front."""
+    configure_mappers()
+    for mapper in SQLModel._sa_registry.mappers:
+        field_resolution(mapper.class_)
+
+
+def selects_entity(stmt, model_class: Type[T]) -> bool:
+    """Whether `stmt` returns `model_class` objects rather than only columns."""
+    return any(desc["expr"] is model_class for desc in stmt.column_descriptions)
+
+
+def join_filter_field(stmt, model_class: Type[T], field: FilterField, joined_rels: Set[str]):
+    """
+    Joins the relationship a FilterField lives on, once per statement. When
+    the statement returns model objects the joined rows also populate the
+    relationship; projections only get the join.
+    """
+    if field.relationship and field.relationship not in joined_rels:
+        rel_attr = getattr(model_class, field.relationship).of_type(field.alias)
+        stmt = stmt.join(rel_attr)
+        if selects_entity(stmt, model_class):
+            stmt = stmt.options(contains_eager(rel_attr))
+        joined_rels.add(field.relationship)
+    return stmt
+
+
+def projection_statement(model_class: Type[T], fields: Tuple[str, ...], joined_rels: Set[str]):
+    """
+    select() of the named fields, labelled with their field names, outer
+    joining each relationship a related field lives on. Filters on the same
+    relationships reuse those joins.
+    """
+    resolution = field_resolution(model_class)
+    unknown = [name for name in fields if name not in resolution]
+    if unknown:
+        raise ValueError(f"Unknown projection fields for {model_class.__name__}: {unknown}")
+
+    stmt = select(*(resolution[name].column.label(name) for name in fields)).select_from(
+        model_class
+    )
+    for name in fields:
+        field = resolution[name]
+        if field.relationship and field.relationship not in joined_rels:
+            stmt = stmt.outerjoin(getattr(model_class, field.relationship).of_type(field.alias))
+            joined_rels.add(field.relationship)
+    return stmt
+
+
+def filter_shape(match_type: str, value: Any) -> Any:
+    """
+    The part of a filter value that changes the statement text: whether it is
+    a list, a string or an int. File path status filters render IS [NOT] NULL,
+    so their value is part of the shape.
+    """
+    if match_type == MatchTypeEnum.FILE_PATH_STATUS:
+        return str(value).lower()
+    if isinstance(value, list):
+        return list
+    return type(value)
+
+
+def filter_bind_value(match_type: str, value: Any) -> Any:
+    """The value bound to a filter's parameter for one request."""
+    if isinstance(value, str):
+        if match_type == MatchTypeEnum.PARTIAL:
+            return f"%{value}%"
+        if match_type == MatchTypeEnum.EXACT:
+            return value.strip()
+    return value
+
+
+def epoch_window_bind_names(bind_name: str) -> Tuple[str, str]:
+    """Parameters holding the [from, to] bounds of an EPOCH_RANGE window."""
+    return f"{bind_name}_from", f"{bind_name}_to"
+
+
+def filter_bind_params(bind_name: str, match_type: str, value: Any) -> Dict[str, Any]:
+    """
+    The parameters one filter binds for a request. An EPOCH_RANGE given a
+    [from, to] window binds both bounds; either may be None (unbounded).
+    File path status filters bind nothing.
+    """
+    if match_type == MatchTypeEnum.FILE_PATH_STATUS:
+        return {}
+    if match_type == MatchTypeEnum.EPOCH_RANGE and isinstance(value, list):
+        if len(value) != 2:
+            raise BadRequestException(error_details={"epoch_window": value})
+        window_from, window_to = value
+        if None not in value and window_from > window_to:
+            raise BadRequestException(error_details={"epoch_window": value})
+        return dict(zip(epoch_window_bind_names(bind_name), value))
+    return {bind_name: filter_bind_value(match_type, value)}
+
+
+def rank_bind_name(bind_name: str) -> str:
+    """Parameter holding the raw search text a PARTIAL filter is ranked by."""
+    return f"{bind_name}_rank"
+
+
 class DAOFilterSearchParam(Generic[T]):
     def __init__(
         self,
@@ -24,62 +192,59 @@ class DAOFilterSearchParam(Generic[T]):
         match_type: str,
         value: Any,
         stmt=None,
-        joined_rels: set[Type[SQLModel]] | None = None,
+        joined_rels: Set[str] | None = None,
+        bind_name: Optional[str] = None,
+        rank: bool = False,
     ):
         self.model_class: Type[T] = model_class
         self.field: str = field
         self.match_type: str = match_type
         self.value: Any = value
         self.stmt = stmt
-        self.joined_rels: set[Type[SQLModel]] = joined_rels or set()
+        self.joined_rels: Set[str] = joined_rels if joined_rels is not None else set()
+        self.bind_name: str = bind_name or field
+        self.rank: bool = rank
+        # Set by generic_filter for ranked PARTIAL searches on trigram columns
+        self.rank_expression = None
 
     async def generic_filter(self) -> Tuple[Any, Any]:
 
-        model: Type[T] = self.model_class  # base model
-        rel_attr_for_eager = None  # for relationship eager loading
-
-        column = None
-
-        # --- Check if field is directly in the base model ---
-        if hasattr(model, self.field):
-            column = getattr(model, self.field)
-        else:
-            # --- Otherwise, check relationships dynamically ---
-            for rel_name, rel in model.__mapper__.relationships.items():
-                rel_model = rel.entity.class_
-                if hasattr(rel_model, self.field):
-                    column = getattr(rel_model, self.field)
-                    rel_attr_for_eager = getattr(model, rel_name)
-
-                    # If not already joined, add the join + eager load
-                    if rel_model not in self.joined_rels:
-                        self.stmt = self.stmt.join(rel_attr_for_eager)
-                        self.stmt = self.stmt.options(
-                            contains_eager(rel_attr_for_eager)
-                        )
-                        self.joined_rels.add(rel_model)
-                    break
+        filter_field = field_resolution(self.model_class).get(self.field)
 
         # --- If column not found anywhere, return none ---
-        if not column:
+        if filter_field is None:
             return self.stmt, None
 
+        self.stmt = join_filter_field(
+            self.stmt, self.model_class, filter_field, self.joined_rels
+        )
+        column = filter_field.column
+
+        # Values are bound by name (see filter_bind_value) so the statement
+        # text only depends on which filters are active, never on their values
         condition = None
         if (
             isinstance(self.value, list)
             and self.match_type == MatchTypeEnum.EXACT.value
         ):
-            condition = column.in_(self.value)
+            # = ANY(:array) keeps one statement text whatever the list length
+            condition = column == any_(
+                bindparam(self.bind_name, type_=ARRAY(column.type))
+            )
         elif isinstance(self.value, str):
             if self.match_type == MatchTypeEnum.PARTIAL.value:
-                print(f"Partial match on {self.field} with value {self.value}")
-                condition = column.ilike(f"%{self.value}%")
+                # On trigram-indexed columns this ILIKE is served by the GIN index
+                condition = column.ilike(bindparam(self.bind_name))
+                if self.rank and filter_field.trigram:
+                    self.rank_expression = func.word_similarity(
+                        bindparam(rank_bind_name(self.bind_name)), column
+                    )
             elif self.match_type == MatchTypeEnum.EXACT.value:
-                condition = column == self.value.strip()
+                condition = column == bindparam(self.bind_name)
         elif (
             isinstance(self.value, int) and self.match_type == MatchTypeEnum.EXACT.value
         ):
-            condition = column == self.value
+            condition = column == bindparam(self.bind_name)
 
         return self.stmt, condition
 
@@ -117,36 +282,31 @@ class DAOFilterSearchParam(Generic[T]):
         start_field: str,
         end_field: str,
         joined_rels: set,
+        bind_name: str = "epoch_value",
     ):
         if date_value is None:
             raise ResourceNotFoundException()
 
-        # 1. Check main table columns
-        if hasattr(model_class, start_field) and hasattr(model_class, end_field):
-            start_col = getattr(model_class, start_field)
-            end_col = getattr(model_class, end_field)
-            condition = and_(start_col <= date_value, end_col >= date_value)
-            return stmt, condition
-
-        # 2. Check relationships
-        for rel in model_class.__mapper__.relationships.values():
-            rel_model = rel.mapper.class_
-            if hasattr(rel_model, start_field) and hasattr(rel_model, end_field):
-                # Avoid duplicate joins
-                if rel_model not in joined_rels:
-                    rel_alias = aliased(rel_model)
-                    stmt = stmt.join(rel_alias, getattr(model_class, rel.key))
-                    joined_rels.add(rel_model)
-                else:
-                    # Use existing alias or fallback to rel_model (simplification)
-                    rel_alias = (
-                        rel_model  # Adjust if you maintain alias references elsewhere
-                    )
+        fields = field_resolution(model_class)
+        start = fields.get(start_field)
+        end = fields.get(end_field)
 
-                start_col = getattr(rel_alias, start_field)
-                end_col = getattr(rel_alias, end_field)
-                condition = and_(start_col <= date_value, end_col >= date_value)
-                return stmt, condition
+        # Both bounds must live on the same model (or the same relationship)
+        if start is None or end is None or start.relationship != end.relationship:
+            raise BadRequestException()
 
-        # Not found anywhere
-        raise BadRequestException()
+        stmt = join_filter_field(stmt, model_class, start, joined_rels)
+
+        # Range operators let the GiST index on epoch_range(start, end) serve
+        # the filter: a date matches the periods containing it, a [from, to]
+        # window the periods overlapping it
+        period = epoch_range(start.column, end.column)
+        if isinstance(date_value, list):
+            window_from, window_to = (
+                cast(bindparam(name), BigInteger)
+                for name in epoch_window_bind_names(bind_name)
+            )
+            condition = period.op("&&")(epoch_range(window_from, window_to))
+        else:
+            condition = period.op("@>")(cast(bindparam(bind_name), BigInteger))
+        return stmt, condition
@@ -0,0 +1,37 @@
+import os
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from sqlalchemy.sql import Select
+
+STATEMENT_CACHE_MAX_ENTRIES = int(os.getenv("STATEMENT_CACHE_MAX_ENTRIES", "256"))
+
+
+class StatementCache:
+    """
+    LRU cache of filtered select templates. A template is keyed by the model,
+    the base statement it was built on and the shape of every active filter;
+    request values are bound by name at execution, so a hit skips rebuilding
+    the statement and always produces the same SQL text.
+    """
+
+    def __init__(self, max_entries: int = STATEMENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Select]:
+        stmt = self._entries.get(key)
+        if stmt is not None:
+            self._entries.move_to_end(key)
+        return stmt
+
+    def set(self, key: Hashable, stmt: Select) -> None:
+        self._entries[key] = stmt
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+statement_cache = StatementCache()
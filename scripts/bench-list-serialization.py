@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Listing Serialization Micro-benchmark for Phobos Backend
+Times the response path of the listing endpoints per 1,000 rows: validated
+(response models built and validated again against the route's
+response_model, stdlib JSON) against fast (trusted payload dicts + orjson), and
+checks both send the same JSON
+"""
+
+import sys
+import asyncio
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+# Add the lambda/phobos directory to Python path
+project_root = Path(__file__).parent.parent
+lambda_path = project_root / "lambda" / "phobos"
+sys.path.insert(0, str(lambda_path))
+
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import serialize_response
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.controller.bank.bank_controller import router as bank_router
+from app.api.controller.reappraisal_service.reappraisal_service_controller import (
+    router as reappraisal_service_router,
+)
+from app.api.controller.reimbursement.reimbursment_controller import (
+    router as reimbursement_router,
+)
+from app.api.model.bank.bank_get import BankGetResponse
+from app.api.model.bank.bank_table import BankTable
+from app.api.model.enum.reappraisal_service_status_enum import ReappraisalServiceStatusEnum
+from app.api.model.enum.service_category_enum import ReappraisalServiceCategoryEnum
+from app.api.model.reappraisal_service.reappraisal_service_get import (
+    ReappraisalServiceGetResponse,
+)
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceTable,
+)
+from app.api.model.reimbursement.reimbursement_get import (
+    ReappraisalServiceReimbursementGetResponse,
+)
+from app.api.model.reimbursement.reimbursement_table import (
+    ReappraisalServiceReimbursementTable,
+)
+from app.api.services.fast_json import fast_json
+from app.api.services.pagination.pagination import PaginationData, PaginationResponse
+
+ROWS = 1000
+REPEAT = 20
+
+
+def service_rows():
+    return [
+        SimpleNamespace(
+            reappraisal_service_id=f"00000000-0000-4000-8000-{n:012d}",
+            appraiser_name="Ravi Kumar",
+            bank_name="State Bank of India",
+            branch_name="Main Branch",
+            rs_start_epoch=1700000000 + n,
+            rs_end_epoch=1700086400 + n,
+            rs_packet_count=n % 40,
+            rs_status=ReappraisalServiceStatusEnum.ACTIVE,
+            total_amount=150000 + n,
+        )
+        for n in range(ROWS)
+    ]
+
+
+def service_fields(row):
+    return dict(
+        reappraisal_service_id=row.reappraisal_service_id,
+        appraiser_name=row.appraiser_name,
+        bank_name=row.bank_name,
+        branch_name=row.branch_name,
+        start_epoch=row.rs_start_epoch,
+        end_epoch=row.rs_end_epoch,
+        no_of_packets=row.rs_packet_count,
+        status=row.rs_status,
+        total_amount=row.total_amount,
+    )
+
+
+def bank_rows():
+    return [
+        BankTable(
+            bank_id=n + 1,
+            bank_name=f"Bank {n}",
+            bank_code=f"BK{n:04d}",
+            bank_head_office_address="1 Main Road, Mumbai",
+            bank_contact_email="contact@bank.in",
+            bank_contact_number="9876543210",
+        )
+        for n in range(ROWS)
+    ]
+
+
+def reimbursement_rows():
+    service = ReappraisalServiceTable(
+        reappraisal_service_id="00000000-0000-4000-8000-000000000000",
+        rs_appraiser_id="1",
+        rs_bank_id="1",
+        rs_branch_id="1",
+        rs_start_epoch=1700000000,
+        rs_end_epoch=1700086400,
+        rs_packet_count=10,
+        rs_charge=150000,
+        rs_description="Quarterly reappraisal",
+    )
+    rows = []
+    for n in range(ROWS):
+        row = ReappraisalServiceReimbursementTable(
+            rs_reimbursement_id=f"10000000-0000-4000-8000-{n:012d}",
+            rs_reappraisal_service_id=service.reappraisal_service_id,
+            rs_reimbursement_transaction_epoch=1700000000 + n,
+            rs_reimbursement_category=ReappraisalServiceCategoryEnum.FOOD,
+            rs_reimbursement_details="Lunch for the reappraisal team",
+            rs_reimbursement_amount=5000 + n,
+        )
+        row.service = service
+        rows.append(row)
+    return rows
+
+
+def paginated(rows):
+    return PaginationResponse[Any](
+        items=rows,
+        pagination_data=PaginationData(total_data=len(rows), page=1, size=len(rows), pages=1),
+    )
+
+
+# (name, router, path, response model, row factory, field mapping)
+CASES = [
+    (
+        "reappraisal services",
+        reappraisal_service_router,
+        "/v1/reappraisal_services",
+        ReappraisalServiceGetResponse,
+        service_rows,
+        service_fields,
+    ),
+    ("banks", bank_router, "/v1/banks", BankGetResponse, bank_rows, BankGetResponse.db_record_fields),
+    (
+        "reimbursements",
+        reimbursement_router,
+        "/v1/reimbursements",
+        ReappraisalServiceReimbursementGetResponse,
+        reimbursement_rows,
+        None,
+    ),
+]
+
+
+async def render(response_field, result, response_model, fields, fast):
+    """The response body the endpoint sends, through the fast path or not"""
+    fast_json.FAST_JSON_RESPONSES = fast
+    response = fast_json.fast_list_response(result, response_model, fields)
+    if isinstance(response, Response):
+        return response.body
+    content = await serialize_response(field=response_field, response_content=response)
+    return JSONResponse(content).body
+
+
+async def time_per_batch(response_field, result, response_model, fields, fast):
+    """Best of REPEAT runs, in milliseconds per 1,000 rows"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        await render(response_field, result, response_model, fields, fast)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000 * 1000 / ROWS
+
+
+async def main():
+    print(f"⏱️  Listing serialization, best of {REPEAT} runs of {ROWS} rows\n")
+    print(f"   {'endpoint':<22}{'validated':>12}{'fast':>10}{'speedup':>10}")
+    for name, router, path, response_model, rows, fields in CASES:
+        route = next(route for route in router.routes if route.path == path)
+        for label, result in ((name, rows()), (f"{name} (page)", paginated(rows()))):
+            validated_body, fast_body = [
+                await render(route.response_field, result, response_model, fields, fast)
+                for fast in (False, True)
+            ]
+            if json.loads(validated_body) != json.loads(fast_body):
+                print(f"❌ {label}: the fast path sends different JSON")
+                sys.exit(1)
+            validated, fast = [
+                await time_per_batch(route.response_field, result, response_model, fields, fast)
+                for fast in (False, True)
+            ]
+            print(
+                f"   {label:<22}{validated:>9.2f} ms{fast:>7.2f} ms{validated / fast:>9.1f}x"
+            )
+    print("\n✅ Both paths send identical JSON")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -85,6 +85,7 @@ async def create_all_tables():
         from app.api.model.reimbursement.reimbursement_table import ReimbursementTable
         from app.api.model.payout_cycle.payout_cycle_table import PayoutCycleTable
         from app.api.model.payout_statement.payout_statement_table import PayoutStatementTable
+        from app.api.model.document.document_table import DocumentTable
 
         async with engine.begin() as conn:
             # Create all tables
@@ -100,6 +101,7 @@ async def create_all_tables():
         print("   - reimbursement")
         print("   - payout_cycle")
         print("   - payout_statement")
+        print("   - document")
         return True
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
@@ -140,6 +142,148 @@ async def list_tables():
         return False
 
 
+async def reconcile_totals(repair: bool = False):
+    """Report (and with repair, fix) services whose stored totals have drifted"""
+    if not engine:
+        print("❌ Database engine not configured. Check your .env file.")
+        sys.exit(1)
+
+    print("🔎 Checking reimbursement and advance totals on reappraisal services...")
+    try:
+        from app.api.server.app import app  # noqa: F401  (maps every model)
+        from app.api.db_connection.db_connection import SessionLocal
+        from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
+
+        async with SessionLocal() as session:
+            drifted = await ReappraisalServiceDAO(session).reconcile_totals(repair=repair)
+
+        if not drifted:
+            print("\n✅ All service totals match their reimbursements and advances")
+            return True
+
+        print(f"\n⚠️  {len(drifted)} services with drifted totals:")
+        for row in drifted:
+            print(
+                f"   - {row.reappraisal_service_id}: "
+                f"reimbursement {row.rs_reimbursement_total} -> {row.computed_reimbursement_total}, "
+                f"advance {row.rs_advance_total} -> {row.computed_advance_total}"
+            )
+
+        if repair:
+            print(f"\n✅ Repaired {len(drifted)} services")
+            return True
+        print("\nℹ️  Run with --repair to fix them")
+        return False
+    except Exception as e:
+        print(f"❌ Error reconciling totals: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def index_advisor():
+    """Report controller filters that no index supports"""
+    print("🔎 Checking the indexes behind every list endpoint filter...")
+    try:
+        from app.api.server.app import app  # noqa: F401  (maps every model)
+        from app.api.services.index_advisor.index_advisor import advise
+
+        advice = advise()
+        unsupported = [item for item in advice if item.index is None]
+        endpoint = None
+        for item in advice:
+            if item.path.endpoint != endpoint:
+                endpoint = item.path.endpoint
+                print(f"\n📋 {endpoint} ({item.path.model_class.__tablename__})")
+            label = f"{item.path.field} [{item.path.match_type}]"
+            if item.column is None:
+                print(f"   ❌ {label}: not a field of the model, the filter is ignored")
+            elif item.index is None:
+                print(f"   ⚠️  {label}: {item.column} has no supporting index")
+            else:
+                print(f"   ✓ {label}: {item.column} via {item.index}")
+
+        if not unsupported:
+            print("\n✅ Every filter has a supporting index")
+            return True
+        print(f"\n⚠️  {len(unsupported)} of {len(advice)} filters have no supporting index")
+        return False
+    except Exception as e:
+        print(f"❌ Error checking indexes: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def export_parquet(args):
+    """Write a period snapshot of a table to Parquet, locally or on S3"""
+    if not engine:
+        print("❌ Database engine not configured. Check your .env file.")
+        sys.exit(1)
+
+    if len(args) != 4:
+        print("❌ Usage: export-parquet <table> <from_epoch> <to_epoch> <path | s3://prefix>")
+        return False
+
+    table_name, from_epoch, to_epoch, destination = args
+    print(f"📦 Exporting {table_name} for {from_epoch}..{to_epoch} to Parquet...")
+    try:
+        from app.api.server.app import app  # noqa: F401  (maps every model)
+        from app.api.db_connection.db_connection import SessionLocal
+        from app.api.services.export.parquet_export import export_snapshot
+
+        if destination.startswith("s3://"):
+            target = {"s3_key_prefix": destination.removeprefix("s3://").strip("/")}
+        else:
+            target = {"path": destination}
+
+        async with SessionLocal() as session:
+            export = await export_snapshot(
+                session, table_name, int(from_epoch), int(to_epoch), **target
+            )
+
+        print(f"\n✅ Wrote {export.rows} rows to {export.location}")
+        return True
+    except Exception as e:
+        print(f"❌ Error exporting {table_name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def storage_usage():
+    """Report the stored documents and their size per owner type"""
+    if not engine:
+        print("❌ Database engine not configured. Check your .env file.")
+        sys.exit(1)
+
+    print("💾 Summing the document catalog...")
+    try:
+        from app.api.server.app import app  # noqa: F401  (maps every model)
+        from app.api.db_connection.db_connection import SessionLocal
+        from app.api.dao.document_dao import DocumentDAO
+
+        async with SessionLocal() as session:
+            usage = await DocumentDAO(session).storage_usage()
+
+        if not usage:
+            print("\nℹ️  No documents cataloged")
+            return True
+
+        print(f"\n   {'owner':<22}{'documents':>11}{'MB':>12}")
+        for owner_type, documents, size in usage:
+            owner = owner_type.value if owner_type else "(exports)"
+            print(f"   {owner:<22}{documents:>11}{size / 1024 / 1024:>12.2f}")
+        total = sum(size for _, _, size in usage)
+        print(f"\n✅ {sum(count for _, count, _ in usage)} documents, {total / 1024 / 1024:.2f} MB")
+        return True
+    except Exception as e:
+        print(f"❌ Error summing storage usage: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 async def main():
     """Main entry point for database management"""
 
@@ -152,6 +296,10 @@ async def main():
         print("  create  - Create all tables from models")
         print("  reset   - Drop and recreate all tables")
         print("  list    - List all tables in database")
+        print("  reconcile [--repair] - Verify (and repair) stored service totals")
+        print("  index-advisor - Report list filters without a supporting index")
+        print("  export-parquet <table> <from> <to> <path | s3://prefix> - Parquet period snapshot")
+        print("  storage-usage - Stored documents and their size per owner type")
         sys.exit(1)
 
     command = sys.argv[1].lower()
@@ -191,9 +339,25 @@ async def main():
         success = await list_tables()
         sys.exit(0 if success else 1)
 
+    elif command == "reconcile":
+        success = await reconcile_totals(repair="--repair" in sys.argv[2:])
+        sys.exit(0 if success else 1)
+
+    elif command == "index-advisor":
+        success = index_advisor()
+        sys.exit(0 if success else 1)
+
+    elif command == "export-parquet":
+        success = await export_parquet(sys.argv[2:])
+        sys.exit(0 if success else 1)
+
+    elif command == "storage-usage":
+        success = await storage_usage()
+        sys.exit(0 if success else 1)
+
     else:
         print(f"❌ Unknown command: {command}")
-        print("\nAvailable commands: drop, create, reset, list")
+        print("\nAvailable commands: drop, create, reset, list, reconcile, index-advisor, export-parquet, storage-usage")
         sys.exit(1)
 
 
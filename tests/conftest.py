@@ -0,0 +1,175 @@
+"""
+Stand-ins shared by the tests
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone
+from io import BytesIO
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from app.api.repository.s3_repository import S3Client
+
+LAST_MODIFIED = datetime(2025, 1, 6, 10, 30, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    """Stands in for AsyncSession, returning fixed rows and recording statements"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.commits = 0
+
+    async def exec(self, stmt, params=None):
+        self.statements.append(stmt)
+        return self
+
+    def all(self):
+        return self.rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    async def commit(self):
+        self.commits += 1
+
+
+class LocalS3:
+    """
+    Stands in for the boto3 S3 client: objects and multipart uploads in
+    memory, real URL signing, and every call blocking for delay seconds like
+    a slow network would.
+    """
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.objects = {}
+        self.content_types = {}
+        self.parts = {}
+        self.aborted = []
+        self.signer = None
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        time.sleep(self.delay)
+        self.objects[Key] = Body
+        self.content_types[Key] = ContentType
+
+    def upload_fileobj(self, fileobj, bucket, key):
+        time.sleep(self.delay)
+        self.objects[key] = fileobj.read()
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        self.parts[Key] = []
+        self.content_types[Key] = ContentType
+        return {"UploadId": Key}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[UploadId].append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        assert [part["PartNumber"] for part in MultipartUpload["Parts"]] == list(
+            range(1, len(self.parts[UploadId]) + 1)
+        )
+        self.objects[Key] = b"".join(self.parts.pop(UploadId))
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.parts.pop(UploadId)
+        self.aborted.append(Key)
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {
+            "ContentType": self.content_types.get(Key),
+            "ContentLength": len(self.objects[Key]),
+        }
+
+    def get_object(self, Bucket, Key, Range=None, IfNoneMatch=None, IfModifiedSince=None):
+        time.sleep(self.delay)
+        body = self.objects[Key]
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if IfNoneMatch == etag or (IfModifiedSince and IfModifiedSince >= LAST_MODIFIED):
+            raise self.error(304, {"etag": etag})
+        obj = {"ETag": etag, "LastModified": LAST_MODIFIED}
+        if Range:
+            start, end = (int(n) for n in Range.removeprefix("bytes=").split("-"))
+            if start >= len(body):
+                raise self.error(416, {"content-range": f"bytes */{len(body)}"})
+            end = min(end, len(body) - 1)
+            obj["ContentRange"] = f"bytes {start}-{end}/{len(body)}"
+            body = body[start : end + 1]
+        return {**obj, "Body": BytesIO(body), "ContentLength": len(body)}
+
+    @staticmethod
+    def error(status_code, headers):
+        return ClientError(
+            {
+                "Error": {"Code": str(status_code)},
+                "ResponseMetadata": {"HTTPStatusCode": status_code, "HTTPHeaders": headers},
+            },
+            "GetObject",
+        )
+
+    def delete_object(self, Bucket, Key):
+        time.sleep(self.delay)
+        self.objects.pop(Key, None)
+        self.content_types.pop(Key, None)
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        if self.signer is None:
+            self.signer = boto3.client(
+                "s3",
+                region_name="ap-south-1",
+                aws_access_key_id="AKIDEXAMPLE",
+                aws_secret_access_key="secret",
+            )
+        return self.signer.generate_presigned_url(operation, Params=Params, ExpiresIn=ExpiresIn)
+
+
+class LocalDocuments:
+    """Stands in for DocumentDAO, keeping the live documents by key"""
+
+    def __init__(self):
+        self.documents = {}
+
+    async def get_document_by_key(self, key):
+        return self.documents.get(key)
+
+    async def get_documents_by_sha256(self, sha256):
+        return [
+            document
+            for document in self.documents.values()
+            if document.document_sha256 == sha256
+        ]
+
+    async def record_document(self, document):
+        self.documents[document.document_key] = document
+        return document
+
+    async def delete_document_by_key(self, key, is_commit=True):
+        return self.documents.pop(key, None) is not None
+
+
+@pytest.fixture
+def local_client():
+    """Builds S3Clients on LocalS3, cataloging into LocalDocuments when asked"""
+
+    def build(delay=0, catalog=False):
+        client = S3Client()
+        client.s3 = LocalS3(delay)
+        client.documents = LocalDocuments() if catalog else None
+        client.bucket = "phobos"
+        client.base_url_template = "https://{bucket}.s3.{region}.amazonaws.com"
+        client.region = "ap-south-1"
+        return client
+
+    return build
+
+
+@pytest.fixture
+def recording_session():
+    """Builds RecordingSessions returning the given rows"""
+    return RecordingSession
@@ -0,0 +1,94 @@
+"""
+Tests for appraiser double-booking detection
+"""
+
+import asyncio
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateTable
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.dao.reappraisal_service_dao import ReappraisalServiceDAO
+from app.api.exceptions.reappraisal_service_exception import (
+    AppraiserDoubleBookedAPIException,
+    ReappraisalServiceNotFoundAPIException,
+)
+from app.api.model.reappraisal_service.reappraisal_service_create import (
+    ReappraisalServiceUpdateRequest,
+)
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceTable,
+)
+
+
+class ExclusionViolatingSession:
+    """Stands in for AsyncSession: writes violate the booking constraint"""
+
+    def __init__(self, bookings):
+        self.bookings = bookings
+        self.statements = []
+
+    async def exec(self, stmt):
+        self.statements.append(stmt)
+        if stmt.is_insert or stmt.is_update:
+            raise IntegrityError(
+                "INSERT",
+                {},
+                Exception(
+                    "conflicting key value violates exclusion constraint "
+                    '"ex_reappraisal_service_appraiser_period"'
+                ),
+            )
+        return self
+
+    def all(self):
+        return self.bookings
+
+    async def get(self, model, record_id, options=None):
+        # The service was deleted by the time the violation is reported
+        return None
+
+    def in_transaction(self):
+        return True
+
+    async def rollback(self):
+        pass
+
+
+class TestAppraiserBookings:
+    """Test suite for the appraiser period exclusion constraint"""
+
+    def test_constraint_covers_active_live_services(self):
+        """Test that overlapping periods are excluded per appraiser for active live rows"""
+        ddl = str(CreateTable(ReappraisalServiceTable.__table__).compile(dialect=postgresql.dialect()))
+        assert (
+            "EXCLUDE USING gist (ap_id WITH =, "
+            "int8range(rs_start_epoch, rs_end_epoch, '[]') WITH &&) "
+            "WHERE (deleted_at_epoch = -1 AND rs_status = 'ACTIVE')"
+        ) in ddl
+
+    def test_violation_names_the_conflicting_services(self):
+        """Test that a double booking is reported with the services it overlaps"""
+        session = ExclusionViolatingSession(
+            [ReappraisalServiceTable(reappraisal_service_id="rs-1", rs_start_epoch=10, rs_end_epoch=20)]
+        )
+        service = ReappraisalServiceTable(
+            rs_appraiser_id="3", rs_start_epoch=15, rs_end_epoch=30, rs_charge=100
+        )
+        with pytest.raises(AppraiserDoubleBookedAPIException) as raised:
+            asyncio.run(ReappraisalServiceDAO(session).create_reappraisal_service(service))
+        assert raised.value.status_code == 409
+        assert raised.value.detail["error"]["details"]["conflicting_service_ids"] == ["rs-1"]
+        sql = str(session.statements[-1].compile(dialect=postgresql.dialect()))
+        assert "deleted_at_epoch = -1 AND rs_status = 'ACTIVE'" in sql
+
+    def test_violating_update_of_a_deleted_service_is_not_found(self):
+        """Test that a service deleted before its violation is reported is a 404"""
+        session = ExclusionViolatingSession([])
+        with pytest.raises(ReappraisalServiceNotFoundAPIException) as raised:
+            asyncio.run(
+                ReappraisalServiceDAO(session).update_reappraisal_service(
+                    "rs-1", ReappraisalServiceUpdateRequest.model_construct(rs_start_epoch=15)
+                )
+            )
+        assert raised.value.status_code == 404
@@ -0,0 +1,43 @@
+"""
+Tests for batch request helpers
+"""
+
+from app.api.model.advance.advance_create import (
+    ReappraisalServiceAdvanceCreateRequest,
+    ReappraisalServiceAdvanceCreateResponse,
+)
+from app.api.services.batch.batch import batch_response, validate_batch
+
+SERVICE_ID = "0b9f3f4e-6c1d-4d3a-9f2e-7a5b8c9d0e1f"
+ADVANCE = {
+    "rs_advance_transaction_epoch": 1741019909,
+    "rs_advance_amount": 500,
+    "rs_advance_description": "Travel advance",
+}
+
+
+class TestValidateBatch:
+    """Test suite for per-item batch validation"""
+
+    def test_invalid_items_do_not_fail_the_batch(self):
+        """Test that each item is validated on its own with the path id applied"""
+        valid, failures = validate_batch(
+            [ADVANCE, {**ADVANCE, "rs_advance_amount": "lots"}],
+            ReappraisalServiceAdvanceCreateRequest,
+            reappraisal_service_id=SERVICE_ID,
+        )
+        assert [index for index, _ in valid] == [0]
+        assert valid[0][1].reappraisal_service_id == SERVICE_ID
+        assert failures[1][0]["loc"] == ["rs_advance_amount"]
+
+    def test_response_keeps_request_order(self):
+        """Test that results line up with request indexes, unmatched items as not found"""
+        created = ReappraisalServiceAdvanceCreateRequest.model_validate(
+            {**ADVANCE, "reappraisal_service_id": SERVICE_ID}
+        ).model_dump() | {"rs_advance_id": SERVICE_ID}
+        response = batch_response(
+            3, {0: created}, {1: [{"msg": "bad"}]}, ReappraisalServiceAdvanceCreateResponse
+        )
+        assert [result.ok for result in response.results] == [True, False, False]
+        assert response.results[2].errors[0]["type"] == "not_found"
+        assert (response.succeeded, response.failed) == (1, 2)
@@ -0,0 +1,55 @@
+"""
+Tests for the generic DAO
+"""
+
+import asyncio
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.dao.dao import DAO
+from app.api.model.bank.bank_table import BankTable
+
+
+class TestGetRecordsByIds:
+    """Test suite for multi-id fetches"""
+
+    def test_results_follow_input_order(self, recording_session):
+        """Test that records come back in input order, once per id, missing ids skipped"""
+        session = recording_session(
+            [BankTable(bank_id=2, bank_name="HDFC"), BankTable(bank_id=1, bank_name="SBI")]
+        )
+        dao = DAO[BankTable, int](session, BankTable)
+        banks = asyncio.run(dao.get_records_by_ids(["1", 3, "2", 1, "not-an-id"]))
+        assert [bank.bank_name for bank in banks] == ["SBI", "HDFC"]
+        assert session.statements[0].compile().params["record_ids"] == [1, 3, 2]
+
+    def test_single_any_query_on_live_rows(self, recording_session):
+        """Test that all ids are fetched with one ANY query honouring soft delete"""
+        session = recording_session([])
+        asyncio.run(DAO[BankTable, int](session, BankTable).get_records_by_ids([1, 2]))
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "bank.bk_id = ANY (%(record_ids)s::INTEGER[])" in sql
+        assert "bank.deleted_at_epoch = " in sql
+
+
+class TestPaginate:
+    """Test suite for page/offset pagination"""
+
+    def test_pages_are_ordered_by_sort_key_then_primary_key(self, recording_session):
+        """Test that page mode orders deterministically before LIMIT/OFFSET"""
+        session = recording_session([])
+        dao = DAO[BankTable, int](session, BankTable)
+        asyncio.run(dao.paginate(select(BankTable), 2, 10, include_total=False))
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "ORDER BY bank.created_at_epoch, bank.bk_id" in sql
+        assert sql.index("ORDER BY") < sql.index("LIMIT")
+
+    def test_ranked_pages_break_ties_by_primary_key(self, recording_session):
+        """Test that a search rank order is kept, followed by the primary key"""
+        session = recording_session([])
+        dao = DAO[BankTable, int](session, BankTable)
+        ranked = select(BankTable).order_by(func.length(BankTable.bank_name).desc())
+        asyncio.run(dao.paginate(ranked, 1, 10, include_total=False))
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "ORDER BY length(bank.bk_name) DESC, bank.bk_id" in sql
@@ -0,0 +1,46 @@
+"""
+Tests for the request-scoped batching loader
+"""
+
+import asyncio
+from sqlalchemy.dialects import postgresql
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.model.bank.bank_table import BankTable
+from app.api.services.dataloader.dataloader import DataLoader, RequestLoaders
+
+
+class TestDataLoader:
+    """Test suite for key batching and memoization"""
+
+    def test_keys_of_one_tick_are_loaded_together_once(self):
+        """Test that concurrent loads make one batch call and repeats are memoized"""
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            return {key: key * 10 for key in keys if key != 3}
+
+        async def main():
+            loader = DataLoader(batch_load)
+            values = await loader.load_many([1, 2, 3, 1])
+            again = await loader.load(2)
+            return values, again
+
+        values, again = asyncio.run(main())
+        assert values == [10, 20, None, 10]
+        assert again == 20
+        assert calls == [[1, 2, 3]]
+
+    def test_request_loaders_query_each_table_once(self, recording_session):
+        """Test that string foreign keys are coerced and fetched with one ANY query"""
+        session = recording_session([BankTable(bank_id=1, bank_name="SBI")])
+
+        async def main():
+            loaders = RequestLoaders(session)
+            return await loaders.load_many(BankTable, ["1", "2", "not-an-id"])
+
+        banks = asyncio.run(main())
+        assert [bank.bank_name if bank else None for bank in banks] == ["SBI", None, None]
+        assert len(session.statements) == 1
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "bank.bk_id = ANY (%(record_ids)s::INTEGER[])" in sql
@@ -0,0 +1,123 @@
+"""
+Tests for the document catalog kept by S3Client
+"""
+
+import asyncio
+import hashlib
+from io import BytesIO
+from urllib.parse import parse_qs, urlparse
+from sqlalchemy.dialects import postgresql
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.dao.document_dao import DocumentDAO
+from app.api.model.enum.document_owner_enum import DocumentOwnerEnum
+
+BASE_URL = "https://phobos.s3.ap-south-1.amazonaws.com/"
+PDF = b"%PDF-1.7\n" + b"0" * 1000
+
+
+async def chunks(data):
+    for start in range(0, len(data), 256):
+        yield data[start : start + 256]
+
+
+async def upload(client, data, old_file_url=None):
+    return await client.upload_stream(
+        chunks(data),
+        key_prefix="docs",
+        file_extension="pdf",
+        content_type="application/pdf",
+        old_file_url=old_file_url,
+        owner_type=DocumentOwnerEnum.REAPPRAISAL_SERVICE,
+        owner_id="rs-1",
+    )
+
+
+class TestDocumentCatalog:
+    """Test suite for cataloging uploads in the document table"""
+
+    def test_upload_is_cataloged(self, local_client):
+        """Test that an upload records its key, size, hash, type and owner"""
+        client = local_client(catalog=True)
+        key = asyncio.run(upload(client, PDF)).removeprefix(BASE_URL)
+        document = client.documents.documents[key]
+        assert document.document_size == len(PDF)
+        assert document.document_sha256 == hashlib.sha256(PDF).hexdigest()
+        assert document.document_content_type == "application/pdf"
+        assert document.document_owner_type == DocumentOwnerEnum.REAPPRAISAL_SERVICE
+        assert document.document_owner_id == "rs-1"
+
+    def test_replacing_a_file_forgets_the_old_one(self, local_client):
+        """Test that the replaced file leaves both S3 and the catalog"""
+        client = local_client(catalog=True)
+        old_url = asyncio.run(upload(client, PDF))
+        new_url = asyncio.run(upload(client, PDF + b"1", old_file_url=old_url))
+        assert new_url != old_url
+        assert list(client.s3.objects) == [new_url.removeprefix(BASE_URL)]
+        assert list(client.documents.documents) == [new_url.removeprefix(BASE_URL)]
+
+    def test_duplicate_upload_keeps_the_old_file(self, local_client):
+        """Test that re-uploading the current file's contents keeps its URL"""
+        client = local_client(catalog=True)
+        old_url = asyncio.run(upload(client, PDF))
+        assert asyncio.run(upload(client, PDF, old_file_url=old_url)) == old_url
+        assert list(client.s3.objects) == [old_url.removeprefix(BASE_URL)]
+        assert list(client.documents.documents) == [old_url.removeprefix(BASE_URL)]
+
+    def test_stream_file_serves_the_cataloged_type(self, local_client):
+        """Test that a stored file is served with the type it was uploaded with"""
+        client = local_client(catalog=True)
+        client.s3.objects["docs/scan"] = PDF
+        client.documents.documents["docs/scan"] = type(
+            "Document", (), {"document_content_type": "application/pdf"}
+        )
+        response = asyncio.run(client.stream_file(f"{BASE_URL}docs/scan"))
+        assert response.media_type == "application/pdf"
+
+    def test_other_records_copies_are_not_shared(self, local_client):
+        """Test that the same contents uploaded for two records are stored twice"""
+        client = local_client(catalog=True)
+        first_url = asyncio.run(upload(client, PDF))
+        second_url = asyncio.run(upload(client, PDF, old_file_url=f"{BASE_URL}docs/gone.pdf"))
+        assert second_url != first_url
+        assert len(client.s3.objects) == 2
+        assert len(client.documents.documents) == 2
+
+    def test_presigned_download_serves_the_cataloged_type(self, local_client):
+        """Test that a presigned URL carries the type the file was uploaded with"""
+        client = local_client(catalog=True)
+        client.documents.documents["docs/scan"] = type(
+            "Document", (), {"document_content_type": "application/pdf"}
+        )
+        url = asyncio.run(client.presigned_download_url(f"{BASE_URL}docs/scan"))
+        assert parse_qs(urlparse(url).query)["response-content-type"] == ["application/pdf"]
+
+    def test_bytesio_upload_is_cataloged(self, local_client):
+        """Test that generated files are cataloged by their name's type"""
+        client = local_client(catalog=True)
+        url = asyncio.run(client.upload_bytesio(BytesIO(PDF), "letters", "a.pdf"))
+        document = client.documents.documents["letters/a.pdf"]
+        assert url == f"{BASE_URL}letters/a.pdf"
+        assert client.s3.objects["letters/a.pdf"] == PDF
+        assert document.document_size == len(PDF)
+        assert document.document_content_type == "application/pdf"
+
+
+class TestDocumentDAO:
+    """Test suite for the document catalog queries"""
+
+    def test_storage_usage_is_one_query_over_live_documents(self, recording_session):
+        """Test that storage usage sums live documents per owner type in SQL"""
+        session = recording_session()
+        asyncio.run(DocumentDAO(session).storage_usage())
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "sum(document.doc_size)" in sql
+        assert "document.deleted_at_epoch = " in sql
+        assert "GROUP BY document.doc_owner_type" in sql
+
+    def test_deleting_by_key_soft_deletes(self, recording_session):
+        """Test that forgetting a key marks its live document deleted"""
+        session = recording_session()
+        asyncio.run(DocumentDAO(session).delete_document_by_key("docs/a.pdf"))
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE document SET deleted_at_epoch=")
+        assert session.commits == 1
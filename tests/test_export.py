@@ -0,0 +1,51 @@
+"""
+Tests for the streaming export encoders
+"""
+
+import asyncio
+import csv
+import io
+import json
+from app.api.model.enum.export_format_enum import ExportFormatEnum
+from app.api.model.enum.reappraisal_service_status_enum import ReappraisalServiceStatusEnum
+from app.api.services.export.export import csv_chunks, ndjson_chunks
+
+COLUMNS = ["reappraisal_service_id", "appraiser_name", "rs_status"]
+
+
+async def batches():
+    yield [("a", "John, Jr.", ReappraisalServiceStatusEnum.ACTIVE)]
+    yield [("b", None, ReappraisalServiceStatusEnum.ACTIVE), ("c", "Ann", "ACTIVE")]
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+class TestExportEncoders:
+    """Test suite for the NDJSON and CSV chunk encoders"""
+
+    def test_ndjson_one_chunk_per_batch(self):
+        """Test that each batch becomes one chunk of JSON lines with plain enum values"""
+        chunks = asyncio.run(collect(ndjson_chunks(batches(), COLUMNS)))
+        assert len(chunks) == 2
+        rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        assert rows[0] == {
+            "reappraisal_service_id": "a",
+            "appraiser_name": "John, Jr.",
+            "rs_status": "ACTIVE",
+        }
+        assert [row["appraiser_name"] for row in rows] == ["John, Jr.", None, "Ann"]
+
+    def test_csv_header_then_one_chunk_per_batch(self):
+        """Test that the header is sent first and values are quoted as needed"""
+        chunks = asyncio.run(collect(csv_chunks(batches(), COLUMNS)))
+        assert len(chunks) == 3
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows == [
+            COLUMNS,
+            ["a", "John, Jr.", "ACTIVE"],
+            ["b", "", "ACTIVE"],
+            ["c", "Ann", "ACTIVE"],
+        ]
+        assert ExportFormatEnum("csv") == ExportFormatEnum.CSV
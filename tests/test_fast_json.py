@@ -0,0 +1,70 @@
+"""
+Tests for the fast JSON listing responses
+"""
+
+import json
+from typing import Any
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.model.bank.bank_get import BankGetResponse
+from app.api.model.bank.bank_table import BankTable
+from app.api.model.enum.reappraisal_service_status_enum import ReappraisalServiceStatusEnum
+from app.api.model.reappraisal_service.reappraisal_service_get import (
+    ReappraisalServiceGetResponse,
+)
+from app.api.services.fast_json.fast_json import (
+    FastJSONResponse,
+    fast_list_response,
+    trusted_payload,
+)
+from app.api.services.pagination.pagination import PaginationData, PaginationResponse
+
+
+def bank(bank_id):
+    return BankTable(
+        bank_id=bank_id,
+        bank_name="SBI",
+        bank_code="SBI",
+        bank_head_office_address="Mumbai",
+        bank_contact_email="a@sbi.in",
+        bank_contact_number="1",
+    )
+
+
+class TestFastJSON:
+    """Test suite for trusted payloads and the orjson response"""
+
+    def test_payload_matches_the_validated_model(self):
+        """Test that defaults and computed fields come out as model_dump gives them"""
+        values = BankGetResponse.db_record_fields(bank(7))
+        assert trusted_payload(BankGetResponse, values) == BankGetResponse(
+            **values
+        ).model_dump(mode="json")
+
+    def test_enums_and_defaults_encode_like_the_model(self):
+        """Test that enum values and unset optional relationships render as JSON"""
+        values = dict(
+            reappraisal_service_id="123e4567-e89b-42d3-a456-426614174000",
+            appraiser_name="a",
+            bank_name="b",
+            branch_name="c",
+            start_epoch=1,
+            end_epoch=2,
+            no_of_packets=3,
+            status=ReappraisalServiceStatusEnum.ACTIVE,
+            total_amount=4,
+        )
+        payload = trusted_payload(ReappraisalServiceGetResponse, values)
+        body = json.loads(FastJSONResponse([payload]).body)
+        assert body == [ReappraisalServiceGetResponse(**values).model_dump(mode="json")]
+
+    def test_paginated_listing_keeps_the_envelope(self):
+        """Test that a page keeps its pagination data and cursor"""
+        page = PaginationResponse[Any](
+            items=[bank(1), bank(2)],
+            pagination_data=PaginationData(total_data=2, page=1, size=2, pages=1),
+        )
+        response = fast_list_response(page, BankGetResponse, BankGetResponse.db_record_fields)
+        body = json.loads(response.body)
+        assert [item["bank_id"] for item in body["items"]] == ["BNK-0001", "BNK-0002"]
+        assert body["pagination_data"]["total_data"] == 2
+        assert body["next_cursor"] is None
@@ -0,0 +1,29 @@
+"""
+Tests for the filter index advisor
+"""
+
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.model.bank.bank_table import BankTable
+from app.api.services.index_advisor.index_advisor import advise, supporting_index
+from app.api.services.search_filter.matchtype_enum import MatchTypeEnum
+
+
+class TestIndexAdvisor:
+    """Test suite for the index advisor"""
+
+    def test_controller_filters_are_matched_to_indexes(self):
+        """Test that the reappraisal list filters resolve to their indexes"""
+        advice = {
+            item.path.field: item
+            for item in advise()
+            if item.path.endpoint.endswith(".get_reappraisal_services")
+        }
+        assert advice["rs_appraiser_id"].index == "ix_reappraisal_service_ap_id_rs_status_live"
+        assert advice["rs_start_epoch"].path.match_type == MatchTypeEnum.EPOCH_RANGE
+        assert advice["reappraisal_service_id"].index == "reappraisal_service_pkey"
+
+    def test_partial_filters_need_a_trigram_index(self):
+        """Test that a btree index does not count for ILIKE '%...%' filters"""
+        assert supporting_index(BankTable.bank_name, MatchTypeEnum.PARTIAL) == "ix_bank_name_trgm"
+        assert supporting_index(BankTable.bank_code, MatchTypeEnum.PARTIAL) is None
+        assert supporting_index(BankTable.bank_code, MatchTypeEnum.EXACT) == "ix_bank_bk_code"
@@ -0,0 +1,94 @@
+"""
+Tests for pagination helpers
+"""
+
+import pytest
+from app.api.exceptions.searchfilter_exception import BadRequestException
+from app.api.services.pagination.count_cache import CountCache
+from app.api.services.pagination.pagination import (
+    PaginationResponse,
+    decode_cursor,
+    encode_cursor,
+    map_items,
+)
+
+
+class TestCursor:
+    """Test suite for keyset pagination cursors"""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes back to the encoded sort key and id"""
+        cursor = encode_cursor(1741019909, "123e4567-e89b-12d3-a456-426614174000")
+        assert decode_cursor(cursor) == (1741019909, "123e4567-e89b-12d3-a456-426614174000")
+
+    def test_cursor_is_url_safe(self):
+        """Test that cursors can be passed as query parameters unescaped"""
+        cursor = encode_cursor(1741019909, 42)
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_invalid_cursor_fails(self):
+        """Test that a tampered cursor returns 400"""
+        with pytest.raises(BadRequestException) as exc:
+            decode_cursor("not-a-cursor")
+        assert exc.value.status_code == 400
+
+
+class TestMapItems:
+    """Test suite for mapping listing results"""
+
+    def test_map_list(self):
+        """Test mapping a plain list"""
+        assert map_items([1, 2], str) == ["1", "2"]
+
+    def test_map_pagination_response_keeps_cursor(self):
+        """Test that pagination metadata survives mapping"""
+        page = PaginationResponse[int](items=[1, 2], next_cursor="abc")
+        mapped = map_items(page, str)
+        assert mapped.items == ["1", "2"]
+        assert mapped.next_cursor == "abc"
+
+
+class TestCountCache:
+    """Test suite for the paginated listing count cache"""
+
+    def test_hit_after_set(self):
+        """Test that a stored count is returned for the same fingerprint"""
+        cache = CountCache()
+        cache.set("key", 42, {"bank"})
+        assert cache.get("key") == 42
+
+    def test_invalidate_by_table(self):
+        """Test that a write to any table read by the count drops it"""
+        cache = CountCache()
+        cache.set("joined", 10, {"reappraisal_service", "bank"})
+        cache.set("other", 3, {"branch"})
+        cache.invalidate("bank")
+        assert cache.get("joined") is None
+        assert cache.get("other") == 3
+
+    def test_expired_entry_is_miss(self):
+        """Test that entries older than the TTL are not served"""
+        cache = CountCache(ttl_seconds=-1)
+        cache.set("key", 42, {"bank"})
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used count is evicted first"""
+        cache = CountCache(max_entries=2)
+        cache.set("a", 1, {"bank"})
+        cache.set("b", 2, {"bank"})
+        cache.get("a")
+        cache.set("c", 3, {"bank"})
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_evicted_counts_leave_the_table_index(self):
+        """Test that expired and evicted counts are not kept for invalidation"""
+        cache = CountCache(max_entries=1)
+        cache.set("a", 1, {"bank"})
+        cache.set("b", 2, {"branch"})
+        assert cache._keys_by_table == {"branch": {"b"}}
+        expired = CountCache(ttl_seconds=-1)
+        expired.set("a", 1, {"bank"})
+        expired.get("a")
+        assert expired._keys_by_table == {}
@@ -0,0 +1,89 @@
+"""
+Tests for presigned direct uploads and downloads
+"""
+
+import asyncio
+from urllib.parse import parse_qs, urlparse
+import pytest
+from app.api.exceptions.reimbursment_exception import (
+    FileNotFoundAPIException,
+    FileTooLargeAPIException,
+    FileTypeNotAllowedAPIException,
+)
+from app.api.model.general.presigned_file import PresignedUploadRequest
+from app.api.services.S3_service.presigned_upload import (
+    finalize_presigned_upload,
+    presigned_upload,
+)
+
+PREFIX = "7/reappraisal/rs-1/completion_certificates"
+BASE_URL = "https://phobos.s3.ap-south-1.amazonaws.com/"
+
+
+def put(client, key, body, content_type="application/pdf"):
+    client.s3.put_object(Bucket=client.bucket, Key=key, Body=body, ContentType=content_type)
+
+
+class TestPresignedUpload:
+    """Test suite for presigned URLs and finalizing direct uploads"""
+
+    def test_upload_url_is_signed_for_the_content_type(self, local_client):
+        """Test that the PUT URL targets a new key under the prefix and signs its content type"""
+        client = local_client()
+        payload = PresignedUploadRequest(filename="cert.pdf", content_type="application/pdf")
+        response = asyncio.run(presigned_upload(client, PREFIX, payload))
+        assert response.key.startswith(f"{PREFIX}/") and response.key.endswith(".pdf")
+        assert urlparse(response.upload_url).path == f"/{response.key}"
+        assert "content-type" in parse_qs(urlparse(response.upload_url).query)["X-Amz-SignedHeaders"][0]
+        assert response.headers == {"Content-Type": "application/pdf"}
+
+    def test_upload_url_is_refused_for_disallowed_types(self, local_client):
+        """Test that no URL is issued for an unsupported content type"""
+        payload = PresignedUploadRequest(filename="a.txt", content_type="text/plain")
+        with pytest.raises(FileTypeNotAllowedAPIException):
+            asyncio.run(presigned_upload(local_client(), PREFIX, payload))
+
+    def test_finalize_replaces_the_old_file(self, local_client):
+        """Test that a valid upload is recorded and the previous file deleted"""
+        client = local_client()
+        put(client, f"{PREFIX}/new.pdf", b"%PDF-1.7 ...")
+        put(client, f"{PREFIX}/old.pdf", b"%PDF-1.4 ...")
+        file_url = asyncio.run(
+            finalize_presigned_upload(
+                client, PREFIX, f"{PREFIX}/new.pdf", old_file_url=f"{BASE_URL}{PREFIX}/old.pdf"
+            )
+        )
+        assert file_url == f"{BASE_URL}{PREFIX}/new.pdf"
+        assert list(client.s3.objects) == [f"{PREFIX}/new.pdf"]
+
+    def test_finalize_deletes_invalid_uploads(self, local_client):
+        """Test that an upload failing validation is deleted from S3"""
+        client = local_client()
+        put(client, f"{PREFIX}/fake.png", b"%PDF-1.7 ...", "image/png")
+        put(client, f"{PREFIX}/big.pdf", b"%PDF-" + b"0" * 6 * 1024 * 1024)
+        with pytest.raises(FileTypeNotAllowedAPIException):
+            asyncio.run(finalize_presigned_upload(client, PREFIX, f"{PREFIX}/fake.png"))
+        with pytest.raises(FileTooLargeAPIException):
+            asyncio.run(finalize_presigned_upload(client, PREFIX, f"{PREFIX}/big.pdf"))
+        assert client.s3.objects == {}
+
+    def test_finalize_only_accepts_keys_under_the_prefix(self, local_client):
+        """Test that a key belonging to another record or never uploaded is not found"""
+        client = local_client()
+        other = "9/reappraisal/rs-2/completion_certificates/cert.pdf"
+        put(client, other, b"%PDF-1.7 ...")
+        for key in (other, f"{PREFIX}/missing.pdf", f"{PREFIX}/../x/cert.pdf"):
+            with pytest.raises(FileNotFoundAPIException):
+                asyncio.run(finalize_presigned_upload(client, PREFIX, key))
+        assert other in client.s3.objects
+
+    def test_download_url_keeps_the_streamed_headers(self, local_client):
+        """Test that the GET URL serves the file with its type and disposition"""
+        client = local_client()
+        url = asyncio.run(
+            client.presigned_download_url(f"{BASE_URL}{PREFIX}/cert.pdf", download=True)
+        )
+        query = parse_qs(urlparse(url).query)
+        assert urlparse(url).path == f"/{PREFIX}/cert.pdf"
+        assert query["response-content-type"] == ["application/pdf"]
+        assert query["response-content-disposition"] == ["attachment; filename=cert.pdf"]
@@ -0,0 +1,53 @@
+"""
+Tests for the bank/branch reference cache
+"""
+
+import asyncio
+from app.api.services.reference_cache.reference_cache import (
+    MISSING,
+    InMemoryBackend,
+    ReferenceCache,
+)
+
+
+class TestReferenceCache:
+    """Test suite for the TTL + LRU reference cache"""
+
+    def test_ids_share_one_entry_whatever_their_type(self):
+        """Test that a string id hits the entry stored under the integer id"""
+        cache = ReferenceCache(InMemoryBackend())
+        cache.set("bank", 1, "SBI")
+        assert cache.get("bank", "1") == "SBI"
+        cache.invalidate("bank", "1")
+        assert cache.get("bank", 1) is MISSING
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction_and_ttl(self):
+        """Test that entries are evicted least recently used first and expire"""
+        cache = ReferenceCache(InMemoryBackend(max_entries=2))
+        cache.set("branch", 1, "a")
+        cache.set("branch", 2, "b")
+        cache.get("branch", 1)
+        cache.set("branch", 3, "c")
+        assert cache.get("branch", 2) is MISSING
+        assert cache.stats()["evictions"] == 1
+
+        expired = ReferenceCache(InMemoryBackend(ttl_seconds=-1))
+        expired.set("branch", 1, "a")
+        assert expired.get("branch", 1) is MISSING
+
+    def test_get_many_loads_only_the_misses_together(self):
+        """Test that uncached ids are loaded in one call and results keep input order"""
+        cache = ReferenceCache(InMemoryBackend())
+        cache.set("bank", 2, "HDFC")
+        calls = []
+
+        async def load(missing_ids):
+            calls.append(missing_ids)
+            return {1: "SBI"}
+
+        banks = asyncio.run(cache.get_many("bank", [1, "2", 3, 1], load))
+        assert banks == ["SBI", "HDFC"]
+        assert calls == [["1", "3"]]
+        assert cache.get("bank", "1") == "SBI"
@@ -0,0 +1,109 @@
+"""
+Tests for the non-blocking S3 client
+"""
+
+import asyncio
+import time
+from io import BytesIO
+
+
+class TestS3Client:
+    """Test suite for S3 calls running off the event loop"""
+
+    def test_other_requests_run_during_uploads(self, local_client):
+        """Test that the event loop keeps serving while slow uploads are in flight"""
+
+        async def scenario():
+            client = local_client(delay=0.5)
+            uploads = [
+                asyncio.create_task(
+                    client.upload_bytesio(BytesIO(b"x" * 5_000_000), "docs", f"{n}.pdf")
+                )
+                for n in range(3)
+            ]
+            started = time.perf_counter()
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+            other_requests = time.perf_counter() - started
+            in_flight = not any(upload.done() for upload in uploads)
+            urls = await asyncio.gather(*uploads)
+            return other_requests, in_flight, urls, client.s3.objects
+
+        other_requests, in_flight, urls, objects = asyncio.run(scenario())
+        assert in_flight
+        assert other_requests < 0.3
+        assert urls[0] == "https://phobos.s3.ap-south-1.amazonaws.com/docs/0.pdf"
+        assert len(objects["docs/2.pdf"]) == 5_000_000
+
+    def test_stream_file_reads_the_body_in_chunks(self, local_client):
+        """Test that a streamed file arrives whole and its body is closed"""
+
+        async def scenario():
+            client = local_client()
+            client.s3.objects["docs/a.pdf"] = b"%PDF" + b"0" * 200_000
+            response = await client.stream_file(
+                "https://phobos.s3.ap-south-1.amazonaws.com/docs/a.pdf", download=True
+            )
+            chunks = [chunk async for chunk in response.body_iterator]
+            return response, chunks
+
+        response, chunks = asyncio.run(scenario())
+        assert len(chunks) > 1
+        assert b"".join(chunks).startswith(b"%PDF")
+        assert len(b"".join(chunks)) == 200_004
+        assert response.headers["content-disposition"] == "attachment; filename=a.pdf"
+
+    def test_stream_file_sends_caching_headers(self, local_client):
+        """Test that a full fetch carries the length, ETag and cache headers"""
+        client = local_client()
+        client.s3.objects["docs/a.pdf"] = b"%PDF" + b"0" * 1000
+        response = asyncio.run(
+            client.stream_file("https://phobos.s3.ap-south-1.amazonaws.com/docs/a.pdf")
+        )
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "1004"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["last-modified"] == "Mon, 06 Jan 2025 10:30:00 GMT"
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_stream_file_serves_byte_ranges(self, local_client):
+        """Test that a Range request is answered with 206 and only that range"""
+
+        async def scenario():
+            client = local_client()
+            client.s3.objects["docs/a.pdf"] = b"%PDF" + b"0" * 1000
+            url = "https://phobos.s3.ap-south-1.amazonaws.com/docs/a.pdf"
+            response = await client.stream_file(url, range_header="bytes=0-3")
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            outside = await client.stream_file(url, range_header="bytes=5000-5001")
+            return response, body, outside
+
+        response, body, outside = asyncio.run(scenario())
+        assert response.status_code == 206
+        assert body == b"%PDF"
+        assert response.headers["content-range"] == "bytes 0-3/1004"
+        assert response.headers["content-length"] == "4"
+        assert outside.status_code == 416
+        assert outside.headers["content-range"] == "bytes */1004"
+
+    def test_stream_file_answers_conditional_requests(self, local_client):
+        """Test that an unchanged file is answered with 304 and no body"""
+
+        async def scenario():
+            client = local_client()
+            client.s3.objects["docs/a.pdf"] = b"%PDF" + b"0" * 1000
+            url = "https://phobos.s3.ap-south-1.amazonaws.com/docs/a.pdf"
+            first = await client.stream_file(url)
+            by_etag = await client.stream_file(url, if_none_match=first.headers["etag"])
+            by_date = await client.stream_file(
+                url, if_modified_since=first.headers["last-modified"]
+            )
+            bad_date = await client.stream_file(url, if_modified_since="yesterday")
+            return first, by_etag, by_date, bad_date
+
+        first, by_etag, by_date, bad_date = asyncio.run(scenario())
+        assert by_etag.status_code == 304 and by_etag.body == b""
+        assert by_etag.headers["etag"] == first.headers["etag"]
+        assert by_date.status_code == 304
+        assert bad_date.status_code == 200
@@ -0,0 +1,122 @@
+"""
+Tests for the generic search filter
+"""
+
+import asyncio
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.model.bank.bank_table import BankTable
+from app.api.model.branch.branch_table import BranchTable
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceTable,
+)
+from app.api.services.search_filter.searchfilter import (
+    DAOFilterSearchParam,
+    field_resolution,
+    projection_statement,
+)
+from app.api.services.search_filter.statement_cache import StatementCache
+
+
+def compile_pg(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestFieldResolution:
+    """Test suite for the per-model filter field table"""
+
+    def test_own_columns_take_precedence(self):
+        """Test that a model's own columns are never routed through a join"""
+        fields = field_resolution(ReappraisalServiceTable)
+        assert fields["created_at_epoch"].relationship is None
+        assert fields["bank_name"].relationship == "bank"
+
+    def test_trigram_indexed_names_rank_by_similarity(self):
+        """Test that ranked PARTIAL searches on trigram-indexed names order by similarity"""
+        assert field_resolution(BranchTable)["bank_name"].trigram
+        assert not field_resolution(BranchTable)["branch_sol_id"].trigram
+        search = DAOFilterSearchParam(
+            BranchTable, "bank_name", "PARTIAL", "sb", select(BranchTable), None, "name", rank=True
+        )
+        stmt, condition = asyncio.run(search.generic_filter())
+        sql = compile_pg(stmt.where(condition).order_by(search.rank_expression.desc()))
+        assert "ILIKE %(name)s" in sql
+        assert "ORDER BY word_similarity(%(name_rank)s, branch_bank.bk_name) DESC" in sql
+
+    def test_related_filters_reuse_one_join(self):
+        """Test that two filters on the same relationship join it once"""
+        joined_rels = set()
+        stmt = select(ReappraisalServiceTable)
+        for field in ("bank_name", "bank_code"):
+            stmt, _ = asyncio.run(
+                DAOFilterSearchParam(
+                    ReappraisalServiceTable, field, "EXACT", "SBI", stmt, joined_rels, field
+                ).generic_filter()
+            )
+        assert compile_pg(stmt).count("JOIN") == 1
+
+
+class TestProjection:
+    """Test suite for projection-only listings"""
+
+    def test_projection_selects_labelled_columns(self):
+        """Test that related fields are outer joined and no entity is selected"""
+        joined_rels = set()
+        stmt = projection_statement(BranchTable, ("branch_id", "bank_name"), joined_rels)
+        sql = compile_pg(stmt)
+        assert joined_rels == {"bank"}
+        assert "LEFT OUTER JOIN bank AS branch_bank" in sql
+        assert [desc["name"] for desc in stmt.column_descriptions] == ["branch_id", "bank_name"]
+
+    def test_related_filter_reuses_projection_join(self):
+        """Test that filtering on a projected relationship adds no second join"""
+        joined_rels = set()
+        stmt = projection_statement(BranchTable, ("branch_id", "bank_name"), joined_rels)
+        stmt, _ = asyncio.run(
+            DAOFilterSearchParam(
+                BranchTable, "bank_code", "EXACT", "SBI", stmt, joined_rels, "code"
+            ).generic_filter()
+        )
+        assert compile_pg(stmt).count("JOIN") == 1
+
+
+class TestStatementTemplates:
+    """Test suite for cached filter statement templates"""
+
+    def test_list_filter_uses_any(self):
+        """Test that list filters render the same SQL whatever their length"""
+        stmt, condition = asyncio.run(
+            DAOFilterSearchParam(
+                BankTable, "bank_id", "EXACT", [1, 2, 3], select(BankTable), None, "ids"
+            ).generic_filter()
+        )
+        assert "= ANY (%(ids)s::INTEGER[])" in compile_pg(stmt.where(condition))
+
+    def test_epoch_range_uses_range_operators(self):
+        """Test that a date matches by containment and a window by overlap"""
+        for value, operator in ((150, "@> CAST(%(d)s AS BIGINT)"), ([100, 300], "&& int8range(")):
+            stmt, condition = asyncio.run(
+                DAOFilterSearchParam.epoch_date(
+                    select(ReappraisalServiceTable),
+                    ReappraisalServiceTable,
+                    value,
+                    "rs_start_epoch",
+                    "rs_end_epoch",
+                    set(),
+                    "d",
+                )
+            )
+            sql = compile_pg(stmt.where(condition))
+            assert "int8range(reappraisal_service.rs_start_epoch, " in sql
+            assert operator in sql
+
+    def test_lru_eviction(self):
+        """Test that the least recently used template is evicted first"""
+        cache = StatementCache(max_entries=2)
+        cache.set("a", select(BankTable))
+        cache.set("b", select(BankTable))
+        cache.get("a")
+        cache.set("c", select(BankTable))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
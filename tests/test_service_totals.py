@@ -0,0 +1,157 @@
+"""
+Tests for the totals maintained on reappraisal_service
+"""
+
+import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
+from sqlalchemy import Insert, Select, Update, update
+from sqlalchemy.dialects import postgresql
+from app.api.server.app import app  # noqa: F401  (maps every model)
+from app.api.dao.dao import DAO
+from app.api.dao.reimbursement_dao import ReappraisalServiceReimbursementDAO
+from app.api.dao.reappraisal_service_dao import _computed_totals
+from app.api.model.reappraisal_service.reappraisal_service_table import (
+    ReappraisalServiceTable,
+)
+from app.api.model.reimbursement.reimbursement_table import (
+    ReappraisalServiceReimbursementTable,
+)
+
+
+class ReadCommittedDatabase:
+    """
+    Reimbursement amounts and stored totals of services as Postgres keeps
+    them under READ COMMITTED: each statement reads the rows committed when
+    it starts, and writing a service row waits for its row lock.
+    """
+
+    def __init__(self):
+        self.reimbursements = defaultdict(list)
+        self.totals = defaultdict(int)
+        self.locks = defaultdict(asyncio.Lock)
+
+
+class ReadCommittedSession:
+    """Stands in for AsyncSession on a ReadCommittedDatabase, one transaction at a time"""
+
+    def __init__(self, database):
+        self.database = database
+        self.held = set()
+        self.inserted = defaultdict(list)
+        self.totals = {}
+
+    async def _lock(self, service_ids):
+        for service_id in sorted(set(service_ids) - self.held):
+            await self.database.locks[service_id].acquire()
+            self.held.add(service_id)
+
+    @staticmethod
+    def _ids(stmt):
+        return next(
+            value for value in stmt.compile().params.values() if isinstance(value, list)
+        )
+
+    async def exec(self, stmt, params=None):
+        # Let the other transaction run a statement in between
+        await asyncio.sleep(0)
+        if isinstance(stmt, Select) and stmt._for_update_arg is not None:
+            await self._lock(self._ids(stmt))
+        elif isinstance(stmt, Insert):
+            values = stmt.compile().params
+            self.inserted[values["rs_id"]].append(values["rsr_amount"])
+            return SimpleNamespace(
+                scalars=lambda: SimpleNamespace(
+                    one=lambda: SimpleNamespace(rs_reappraisal_service_id=values["rs_id"])
+                )
+            )
+        elif isinstance(stmt, Update):
+            service_ids = self._ids(stmt)
+            # The sums are read from the snapshot taken when the statement starts
+            sums = {
+                service_id: sum(self.database.reimbursements[service_id])
+                + sum(self.inserted[service_id])
+                for service_id in service_ids
+            }
+            await self._lock(service_ids)
+            self.totals.update(sums)
+
+    async def commit(self):
+        await asyncio.sleep(0)
+        for service_id, amounts in self.inserted.items():
+            self.database.reimbursements[service_id].extend(amounts)
+        self.database.totals.update(self.totals)
+        for service_id in self.held:
+            self.database.locks[service_id].release()
+        self.held, self.inserted, self.totals = set(), defaultdict(list), {}
+
+
+class TestServiceTotals:
+    """Test suite for the stored reimbursement and advance totals"""
+
+    def test_generated_total_is_never_inserted(self):
+        """Test that the database-generated total is left out of inserts"""
+        dao = DAO[ReappraisalServiceTable, str](None, ReappraisalServiceTable)
+        values = dao._insert_values(ReappraisalServiceTable(rs_charge=100))
+        assert "rs_total_amount" not in values
+        assert values["rs_reimbursement_total"] == 0
+
+    def test_refresh_sums_live_rows_of_each_service(self):
+        """Test that the refreshed totals are correlated to the updated service"""
+        reimbursement_total, _ = _computed_totals()
+        stmt = update(ReappraisalServiceTable).values(
+            rs_reimbursement_total=reimbursement_total
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "reappraisal_service_reimbursement.rs_id = reappraisal_service.rs_id" in sql
+        assert "reappraisal_service_reimbursement.deleted_at_epoch = " in sql
+
+    def test_concurrent_child_writes_keep_the_total(self):
+        """Test that two reimbursements created at once on one service are both counted"""
+        database = ReadCommittedDatabase()
+
+        async def create(amount):
+            dao = ReappraisalServiceReimbursementDAO(ReadCommittedSession(database))
+            await dao.create_rs_reimbursement(
+                ReappraisalServiceReimbursementTable(
+                    rs_reappraisal_service_id="rs-1",
+                    rs_reimbursement_transaction_epoch=1,
+                    rs_reimbursement_category="FOOD",
+                    rs_reimbursement_details="Lunch",
+                    rs_reimbursement_amount=amount,
+                )
+            )
+
+        async def scenario():
+            await asyncio.gather(create(100), create(250))
+
+        asyncio.run(scenario())
+        assert sorted(database.reimbursements["rs-1"]) == [100, 250]
+        assert database.totals["rs-1"] == 350
+
+    def test_writers_lock_the_service_before_writing(self):
+        """Test that the service row is locked FOR UPDATE ahead of the child insert"""
+        session = ReadCommittedSession(ReadCommittedDatabase())
+        statements = []
+        exec_statement = session.exec
+
+        async def recording_exec(stmt, params=None):
+            statements.append(stmt)
+            return await exec_statement(stmt, params)
+
+        session.exec = recording_exec
+        asyncio.run(
+            ReappraisalServiceReimbursementDAO(session).create_rs_reimbursement(
+                ReappraisalServiceReimbursementTable(
+                    rs_reappraisal_service_id="rs-1",
+                    rs_reimbursement_transaction_epoch=1,
+                    rs_reimbursement_category="FOOD",
+                    rs_reimbursement_details="Lunch",
+                    rs_reimbursement_amount=100,
+                )
+            )
+        )
+        lock = str(statements[0].compile(dialect=postgresql.dialect()))
+        assert lock.endswith("FOR UPDATE")
+        assert "FROM reappraisal_service" in lock
+        assert isinstance(statements[1], Insert)
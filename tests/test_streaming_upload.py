@@ -0,0 +1,101 @@
+"""
+Tests for streaming multipart uploads to S3
+"""
+
+import asyncio
+import pytest
+from app.api.exceptions.reimbursment_exception import (
+    FileMissingAPIException,
+    FileTooLargeAPIException,
+    FileTypeNotAllowedAPIException,
+)
+from app.api.repository import s3_repository
+from app.api.services.S3_service.streaming_upload import MultipartFileStream
+
+BOUNDARY = "phobos-boundary"
+BASE_URL = "https://phobos.s3.ap-south-1.amazonaws.com/"
+PDF = b"%PDF-1.7\n" + b"0" * 40_000
+
+
+class MultipartRequest:
+    """A request whose multipart body arrives in small chunks"""
+
+    def __init__(self, field, filename, content_type, content, chunk_size=1000):
+        self.headers = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+        self.body = (
+            f"--{BOUNDARY}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode() + content + f"\r\n--{BOUNDARY}--\r\n".encode()
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    async def stream(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_read += 1
+            yield self.body[start : start + self.chunk_size]
+
+
+async def upload(client, request, field="proof_file", max_size_mb=5):
+    stream = await MultipartFileStream(request, field, max_size_mb).open()
+    return await client.upload_stream(
+        stream.chunks(),
+        key_prefix="docs",
+        file_extension=stream.file_extension,
+        content_type=stream.content_type,
+    )
+
+
+class TestStreamingUpload:
+    """Test suite for multipart bodies streamed to S3 in parts"""
+
+    def test_small_file_is_put_in_one_request(self, local_client):
+        """Test that a file smaller than a part goes up with put_object"""
+        client = local_client()
+        request = MultipartRequest("proof_file", "a.pdf", "application/pdf", PDF)
+        key = asyncio.run(upload(client, request)).removeprefix(BASE_URL)
+        assert key.startswith("docs/") and key.endswith(".pdf")
+        assert client.s3.objects[key] == PDF
+
+    def test_large_file_is_uploaded_in_parts(self, monkeypatch, local_client):
+        """Test that a file longer than a part is sent as a multipart upload"""
+        monkeypatch.setattr(s3_repository, "S3_UPLOAD_PART_SIZE", 16_384)
+        client = local_client()
+        request = MultipartRequest("proof_file", "a.pdf", "application/pdf", PDF)
+        key = asyncio.run(upload(client, request)).removeprefix(BASE_URL)
+        assert client.s3.objects[key] == PDF
+        assert client.s3.parts == {}
+
+    def test_oversized_file_aborts_the_upload(self, monkeypatch, local_client):
+        """Test that the upload is aborted as soon as the size limit is passed"""
+        monkeypatch.setattr(s3_repository, "S3_UPLOAD_PART_SIZE", 16_384)
+        client = local_client()
+        request = MultipartRequest(
+            "proof_file", "a.pdf", "application/pdf", b"%PDF-" + b"0" * 3_000_000
+        )
+        with pytest.raises(FileTooLargeAPIException):
+            asyncio.run(upload(client, request, max_size_mb=1))
+        assert len(client.s3.aborted) == 1
+        assert client.s3.objects == {} and client.s3.parts == {}
+        assert request.chunks_read < len(request.body) // request.chunk_size
+
+    def test_file_not_matching_its_type_is_rejected(self, local_client):
+        """Test that a file whose bytes do not match its content type is rejected"""
+        client = local_client()
+        request = MultipartRequest("proof_file", "a.png", "image/png", PDF)
+        with pytest.raises(FileTypeNotAllowedAPIException):
+            asyncio.run(upload(client, request))
+        assert client.s3.objects == {}
+
+    def test_disallowed_type_is_rejected_before_uploading(self):
+        """Test that an unsupported content type is rejected when the part opens"""
+        request = MultipartRequest("proof_file", "a.txt", "text/plain", b"hello")
+        with pytest.raises(FileTypeNotAllowedAPIException):
+            asyncio.run(MultipartFileStream(request, "proof_file").open())
+
+    def test_missing_field_is_reported(self):
+        """Test that a body without the expected file field is a 400"""
+        request = MultipartRequest("other_file", "a.pdf", "application/pdf", PDF)
+        with pytest.raises(FileMissingAPIException) as raised:
+            asyncio.run(MultipartFileStream(request, "proof_file").open())
+        assert raised.value.status_code == 400